@@ -0,0 +1,87 @@
+# Python Imports
+import gc
+import os
+import pickle
+from time import perf_counter
+from typing import Sequence, Tuple
+
+# Modules
+from matplotlib import pyplot as plt
+
+# Module imports
+from gentasks.task_generator import *
+from gentasks.task_generator import _build_shard, _merge_runs, _rows
+from memory import _synthetic_tasks
+
+
+def _build_seconds(amount: int, workers: int) -> float:
+    tasks = tuple(_synthetic_tasks(amount))
+    PrecheckExerciseGenerator.build_workers = workers
+    start = perf_counter()
+    try:
+        PrecheckExerciseGenerator(tasks)
+    finally:
+        PrecheckExerciseGenerator.build_workers = 1
+        PrecheckExerciseGenerator._instances.pop(tasks, None)
+    return perf_counter() - start
+
+
+def _critical_path(amount: int, workers: int) -> Tuple[float, float]:
+    """Returns seconds of slowest shard and of parent merge in parallel
+    build. Shards run one by one, so result doesn't depend on amount
+    of CPUs of machine, that runs benchmark
+    """
+    tasks = tuple(_synthetic_tasks(amount))
+    complexity = tuple(task.complexity for task in tasks)
+    total = 2 ** amount - 1
+    bounds = [total * i // workers for i in range(workers + 1)]
+
+    runs = []
+    slowest = 0.0
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        started = perf_counter()
+        runs.append(pickle.dumps(_build_shard(complexity, start, stop)))
+        slowest = max(slowest, perf_counter() - started)
+
+    started = perf_counter()
+    values, masks = _merge_runs([pickle.loads(run) for run in runs])
+    gc.disable()
+    try:
+        _rows(tasks, masks)
+        tuple(values.tolist())
+    finally:
+        gc.enable()
+    return slowest, perf_counter() - started
+
+
+def generator_build(
+        amounts: Sequence[int] = range(14, 21),
+        workers: Sequence[int] = (1, 2, 4, 8, 16, 32)
+) -> None:
+    """Compares serial build with critical path of parallel build
+    (slowest shard and merge of sorted runs) by amount of workers.
+    Wall time is also shown, it falls only on machine with enough CPUs
+    """
+    print(f"{'tasks':>6}{'workers':>8}{'serial s':>10}{'shard s':>10}"
+          f"{'merge s':>10}{'path s':>10}{'speedup':>9}{'wall s':>10}")
+    cpus = os.cpu_count() or 1
+    for amount in amounts:
+        serial = _build_seconds(amount, 1)
+        y = []
+        for w in workers:
+            shard, merge = _critical_path(amount, w)
+            y.append(shard + merge)
+            wall = _build_seconds(amount, w) if w <= cpus else float('nan')
+            print(f"{amount:>6}{w:>8}{serial:>10.3f}{shard:>10.3f}"
+                  f"{merge:>10.3f}{shard + merge:>10.3f}"
+                  f"{serial / (shard + merge):>9.2f}{wall:>10.3f}")
+        plt.plot(workers, y, label=f'{amount} tasks')
+
+    plt.xlabel('Amount of workers')
+    plt.ylabel('Critical path of build (s)')
+    plt.xscale('log', base=2)
+    plt.yscale('log')
+    plt.title('Parallel generator table build')
+    plt.grid(True)
+    plt.legend()
+    plt.show()
@@ -0,0 +1,95 @@
+# Python Imports
+import gc
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Callable, Dict, List, Tuple, Type
+
+# Modules
+from matplotlib import pyplot as plt
+
+# Module imports
+from gentasks.task_generator import *
+from gentasks.tasktypes import GeneratorDefaultTask, GeneratorTaskMeta
+
+
+def _synthetic_tasks(amount: int) -> List[Type[GeneratorDefaultTask]]:
+    """Creates unregistered task types with distinct complexity"""
+    return [
+        GeneratorTaskMeta(
+            f'Synthetic{i}', (GeneratorDefaultTask,),
+            {'__slots__': (), 'complexity': i + 1}, register=False
+        )
+        for i in range(amount)
+    ]
+
+
+def _table(gen: PrecheckExerciseGenerator) -> None:
+    pass
+
+
+def _amount_index(gen: PrecheckExerciseGenerator) -> None:
+    gen.get_tasks_amount(1)
+
+
+def _batch_arrays(gen: PrecheckExerciseGenerator) -> None:
+    gen.batch_table()
+
+
+BACKENDS: Dict[str, Callable[[PrecheckExerciseGenerator], None]] = {
+    'table': _table,
+    'table + amount index': _amount_index,
+    'table + numpy arrays': _batch_arrays,
+}
+"""Generator configurations, compared by memory"""
+
+
+def _measure(amount: int, backend: str) -> Tuple[int, int, GeneratorStats]:
+    """Returns traced peak and retained bytes of building generator.
+    Runs in fresh process: in warmed up interpreter freed objects are
+    reused from free lists, that tracemalloc doesn't see
+    """
+    tasks = _synthetic_tasks(amount)
+    prepare = BACKENDS[backend]
+    if prepare is _batch_arrays:
+        # Import isn't memory of generator
+        import numpy
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        gen = PrecheckExerciseGenerator(tasks)
+        prepare(gen)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, current, gen.stats()
+
+
+def generator_memory(max_tasks: int = 16) -> None:
+    x = list(range(4, max_tasks + 1))
+    print(f"{'backend':<22}{'tasks':>6}{'entries':>9}{'peak':>12}"
+          f"{'retained':>12}{'stats()':>12}{'build s':>10}")
+    for name in BACKENDS:
+        y = []
+        for amount in x:
+            with ProcessPoolExecutor(1, get_context('spawn')) as executor:
+                try:
+                    peak, current, stats = executor.submit(
+                        _measure, amount, name
+                    ).result()
+                except ImportError:
+                    break
+            y.append(current / 2 ** 20)
+            print(f"{name:<22}{amount:>6}{stats.entries:>9}{peak:>12}"
+                  f"{current:>12}{stats.bytes:>12}"
+                  f"{stats.build_seconds:>10.4f}")
+        plt.plot(x[:len(y)], y, label=name)
+
+    plt.xlabel('Amount of task types')
+    plt.ylabel('Retained memory (MiB)')
+    plt.yscale('log')
+    plt.title('Generator memory')
+    plt.grid(True)
+    plt.legend()
+    plt.show()
@@ -2,3 +2,23 @@ from . import exceptions
 from . import tasktypes
 from . import exercise
 from . import task_generator
+from . import coverage
+from . import efficiency
+from . import failure_statistics
+from . import report
+from . import identifiers
+from . import verdict_cache
+from . import validation
+from . import loader
+from . import threaded
+from . import async_tasktypes
+from . import async_exercise
+from . import plugins
+from . import sampling
+from . import cohort
+from . import scheduler
+from . import metrics
+from . import fuzzing
+from . import grading
+
+plugins.load_plugins()
@@ -0,0 +1,69 @@
+# Python Imports
+import argparse
+import sys
+from typing import List, Optional
+
+# Module Imports
+from .coverage import Coverage
+from .grading import grade, read_submissions
+
+__all__ = (
+    'main',
+)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m gentasks')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    grading = commands.add_parser(
+        'grade', help='grade submissions from JSONL file or directory'
+    )
+    grading.add_argument(
+        'submissions',
+        help='JSONL file with "id", "exercise" and "source" fields '
+             'or directory of .py files'
+    )
+    grading.add_argument(
+        '-o', '--output', required=True,
+        help='JSONL file with verdicts. Existing verdicts are kept and '
+             'their submissions skipped'
+    )
+    grading.add_argument(
+        '-e', '--exercise',
+        help='exercise identifier of submissions without one'
+    )
+    grading.add_argument(
+        '-j', '--jobs', type=int, default=None,
+        help='worker processes (default: CPU count, 0: no workers)'
+    )
+    grading.add_argument(
+        '-c', '--coverage', default=Coverage.ONE_FACTOR.value,
+        choices=[i.value for i in Coverage]
+    )
+    grading.add_argument(
+        '-t', '--timeout', type=float, default=None,
+        help='seconds for one submission check'
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arguments = _parser().parse_args(argv)
+    counts = grade(
+        read_submissions(arguments.submissions, arguments.exercise),
+        arguments.output,
+        jobs=arguments.jobs,
+        coverage=Coverage(arguments.coverage),
+        timeout=arguments.timeout
+    )
+    print(
+        f"graded {counts['graded']}, passed {counts['passed']}, "
+        f"skipped {counts['skipped']}",
+        file=sys.stderr
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,197 @@
+# Python Imports
+import asyncio
+from time import perf_counter
+from types import AsyncGeneratorType
+from typing import Any, AsyncGenerator, Callable, Generator, Iterable, List
+from typing import Optional, Sequence, Set, Tuple, Type
+
+# Module Imports
+from .async_tasktypes import AsyncGeneratorDefaultTask, AsyncGeneratorTaskMeta
+from .coverage import Coverage
+from .exercise import copy_arguments
+from .metrics import record_check
+from .verdict_cache import Verdict
+
+__all__ = (
+    'AsyncExercise',
+    'check_many',
+    'grade_many'
+)
+
+AsyncGeneratorClass = Type[AsyncGeneratorDefaultTask]
+
+
+class AsyncExercise:
+    """Exercise, that consists of async generator tasks"""
+    __slots__ = ('_subgenerators', 'complexity')
+
+    def __init__(self, tasks: Sequence[AsyncGeneratorClass]):
+        for task in tasks:
+            assert isinstance(task, AsyncGeneratorTaskMeta),\
+                "Can't create exercise with non-async generator class"
+        self._subgenerators: Tuple[AsyncGeneratorClass, ...] = tuple(tasks)
+        self.complexity: int = sum(task.complexity for task in tasks)
+
+    def __repr__(self) -> str:
+        return f"<AsyncExercise with {len(self._subgenerators)} tasks>"
+
+    def tasks(self) -> Tuple[AsyncGeneratorClass, ...]:
+        return self._subgenerators
+
+    def names(self) -> List[str]:
+        return [task.__qualname__ for task in self._subgenerators]
+
+    def notes(self) -> Set[str]:
+        values: Set[str] = set()
+        for task in self._subgenerators:
+            values.update(task.notes)
+        return values
+
+    def all_variants(
+            self,
+            coverage: Coverage = Coverage.ONE_FACTOR
+    ) -> Generator[List[tuple], None, None]:
+        """Returns list of lists, containing arguments for generators to check
+        :param coverage: Strategy of combining tasks check cases
+        :type coverage: Coverage
+        :rtype: List[List[tuple]]
+        """
+        table = [
+            [tuple(case.to_dataclass().as_list())
+             for case in task.check_cases_generator()]
+            for task in self._subgenerators
+        ]
+        for cases in Coverage(coverage).variants([len(i) for i in table]):
+            yield [
+                possibilities[case]
+                for possibilities, case in zip(table, cases)
+            ]
+
+    async def check_generator(
+            self,
+            generator: Callable[[Any], AsyncGenerator],
+            coverage: Coverage = Coverage.ONE_FACTOR
+    ) -> None:
+        """Validates async generator, if he's correct corresponding to tasks
+        :param generator: Function, that returns async generator
+        :type generator: Callable[AsyncGenerator]
+        :param coverage: Strategy of combining tasks check cases
+        :type coverage: Coverage
+        :raises TypeError: if passed function did not return async generator
+        :raises Exception: Raises any exception, corresponding to each task
+        """
+        start = perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            await self._check_generator(generator, coverage)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            record_check(
+                'async', len(self._subgenerators), error,
+                perf_counter() - start
+            )
+
+    async def _check_generator(
+            self,
+            generator: Callable[[Any], AsyncGenerator],
+            coverage: Coverage
+    ) -> None:
+        for arguments in self.all_variants(coverage):
+            gen = generator(*copy_arguments(arguments))
+            if type(gen) != AsyncGeneratorType:
+                raise TypeError("Функция(/генератор) не "
+                                "вернула валидный асинхронный генератор")
+            try:
+                for argument, genclass in zip(arguments, self._subgenerators):
+                    await genclass(*argument).check_generator(gen)
+            finally:
+                await gen.aclose()
+
+    async def generator(self, *args) -> AsyncGenerator:
+        """Valid async generator. Values passed with .asend() and
+        exceptions passed with .athrow() delegated to current task
+        """
+        for arguments, genclass in zip(args, self._subgenerators, strict=True):
+            assert isinstance(arguments, tuple)
+            task_generator = genclass(*arguments).generator()
+            try:
+                value = await task_generator.__anext__()
+            except StopAsyncIteration:
+                continue
+            while True:
+                try:
+                    sent = yield value
+                except GeneratorExit:
+                    await task_generator.aclose()
+                    raise
+                except BaseException as e:
+                    try:
+                        value = await task_generator.athrow(e)
+                    except StopAsyncIteration:
+                        break
+                else:
+                    try:
+                        value = await task_generator.asend(sent)
+                    except StopAsyncIteration:
+                        break
+
+
+async def _check(
+        exercise: AsyncExercise,
+        generator: Callable[[Any], AsyncGenerator],
+        coverage: Coverage,
+        deadline: Optional[float],
+        semaphore: asyncio.Semaphore
+) -> Verdict:
+    async with semaphore:
+        try:
+            await asyncio.wait_for(
+                exercise.check_generator(generator, coverage), deadline
+            )
+        except asyncio.TimeoutError:
+            return Verdict(False, 'TimeoutError',
+                           f"Проверка не завершилась за {deadline} с")
+        except Exception as e:
+            return Verdict.from_exception(e)
+        return Verdict.from_exception(None)
+
+
+async def check_many(
+        submissions: Iterable[
+            Tuple[AsyncExercise, Callable[[Any], AsyncGenerator]]
+        ],
+        coverage: Coverage = Coverage.ONE_FACTOR,
+        deadline: Optional[float] = None,
+        concurrency: int = 256
+) -> List[Verdict]:
+    """Checks many async submissions concurrently in current event loop.
+    Deadline applies to each submission separately. It interrupts only
+    submissions, that give control back to event loop
+    :param submissions: Pairs of exercise and function to check
+    :param coverage: Strategy of combining tasks check cases
+    :param deadline: Maximum seconds for check of one submission
+    :param concurrency: Maximum amount of submissions checked at once
+    :return: Verdicts in order of submissions
+    :rtype: List[Verdict]
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(*(
+        _check(exercise, generator, coverage, deadline, semaphore)
+        for exercise, generator in submissions
+    ))
+
+
+def grade_many(
+        submissions: Iterable[
+            Tuple[AsyncExercise, Callable[[Any], AsyncGenerator]]
+        ],
+        coverage: Coverage = Coverage.ONE_FACTOR,
+        deadline: Optional[float] = None,
+        concurrency: int = 256
+) -> List[Verdict]:
+    """Same as check_many(), but runs own event loop"""
+    return asyncio.run(
+        check_many(submissions, coverage, deadline, concurrency)
+    )
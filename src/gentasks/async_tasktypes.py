@@ -0,0 +1,269 @@
+# Python Imports
+from string import ascii_letters
+from types import AsyncGeneratorType
+from typing import AsyncGenerator, Dict, Generator, List, Optional, Set, Type
+
+# Module Imports
+from .composition_classes import local_random
+from .exceptions import GeneratorUnexpectedShutdown
+from .exceptions import GeneratorWrongValue, GeneratorWrongType
+from .constants import MAX_LOOP_TESTS
+from .tasktypes import GeneratorDefaultTask
+from .tasktypes import Range, NegativeRange, AwaitKeyword, Iterator, Fibonacci
+
+__all__ = (
+    'ASYNC_TASKS',
+    'AsyncGeneratorTaskMeta',
+    'AsyncGeneratorDefaultTask'
+)
+
+"""Contains async Tasks classes, except AsyncGeneratorDefaultTask"""
+ASYNC_TASKS: List[Type['AsyncGeneratorDefaultTask']] = []
+
+
+class AsyncGeneratorTaskMeta(type):
+    __slots__ = ()
+    all_tasks: List[Type['AsyncGeneratorDefaultTask']] = ASYNC_TASKS
+    _avoided = False
+
+    def __new__(mcs, name, bases, dct):
+        cl: Type['AsyncGeneratorDefaultTask'] = super().__new__(
+            mcs, name, bases, dct
+        )
+
+        # This if cause ONLY to avoid AsyncGeneratorDefaultTask class
+        if mcs._avoided:
+            ASYNC_TASKS.append(cl)
+        else:
+            mcs._avoided = True
+
+        return cl
+
+    @property
+    def complexity(cls) -> int:
+        return cls.sync_task.complexity
+
+    @property
+    def notes(cls) -> Set[str]:
+        return cls.sync_task.notes
+
+    def __repr__(self) -> str:
+        return f"<ATT {self.__qualname__}>"
+
+
+class AsyncGeneratorDefaultTask(metaclass=AsyncGeneratorTaskMeta):
+    """Generic class for all async Generator Tasks.
+    Arguments, check cases and description are taken from synchronous
+    counterpart task, which also generates reference values
+    """
+    __slots__ = ('task',)
+
+    """Synchronous task with same arguments and values"""
+    sync_task: Type[GeneratorDefaultTask]
+
+    def __init__(self, *args):
+        self.task: GeneratorDefaultTask = self.sync_task(*args)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__} with {self.to_dataclass()}"
+
+    def to_dataclass(self) -> GeneratorDefaultTask.InputDataclass:
+        return self.task.to_dataclass()
+
+    @classmethod
+    def check_cases_generator(
+            cls
+    ) -> Generator['AsyncGeneratorDefaultTask', None, None]:
+        for case in cls.sync_task.check_cases_generator():
+            yield cls(*case.to_dataclass().as_list())
+
+    @classmethod
+    def needed_arguments(cls) -> Dict[str, type]:
+        return cls.sync_task.needed_arguments()
+
+    @classmethod
+    def description(cls) -> str:
+        return cls.sync_task.description()
+
+    async def generator(self) -> AsyncGenerator:
+        """Creates valid async generator corresponding to task variables.
+        By default returns values of synchronous task generator
+        """
+        for value in self.task.generator():
+            yield value
+
+    async def check_generator(self, generator: AsyncGenerator) -> int:
+        """Checks async generator for correct work.
+        By default compares values with synchronous task generator
+        :param generator: Initialized async generator
+        :type generator: Running async generator
+        :return: Amount of calls made to generator
+        :rtype: int
+        """
+        if not isinstance(generator, AsyncGeneratorType):
+            raise TypeError("Полученный объект не является "
+                            "асинхронным генератором")
+
+        calls = 0
+        for valid in self.task.generator():
+            try:
+                current = await generator.__anext__()
+            except StopAsyncIteration:
+                raise GeneratorUnexpectedShutdown(
+                    "Генератор закончил работу при старте" if not calls else
+                    "Генератор закончил работу раньше ожидаемого"
+                )
+            calls += 1
+            if not type(current) == type(valid):
+                raise GeneratorWrongType(
+                    f"Ожидался тип {type(valid).__qualname__}, "
+                    f"получен {type(current).__qualname__}",
+                    valid, current, calls
+                )
+            elif current != valid:
+                raise GeneratorWrongValue(
+                    f"Ожидалось {valid}, получено {current}",
+                    valid, current, calls
+                )
+        return calls
+
+
+class AsyncRange(AsyncGeneratorDefaultTask):
+    __slots__ = ()
+    sync_task = Range
+
+
+class AsyncNegativeRange(AsyncGeneratorDefaultTask):
+    __slots__ = ()
+    sync_task = NegativeRange
+
+
+class AsyncIterator(AsyncGeneratorDefaultTask):
+    __slots__ = ()
+    sync_task = Iterator
+
+
+class AsyncAwaitKeyword(AsyncGeneratorDefaultTask):
+    """Async generator, which runs forever until got keyword through
+    .asend(). When generator gets desired keyword, he must yield it
+    and break a loop
+    """
+    __slots__ = ()
+    sync_task = AwaitKeyword
+
+    async def generator(self) -> AsyncGenerator[Optional[str], str]:
+        while True:
+            string = yield
+            if string == self.task.keyword:
+                break
+        yield string
+
+    async def check_generator(
+            self,
+            generator: AsyncGenerator[None, str]
+    ) -> int:
+        if not isinstance(generator, AsyncGeneratorType):
+            raise TypeError("Полученный объект не является "
+                            "асинхронным генератором")
+
+        try:
+            await generator.__anext__()
+        except StopAsyncIteration:
+            raise GeneratorUnexpectedShutdown(
+                "Генератор закончил работу при старте"
+            )
+
+        calls = 0
+        keyword = self.task.keyword
+        for _ in range(15):
+            rng = local_random()
+            length = range(rng.randint(0, 30))
+            string = ''.join(rng.choice(ascii_letters) for _ in length)
+            if string == keyword:
+                continue
+            calls += 1
+            try:
+                await generator.asend(string)
+            except StopAsyncIteration:
+                raise GeneratorUnexpectedShutdown(
+                    "Генератор остановил свою работу до ключевого слова"
+                )
+
+        try:
+            value = await generator.asend(keyword)
+            calls += 1
+        except StopAsyncIteration:
+            raise GeneratorUnexpectedShutdown(
+                "После получения ключа генератор завершил свою работу, "
+                "хотя ожидалось str"
+            )
+        if value != keyword:
+            raise GeneratorUnexpectedShutdown(
+                "Генератору передан ключ. "
+                "Полученное значение не совпадает с ключом"
+            )
+        return calls
+
+
+class AsyncFibonacci(AsyncGeneratorDefaultTask):
+    """Yield fibonacci numbers, unless exception StopIteration is received
+    through .athrow()
+    """
+    __slots__ = ()
+    sync_task = Fibonacci
+
+    async def generator(self) -> AsyncGenerator[int, None]:
+        first: int = -1
+        second: int = -1
+        try:
+            first = 0
+            yield first
+            second = 1
+            yield second
+            while True:
+                first, second = second, first+second
+                yield second
+        except StopIteration:
+            if second <= 1 and first != 1:
+                yield 1
+            yield second+first
+
+    async def check_generator(
+            self,
+            generator: AsyncGenerator[int, None]
+    ) -> int:
+        if not isinstance(generator, AsyncGeneratorType):
+            raise TypeError("Полученный объект не является "
+                            "асинхронным генератором")
+
+        valid_generator = self.task.generator()
+        calls: int = 0
+        loops = local_random().randint(400, 400+MAX_LOOP_TESTS)
+        for calls in range(1, loops):
+            valid = next(valid_generator)
+            try:
+                current = await generator.__anext__()
+            except StopAsyncIteration:
+                raise GeneratorUnexpectedShutdown(
+                    "Генератор закончил работу до исключения StopIteration"
+                )
+            if current != valid:
+                raise GeneratorWrongValue(
+                    f"Ожидалось {valid}, получено {current}",
+                    valid, current, calls
+                )
+
+        valid = valid_generator.throw(StopIteration())
+        try:
+            current = await generator.athrow(StopIteration())
+        except StopAsyncIteration:
+            raise GeneratorUnexpectedShutdown(
+                "После исключения StopIteration генератор завершил "
+                "работу, хотя ожидалось число"
+            )
+        if current != valid:
+            raise GeneratorWrongValue(
+                f"Ожидалось {valid}, получено {current}",
+                valid, current, calls + 1
+            )
+        return calls + 1
@@ -0,0 +1,139 @@
+# Python Imports
+import dataclasses
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+from typing import Type
+
+# Module Imports
+from .tasktypes import GeneratorDefaultTask
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__all__ = (
+    'Query',
+    'BatchTable'
+)
+
+MAX_BITS = 64
+"""Maximum amount of tasks and notes, that fit in bitmask"""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Query:
+    """Exercises with complexity in [start, end), given amount of tasks
+    (any, if None) and all required notes
+    """
+    start: int
+    end: int
+    amount: Optional[int] = None
+    notes: FrozenSet[str] = frozenset()
+
+
+class BatchTable:
+    """Combination table of generator stored as NumPy arrays.
+    Answers many queries at once with searchsorted and boolean masks.
+    Requires numpy
+    """
+    __slots__ = (
+        'combinations', 'tasks', 'complexity', 'sizes', 'masks',
+        'note_masks', '_note_bits'
+    )
+
+    def __init__(
+            self,
+            tasks: Sequence[Type[GeneratorDefaultTask]],
+            combinations: Sequence[Tuple[Type[GeneratorDefaultTask], ...]],
+            complexity: Sequence[int]
+    ):
+        """
+        :param tasks: Tasks of generator
+        :param combinations: Combinations sorted by complexity
+        :param complexity: Complexity of each combination
+        """
+        if np is None:
+            raise ImportError("BatchTable requires numpy")
+        notes = sorted({note for task in tasks for note in task.notes})
+        if len(tasks) > MAX_BITS or len(notes) > MAX_BITS:
+            raise ValueError(f"BatchTable supports up to {MAX_BITS} "
+                             f"tasks and notes")
+
+        self.combinations = combinations
+        self.tasks: Tuple[Type[GeneratorDefaultTask], ...] = tuple(tasks)
+        self._note_bits: Dict[str, int] = {
+            note: 1 << index for index, note in enumerate(notes)
+        }
+        task_bits = {task: 1 << index for index, task in enumerate(tasks)}
+        task_notes = {
+            task: sum(self._note_bits[note] for note in set(task.notes))
+            for task in tasks
+        }
+
+        masks: List[int] = []
+        note_masks: List[int] = []
+        for combination in combinations:
+            mask = notes_mask = 0
+            for task in combination:
+                mask |= task_bits[task]
+                notes_mask |= task_notes[task]
+            masks.append(mask)
+            note_masks.append(notes_mask)
+
+        self.complexity = np.asarray(complexity, dtype=np.int64)
+        self.sizes = np.fromiter(
+            map(len, combinations), dtype=np.int16,
+            count=len(combinations)
+        )
+        self.masks = np.asarray(masks, dtype=np.uint64)
+        """Bit i is set, if combination contains tasks[i]"""
+        self.note_masks = np.asarray(note_masks, dtype=np.uint64)
+        """Bits of notes, required by combination"""
+
+    def __len__(self) -> int:
+        return len(self.combinations)
+
+    def notes_mask(self, notes: Iterable[str]) -> int:
+        """Returns bitmask of notes. Unknown notes give mask,
+        that no combination matches
+        """
+        mask = 0
+        for note in notes:
+            if note not in self._note_bits:
+                return -1
+            mask |= self._note_bits[note]
+        return mask
+
+    def batch_query(self, queries: Sequence[Query]) -> List['np.ndarray']:
+        """Answers queries at once
+        :param queries: Queries to answer
+        :return: Arrays of table indexes, that match each query,
+            in ascending complexity
+        :rtype: List[numpy.ndarray]
+        """
+        starts = np.searchsorted(
+            self.complexity,
+            np.fromiter((q.start for q in queries), np.int64, len(queries))
+        )
+        ends = np.searchsorted(
+            self.complexity,
+            np.fromiter((q.end for q in queries), np.int64, len(queries))
+        )
+
+        results: List[np.ndarray] = []
+        for query, start, end in zip(queries, starts.tolist(), ends.tolist()):
+            if start >= end:
+                results.append(np.arange(0, dtype=np.intp))
+                continue
+            keep = np.ones(end - start, dtype=bool)
+            if query.amount is not None:
+                keep &= self.sizes[start:end] == query.amount
+            if query.notes:
+                required = self.notes_mask(query.notes)
+                if required < 0:
+                    results.append(np.arange(0, dtype=np.intp))
+                    continue
+                required = np.uint64(required)
+                keep &= (self.note_masks[start:end] & required) == required
+            results.append(np.flatnonzero(keep) + start)
+        return results
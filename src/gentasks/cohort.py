@@ -0,0 +1,198 @@
+# Python Imports
+import dataclasses
+import os
+from bisect import bisect_left
+from collections import deque
+from threading import Lock
+from typing import BinaryIO, Deque, Generator, Iterable, Iterator, List
+from typing import Optional, Set, Tuple, Type
+
+# Module Imports
+from .composition_classes import local_random
+from .exercise import FrozenExercise
+from .identifiers import ExerciseCodec
+from .task_generator import PrecheckExerciseGenerator
+from .tasktypes import GeneratorDefaultTask
+
+__all__ = (
+    'Assignment',
+    'IssuedSet',
+    'assign'
+)
+
+Combination = Tuple[Type[GeneratorDefaultTask], ...]
+
+
+def _write_varint(value: int, file: BinaryIO) -> None:
+    data = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            data.append(byte | 0x80)
+        else:
+            data.append(byte)
+            break
+    file.write(data)
+
+
+def _read_varints(data: bytes) -> Iterator[int]:
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield value
+            value = shift = 0
+
+
+class IssuedSet:
+    """Set of already issued exercise identifiers. If path passed,
+    identifiers are appended to file as varints (3-4 bytes for each
+    with small registries) and loaded back in next session
+    """
+    __slots__ = ('_values', '_file', 'path', '_lock')
+
+    def __init__(self, path: Optional[str] = None):
+        self._values: Set[int] = set()
+        self.path: Optional[str] = path
+        self._file: Optional[BinaryIO] = None
+        self._lock = Lock()
+        if path is not None:
+            if os.path.exists(path):
+                with open(path, 'rb') as file:
+                    self._values.update(_read_varints(file.read()))
+            self._file = open(path, 'ab')
+
+    def __enter__(self) -> 'IssuedSet':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __contains__(self, identifier: int) -> bool:
+        return identifier in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._values)
+
+    def add(self, identifier: int) -> None:
+        assert isinstance(identifier, int) and identifier >= 0
+        with self._lock:
+            if identifier in self._values:
+                return
+            self._values.add(identifier)
+            if self._file is not None:
+                _write_varint(identifier, self._file)
+
+    def update(self, identifiers: Iterable[int]) -> None:
+        for identifier in identifiers:
+            self.add(identifier)
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Assignment:
+    """Exercise issued to seat"""
+    seat: int
+    identifier: int
+    """Identifier of tasks set (see ExerciseCodec.encode_set)"""
+    complexity: int
+    exercise: FrozenExercise
+
+
+def _closest(
+        complexity: Tuple[int, ...],
+        target: int
+) -> Iterator[int]:
+    """Yields table indexes in order of distance from target complexity"""
+    high = bisect_left(complexity, target)
+    low = high - 1
+    while low >= 0 or high < len(complexity):
+        if high >= len(complexity) or (
+                low >= 0
+                and target - complexity[low] <= complexity[high] - target
+        ):
+            yield low
+            low -= 1
+        else:
+            yield high
+            high += 1
+
+
+def assign(
+        generator: PrecheckExerciseGenerator,
+        seats: int,
+        target: int,
+        issued: Optional[IssuedSet] = None,
+        neighbours: int = 1,
+        window: int = 32,
+        shuffle_tasks: bool = True
+) -> Generator[Assignment, None, None]:
+    """Assigns distinct exercises to seats. Exercises are taken in order
+    of distance of their complexity from target, skipping issued ones.
+    Among window closest candidates seat gets one, that shares fewest
+    tasks with previous neighbours seats.
+    Assignments are yielded one by one and added to issued set at once
+    :param generator: Generator of exercises
+    :param seats: Amount of seats
+    :param target: Desired complexity of exercises
+    :param issued: Identifiers, that shouldn't be issued. Updated
+    :param neighbours: Amount of previous seats, considered neighbours
+    :param window: Amount of candidates to choose from for each seat
+    :param shuffle_tasks: Shuffle tasks inside exercises
+    :raises ValueError: when unissued exercises run out
+    :rtype: Generator[Assignment]
+    """
+    assert isinstance(seats, int) and seats >= 0
+    assert isinstance(window, int) and window > 0
+    if issued is None:
+        issued = IssuedSet()
+    codec = ExerciseCodec(generator.tasks())
+    bits = {task: 1 << index for index, task in enumerate(generator.tasks())}
+    combinations_: Tuple[Combination, ...] = generator._combinations
+    complexity: Tuple[int, ...] = generator._complexity
+
+    candidates = _closest(complexity, target)
+    pool: List[Tuple[int, int, int]] = []
+    """Index in table, identifier and tasks mask of candidates"""
+    previous: Deque[int] = deque(maxlen=neighbours)
+    for seat in range(seats):
+        while len(pool) < window:
+            index = next(candidates, None)
+            if index is None:
+                break
+            identifier = codec.encode_set(combinations_[index])
+            if identifier in issued:
+                continue
+            mask = sum(bits[task] for task in combinations_[index])
+            pool.append((index, identifier, mask))
+        if not pool:
+            raise ValueError(f"Not enough unissued exercises for "
+                             f"{seats} seats, assigned {seat}")
+
+        best = min(range(len(pool)), key=lambda i: sum(
+            (pool[i][2] & mask).bit_count() for mask in previous
+        ))
+        index, identifier, mask = pool.pop(best)
+        previous.append(mask)
+        issued.add(identifier)
+
+        tasks = list(combinations_[index])
+        if shuffle_tasks:
+            local_random().shuffle(tasks)
+        yield Assignment(
+            seat, identifier, complexity[index], FrozenExercise(tasks)
+        )
@@ -1,16 +1,39 @@
-__all__ = ('Singleton',)
+# Python Imports
+from random import Random
+from threading import RLock, local
+
+__all__ = ('Singleton', 'local_random')
 
 
 class Singleton:
     __slots__ = ()
     _instance = None
+    _lock = RLock()
 
     def __new__(cls, *args, **kwargs):
+        # Double-checked locking: instance published only after new()
         if cls._instance is None:
-            cls._instance = super().__new__(cls, *args, **kwargs)
-            if hasattr(cls._instance, 'new'):
-                getattr(cls._instance, 'new')()
+            with Singleton._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls, *args, **kwargs)
+                    if hasattr(instance, 'new'):
+                        getattr(instance, 'new')()
+                    cls._instance = instance
         return cls._instance
 
     def new(self):
         """Called when singleton created. Once in all program"""
+
+
+_local = local()
+
+
+def local_random() -> Random:
+    """Returns random generator of current thread. Module-level functions
+    of random share one generator state between all threads
+    """
+    try:
+        return _local.random
+    except AttributeError:
+        _local.random = Random()
+        return _local.random
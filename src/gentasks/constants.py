@@ -32,3 +32,34 @@ GENERATORS_DESCRIPTION = {
 
 
 MAX_LOOP_TESTS = 100
+
+EXERCISE_CACHE_SIZE = 1024
+"""Maximum amount of interned FrozenExercise objects"""
+
+VERDICT_CACHE_SIZE = 4096
+"""Maximum amount of verdicts stored in memory by VerdictCache"""
+
+LOADER_CACHE_SIZE = 1024
+"""Maximum amount of compiled submissions stored in memory"""
+
+LOADER_DISK_CACHE_SIZE = 16384
+"""Maximum amount of compiled submissions stored on disk"""
+
+STRESS_LENGTH = 1_000_000
+"""Amount of values in sequences of stress check cases"""
+
+EFFICIENCY_ITEMS = 10_000
+"""Amount of values consumed from generator during efficiency check"""
+
+EFFICIENCY_PEAK_BYTES = 64 * 1024
+"""Maximum memory allocated by lazy generator during efficiency check"""
+
+EFFICIENCY_FIRST_YIELD = 0.01
+"""Maximum seconds before lazy generator returns first value"""
+
+PLUGINS_ENTRY_POINT = 'gentasks.tasks'
+"""Entry point group of third-party task types metadata"""
+
+PARALLEL_BUILD_MIN_TASKS = 12
+"""Minimum amount of tasks, for which generator table is built
+in process pool (see PrecheckExerciseGenerator.build_workers)"""
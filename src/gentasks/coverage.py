@@ -0,0 +1,110 @@
+# Python Imports
+from enum import Enum
+from itertools import combinations, product
+from typing import Generator, Sequence, Set, Tuple
+
+__all__ = (
+    'Coverage',
+)
+
+Variant = Tuple[int, ...]
+"""Indexes of check cases, one per task"""
+
+
+def _quick(sizes: Sequence[int]) -> Generator[Variant, None, None]:
+    yield (0,) * len(sizes)
+
+
+def _one_factor(sizes: Sequence[int]) -> Generator[Variant, None, None]:
+    cases = [0] * len(sizes)
+    for task_index, size in enumerate(sizes):
+        for case in range(size):
+            cases[task_index] = case
+            if case == size - 1:
+                continue
+            yield tuple(cases)
+    yield tuple(cases)
+
+
+def _pairwise(sizes: Sequence[int]) -> Generator[Variant, None, None]:
+    """Greedy covering array: each row covers at least one pair of cases,
+    that not covered yet, and as much other uncovered pairs, as possible
+    """
+    if len(sizes) < 2:
+        yield from _product(sizes)
+        return
+
+    uncovered: Set[Tuple[int, int, int, int]] = {
+        (first, first_case, second, second_case)
+        for first, second in combinations(range(len(sizes)), 2)
+        for first_case in range(sizes[first])
+        for second_case in range(sizes[second])
+    }
+
+    while uncovered:
+        first, first_case, second, second_case = min(uncovered)
+        row = [-1] * len(sizes)
+        row[first] = first_case
+        row[second] = second_case
+
+        for task_index, size in enumerate(sizes):
+            if row[task_index] != -1:
+                continue
+            best_case, best_score = 0, -1
+            for case in range(size):
+                score = sum(
+                    1 for other, other_case in enumerate(row)
+                    if other_case != -1 and (
+                        (other, other_case, task_index, case) in uncovered
+                        if other < task_index else
+                        (task_index, case, other, other_case) in uncovered
+                    )
+                )
+                if score > best_score:
+                    best_case, best_score = case, score
+            row[task_index] = best_case
+
+        for first, second in combinations(range(len(row)), 2):
+            uncovered.discard((first, row[first], second, row[second]))
+        yield tuple(row)
+
+
+def _product(sizes: Sequence[int]) -> Generator[Variant, None, None]:
+    yield from product(*(range(size) for size in sizes))
+
+
+class Coverage(Enum):
+    """Strategy of combining check cases of exercise tasks into variants"""
+
+    QUICK = 'quick'
+    """Single variant with first check case of each task"""
+
+    ONE_FACTOR = 'one_factor'
+    """Check cases of one task changing at a time"""
+
+    PAIRWISE = 'pairwise'
+    """Each pair of check cases of any two tasks appears at least once"""
+
+    PRODUCT = 'product'
+    """All combinations of check cases"""
+
+    def variants(
+            self,
+            sizes: Sequence[int]
+    ) -> Generator[Variant, None, None]:
+        """Lazily generates variants
+        :param sizes: Amount of check cases of each task
+        :type sizes: Sequence[int]
+        :return: Generator of check cases indexes, one index per task
+        :rtype: Generator[Tuple[int, ...]]
+        """
+        assert all(size > 0 for size in sizes), "Task without check cases"
+        return _STRATEGIES[self](sizes)
+
+
+_STRATEGIES = {
+    Coverage.QUICK: _quick,
+    Coverage.ONE_FACTOR: _one_factor,
+    Coverage.PAIRWISE: _pairwise,
+    Coverage.PRODUCT: _product,
+}
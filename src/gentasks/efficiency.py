@@ -0,0 +1,188 @@
+# Python Imports
+import copy
+import dataclasses
+import tracemalloc
+from threading import Lock
+from time import perf_counter
+from types import GeneratorType
+from typing import Any, Callable, Generator, List, Optional, TYPE_CHECKING
+
+# Module Imports
+from .constants import EFFICIENCY_ITEMS, EFFICIENCY_PEAK_BYTES
+from .constants import EFFICIENCY_FIRST_YIELD, STRESS_LENGTH
+from .exceptions import GeneratorUnexpectedShutdown, GeneratorWrongValue
+
+if TYPE_CHECKING:
+    from .exercise import Exercise
+    from .tasktypes import GeneratorDefaultTask
+
+__all__ = (
+    'EfficiencyLimits',
+    'EfficiencyResult',
+    'measure',
+    'check_efficiency'
+)
+
+
+@dataclasses.dataclass(slots=True)
+class EfficiencyLimits:
+    """Thresholds of efficiency checks. None disables threshold"""
+    items: int = EFFICIENCY_ITEMS
+    """Amount of values consumed from generator"""
+    length: int = STRESS_LENGTH
+    """Amount of values in sequences passed to generator"""
+    max_peak_bytes: Optional[int] = EFFICIENCY_PEAK_BYTES
+    """Maximum memory allocated while values consumed"""
+    max_first_yield: Optional[float] = EFFICIENCY_FIRST_YIELD
+    """Maximum seconds before first value returned"""
+
+
+@dataclasses.dataclass(slots=True)
+class EfficiencyResult:
+    """Efficiency of generator on single task"""
+    task: str
+    task_index: int
+    items: int = 0
+    """Amount of consumed values"""
+    peak_bytes: int = 0
+    first_yield: float = 0.0
+    violations: List[str] = dataclasses.field(default_factory=list)
+    error: Optional[str] = None
+    """Message of exception, raised during measurement"""
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None and not self.violations
+
+
+_tracing_lock = Lock()
+"""tracemalloc traces whole process, so measurements are serialized"""
+
+
+def _trace(
+        task: 'GeneratorDefaultTask',
+        gen: Generator,
+        result: EfficiencyResult,
+        limits: EfficiencyLimits
+) -> None:
+    """Consumes values of generator under tracemalloc. Called under
+    _tracing_lock
+    """
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        valid_generator = task.generator()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        start = perf_counter()
+        for valid in valid_generator:
+            try:
+                current = next(gen)
+            except StopIteration:
+                raise GeneratorUnexpectedShutdown(
+                    "Генератор закончил работу раньше ожидаемого"
+                )
+            if not result.items:
+                result.first_yield = perf_counter() - start
+            result.items += 1
+            if current != valid:
+                raise GeneratorWrongValue(
+                    f"Ожидалось {valid}, получено {current}",
+                    valid, current, result.items
+                )
+            if result.items >= limits.items:
+                break
+        result.peak_bytes = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+
+def measure(
+        exercise: 'Exercise',
+        generator: Callable[[Any], Generator],
+        task_index: int,
+        limits: EfficiencyLimits
+) -> EfficiencyResult:
+    """Measures efficiency of generator on one task of exercise.
+    Tasks before measured one checked with first check case, measured task
+    gets it's efficiency case, then limits.items values consumed under
+    tracemalloc. Peak includes allocations of reference generator, which
+    produces compared values. Concurrent measurements wait for each other
+    :raises ValueError: if task doesn't support efficiency checks
+    :raises Exception: Raises any exception, corresponding to checks
+    """
+    tasks = exercise.tasks()
+    task = tasks[task_index].efficiency_case(limits.length)
+    if task is None:
+        raise ValueError(f"{tasks[task_index]} has no efficiency case")
+
+    arguments = [table[0] for table in exercise._variants_table()]
+    arguments[task_index] = tuple(task.to_dataclass().as_list())
+    result = EfficiencyResult(type(task).__qualname__, task_index)
+
+    # Submission gets copy, arguments are shared with reference tasks
+    gen = generator(*copy.deepcopy(arguments))
+    if type(gen) != GeneratorType:
+        raise TypeError("Функция(/генератор) не "
+                        "вернула валидный генератор")
+    for argument, genclass in zip(
+            arguments[:task_index], tasks[:task_index]
+    ):
+        genclass(*argument).check_generator(gen)
+
+    try:
+        with _tracing_lock:
+            _trace(task, gen, result, limits)
+    finally:
+        gen.close()
+
+    if (
+            limits.max_peak_bytes is not None
+            and result.peak_bytes > limits.max_peak_bytes
+    ):
+        result.violations.append(
+            f"Генератор использовал {result.peak_bytes} байт памяти, "
+            f"допустимо {limits.max_peak_bytes}"
+        )
+    if (
+            limits.max_first_yield is not None
+            and result.first_yield > limits.max_first_yield
+    ):
+        result.violations.append(
+            f"Первое значение получено через {result.first_yield:.4f} с, "
+            f"допустимо {limits.max_first_yield} с"
+        )
+    return result
+
+
+def check_efficiency(
+        exercise: 'Exercise',
+        generator: Callable[[Any], Generator],
+        limits: Optional[EfficiencyLimits] = None
+) -> List[EfficiencyResult]:
+    """Measures efficiency of generator on each exercise task, that
+    supports efficiency checks
+    :param exercise: Exercise to check
+    :param generator: Function, that returns generator
+    :param limits: Thresholds of checks. Defaults used, if None passed
+    :return: Results of tasks with efficiency cases
+    :rtype: List[EfficiencyResult]
+    """
+    if limits is None:
+        limits = EfficiencyLimits()
+
+    results: List[EfficiencyResult] = []
+    for task_index, task in enumerate(exercise.tasks()):
+        if task.efficiency_case(1) is None:
+            continue
+        try:
+            result = measure(exercise, generator, task_index, limits)
+        except Exception as e:
+            result = EfficiencyResult(
+                task.__qualname__, task_index,
+                error=f"{type(e).__qualname__}: {e}"
+            )
+        results.append(result)
+    return results
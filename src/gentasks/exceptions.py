@@ -4,3 +4,38 @@ class GeneratorUnexpectedShutdown(Exception):
 
     def __repr__(self) -> str:
         return type(self).__qualname__
+
+
+class GeneratorWrongValue(ValueError):
+    """Generator returned value, that differs from expected"""
+    __slots__ = ('expected', 'actual', 'call')
+
+    def __init__(self, message: str, expected=None, actual=None, call=None):
+        super().__init__(message)
+        self.expected = expected
+        self.actual = actual
+        self.call = call
+
+    def __reduce__(self):
+        # BaseException keeps only args, slots are passed explicitly
+        return type(self), (*self.args, self.expected, self.actual, self.call)
+
+
+class GeneratorWrongType(TypeError):
+    """Generator returned value, that type differs from expected"""
+    __slots__ = ('expected', 'actual', 'call')
+
+    def __init__(self, message: str, expected=None, actual=None, call=None):
+        super().__init__(message)
+        self.expected = expected
+        self.actual = actual
+        self.call = call
+
+    def __reduce__(self):
+        # BaseException keeps only args, slots are passed explicitly
+        return type(self), (*self.args, self.expected, self.actual, self.call)
+
+
+class SubmissionRejected(Exception):
+    """Submission rejected by static checks before execution"""
+    __slots__ = ()
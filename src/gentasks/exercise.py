@@ -1,18 +1,46 @@
 # Python Imports
 from typing import List, Set, Generator, Callable, Sequence, Tuple, Type, Any
+from typing import FrozenSet, Optional
 from types import GeneratorType
+from collections import OrderedDict
+from threading import Lock
 from io import StringIO
-from random import shuffle
+from time import perf_counter
+import copy
 import dataclasses
 
 # Module Imports
+from .composition_classes import local_random
 from .tasktypes import GeneratorDefaultTask, GeneratorTaskMeta
-from .constants import TASK_TEXT, NOTES
+from .coverage import Coverage
+from .report import Failure, Report
+from .failure_statistics import FailureStatistics
+from .efficiency import EfficiencyLimits, check_efficiency
+from .metrics import TASK_CHECKS, TASK_CHECK_SECONDS, record_check
+from .metrics import verdict_label
+from .constants import TASK_TEXT, NOTES, EXERCISE_CACHE_SIZE
 
 
 GeneratorClass = Type[GeneratorDefaultTask]
 
 
+def _record_task(
+        name: str,
+        error: Optional[Exception],
+        seconds: float
+) -> None:
+    TASK_CHECKS.inc(task=name, verdict=verdict_label(error))
+    TASK_CHECK_SECONDS.observe(seconds, task=name)
+
+
+def copy_arguments(arguments: List[tuple]) -> List[tuple]:
+    """Returns copy of variant arguments, that is passed to submission.
+    Submission can mutate it's arguments, so it never gets check case
+    objects, shared with reference tasks, next variants and next checks
+    """
+    return copy.deepcopy(arguments)
+
+
 class Exercise:
     __slots__ = ('_subgenerators', 'complexity')
 
@@ -55,40 +83,92 @@ class Exercise:
         2. Numerated tasks
         3. Notes
         """
-        assert isinstance(TASK_TEXT, str)
         string = StringIO()
-        string.write('\t' + TASK_TEXT)
-
-        # Tasks text
-        for index, task in enumerate(self._subgenerators, 1):
-            string.write(f"\n{index}. {task.description()}")
+        string.write(self._description_tasks())
 
         # Call examples
         string.write('\n\tПример вызова генератора:')
         all_variants = [*self.all_variants()]
-        shuffle(all_variants)
+        local_random().shuffle(all_variants)
         for variant in all_variants[:3]:
             arguments = (str(i) for i in variant)
             arguments = ', '.join(arguments)
             string.write(f"\nmain({arguments})")
 
-        # Notes
-        notes = self.notes()
-        if notes:
-            string.write("\n\tПримечания:")
-            for note in notes:
-                string.write('\n' + NOTES[note])
+        string.write(self._description_notes())
+        return string.getvalue()
+
+    def _description_tasks(self) -> str:
+        """Returns static part of description: intro and numerated tasks"""
+        assert isinstance(TASK_TEXT, str)
+        string = StringIO()
+        string.write('\t' + TASK_TEXT)
+        for index, task in enumerate(self._subgenerators, 1):
+            string.write(f"\n{index}. {task.description()}")
+        return string.getvalue()
 
+    def _description_notes(self) -> str:
+        """Returns static part of description: notes (can be empty)"""
+        notes = self.notes()
+        if not notes:
+            return ''
+        string = StringIO()
+        string.write("\n\tПримечания:")
+        for note in notes:
+            string.write('\n' + NOTES[note])
         return string.getvalue()
 
-    def all_variants(self) -> Generator[List[tuple], None, None]:
+    def all_variants(
+            self,
+            coverage: Coverage = Coverage.ONE_FACTOR,
+            stress: bool = False
+    ) -> Generator[List[tuple], None, None]:
         """Returns list of lists, containing arguments for generators to check
+        :param coverage: Strategy of combining tasks check cases
+        :type coverage: Coverage
+        :param stress: Use stress check cases (huge and streaming values)
+        :type stress: bool
         :rtype: List[List[tuple]]
         """
+        for _, arguments in self._indexed_variants(coverage, stress):
+            yield arguments
+
+    def _indexed_variants(
+            self,
+            coverage: Coverage = Coverage.ONE_FACTOR,
+            stress: bool = False
+    ) -> Generator[Tuple[Tuple[int, ...], List[tuple]], None, None]:
+        """Same as all_variants(), but also returns check cases indexes
+        :rtype: Tuple[Tuple[int, ...], List[tuple]]
+        """
+        tasks_possibilities = self._variants_table(stress)
+        sizes = [len(i) for i in tasks_possibilities]
+
+        for cases in Coverage(coverage).variants(sizes):
+            yield cases, [
+                possibilities[case] for possibilities, case
+                in zip(tasks_possibilities, cases)
+            ]
+
+    def _variants_table(
+            self,
+            stress: bool = False
+    ) -> Sequence[Sequence[tuple]]:
+        """Returns arguments of every check case for each task
+        :param stress: Use stress check cases instead of ordinary
+        :type stress: bool
+        :return: Sequence (per task) of arguments tuples (per check case)
+        :rtype: Sequence[Sequence[tuple]]
+        """
         tasks_possibilities: List[List[tuple]] = []
         for gen in self._subgenerators:
             gen: GeneratorClass
-            gen: Generator[GeneratorDefaultTask] = gen.check_cases_generator()
+            if stress:
+                gen: Generator[GeneratorDefaultTask] = \
+                    gen.stress_cases_generator()
+            else:
+                gen: Generator[GeneratorDefaultTask] = \
+                    gen.check_cases_generator()
             task_possibilities: List[tuple] = []
             for case in gen:
                 case: GeneratorDefaultTask
@@ -99,36 +179,102 @@ class Exercise:
                 case: tuple = tuple(case)
                 task_possibilities.append(case)
             tasks_possibilities.append(task_possibilities)
-
-        arguments = [i[0] for i in tasks_possibilities]
-        for task_index, task in enumerate(tasks_possibilities):
-            task_len = len(task)
-            for pos_index, possibility in enumerate(task, 1):
-                arguments[task_index] = possibility
-                if pos_index == task_len:
-                    continue
-                yield arguments.copy()
-        yield arguments.copy()
+        return tasks_possibilities
 
     def _check_variant(self, generator: Generator, arguments: List[tuple]):
         for argument, genclass in zip(arguments, self._subgenerators):
-            genclass: GeneratorClass
-            genclass: GeneratorDefaultTask = genclass(*argument)
-            genclass.check_generator(generator)
+            name = genclass.__qualname__
+            start = perf_counter()
+            try:
+                genclass(*argument).check_generator(generator)
+            except Exception as e:
+                _record_task(name, e, perf_counter() - start)
+                raise
+            _record_task(name, None, perf_counter() - start)
 
-    def check_generator(self, generator: Callable[[Any], Generator]) -> None:
+    def _check_variant_recorded(
+            self,
+            generator: Generator,
+            arguments: List[tuple],
+            cases: Tuple[int, ...],
+            statistics: FailureStatistics,
+            stress: bool = False
+    ) -> None:
+        """Same as _check_variant(), but records results to statistics"""
+        for argument, genclass, case in zip(
+                arguments, self._subgenerators, cases
+        ):
+            name = genclass.__qualname__
+            start = perf_counter()
+            try:
+                genclass(*argument).check_generator(generator)
+            except Exception as e:
+                seconds = perf_counter() - start
+                statistics.record(name, case, True, seconds, stress)
+                _record_task(name, e, seconds)
+                raise
+            seconds = perf_counter() - start
+            statistics.record(name, case, False, seconds, stress)
+            _record_task(name, None, seconds)
+
+    def check_generator(
+            self,
+            generator: Callable[[Any], Generator],
+            coverage: Coverage = Coverage.ONE_FACTOR,
+            stress: bool = False,
+            statistics: Optional[FailureStatistics] = None
+    ) -> None:
         """Validates generator, if he's correct corresponding to tasks
         :param generator: URL to function, that returns generator
         :type generator: Callable[Generator]
+        :param coverage: Strategy of combining tasks check cases
+        :type coverage: Coverage
+        :param stress: Use stress check cases (huge and streaming values)
+        :type stress: bool
+        :param statistics: If passed, variants checked in order of failure
+            probability per second and results recorded to statistics
+        :type statistics: Optional[FailureStatistics]
         :return: None
         :raises TypeError: if passed function did not return generator
         :raises Exception: Raises any exception, corresponding to each task
         """
-        to_check = self.all_variants()
+        start = perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            if statistics is not None:
+                self._check_generator_ordered(
+                    generator, coverage, stress, statistics
+                )
+            else:
+                self._check_generator(generator, coverage, stress)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            record_check(
+                'sync', len(self._subgenerators), error,
+                perf_counter() - start
+            )
+
+    @staticmethod
+    def _submission_arguments(
+            arguments: List[tuple],
+            stress: bool
+    ) -> List[tuple]:
+        # Stress cases are immutable and built for each check
+        return arguments if stress else copy_arguments(arguments)
+
+    def _check_generator(
+            self,
+            generator: Callable[[Any], Generator],
+            coverage: Coverage,
+            stress: bool
+    ) -> None:
+        to_check = self.all_variants(coverage, stress)
         arguments = next(to_check)
 
         # Validator check
-        gen = generator(*arguments)
+        gen = generator(*self._submission_arguments(arguments, stress))
         if type(gen) != GeneratorType:
             raise TypeError("Функция(/генератор) не "
                             "вернула валидный генератор")
@@ -136,9 +282,146 @@ class Exercise:
 
         # Normal iteration
         for arguments in to_check:
-            gen = generator(*arguments)
+            gen = generator(*self._submission_arguments(arguments, stress))
             self._check_variant(gen, arguments)
 
+    def _check_generator_ordered(
+            self,
+            generator: Callable[[Any], Generator],
+            coverage: Coverage,
+            stress: bool,
+            statistics: FailureStatistics
+    ) -> None:
+        variants = statistics.order(
+            [task.__qualname__ for task in self._subgenerators],
+            [*self._indexed_variants(coverage, stress)],
+            stress
+        )
+        for index, (cases, arguments) in enumerate(variants):
+            gen = generator(*self._submission_arguments(arguments, stress))
+            if index == 0 and type(gen) != GeneratorType:
+                raise TypeError("Функция(/генератор) не "
+                                "вернула валидный генератор")
+            self._check_variant_recorded(
+                gen, arguments, cases, statistics, stress
+            )
+
+    def check_report(
+            self,
+            generator: Callable[[Any], Generator],
+            coverage: Coverage = Coverage.ONE_FACTOR,
+            max_failures: Optional[int] = None,
+            time_limit: Optional[float] = None,
+            stress: bool = False,
+            efficiency: Optional[EfficiencyLimits] = None
+    ) -> Report:
+        """Validates generator on all variants, collecting failures
+        instead of raising first of them
+        :param generator: URL to function, that returns generator
+        :type generator: Callable[Generator]
+        :param coverage: Strategy of combining tasks check cases
+        :type coverage: Coverage
+        :param max_failures: Stop check after this amount of failures
+        :type max_failures: Optional[int]
+        :param time_limit: Stop check after this amount of seconds
+        :type time_limit: Optional[float]
+        :param stress: Use stress check cases (huge and streaming values)
+        :type stress: bool
+        :param efficiency: Thresholds of efficiency checks. If passed,
+            tasks supporting them also checked for laziness
+        :type efficiency: Optional[EfficiencyLimits]
+        :return: Report with all failures
+        :rtype: Report
+        """
+        report = Report()
+        start = perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            error = self._fill_report(
+                report, generator, coverage, max_failures, time_limit,
+                stress
+            )
+            if efficiency is not None:
+                report.efficiency = check_efficiency(
+                    self, generator, efficiency
+                )
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            record_check(
+                'report', len(self._subgenerators), error,
+                perf_counter() - start
+            )
+        return report
+
+    def _fill_report(
+            self,
+            report: Report,
+            generator: Callable[[Any], Generator],
+            coverage: Coverage,
+            max_failures: Optional[int],
+            time_limit: Optional[float],
+            stress: bool
+    ) -> Optional[Exception]:
+        """Checks variants, appending failures to report
+        :return: Exception of first failure
+        :rtype: Optional[Exception]
+        """
+        start = perf_counter()
+        first: Optional[Exception] = None
+
+        variants = self.all_variants(coverage, stress)
+        for variant, arguments in enumerate(variants):
+            if (
+                    max_failures is not None
+                    and len(report.failures) >= max_failures
+            ) or (
+                    time_limit is not None
+                    and perf_counter() - start > time_limit
+            ):
+                report.complete = False
+                break
+            report.variants += 1
+
+            try:
+                gen = generator(
+                    *self._submission_arguments(arguments, stress)
+                )
+            except Exception as e:
+                first = first or e
+                report.failures.append(
+                    Failure.from_exception(e, variant, arguments)
+                )
+                continue
+            if type(gen) != GeneratorType:
+                e = TypeError("Функция(/генератор) не "
+                              "вернула валидный генератор")
+                first = first or e
+                report.failures.append(
+                    Failure.from_exception(e, variant, arguments)
+                )
+                report.complete = False
+                break
+
+            # Generator state is undefined after first failed task
+            for task_index, (argument, genclass) in enumerate(
+                    zip(arguments, self._subgenerators)
+            ):
+                name = genclass.__qualname__
+                task_start = perf_counter()
+                try:
+                    genclass(*argument).check_generator(gen)
+                except Exception as e:
+                    _record_task(name, e, perf_counter() - task_start)
+                    first = first or e
+                    report.failures.append(Failure.from_exception(
+                        e, variant, arguments, name, task_index
+                    ))
+                    break
+                _record_task(name, None, perf_counter() - task_start)
+        return first
+
     def names(self) -> List[str]:
         names = []
         for task in self._subgenerators:
@@ -153,3 +436,105 @@ class Exercise:
             assert isinstance(arguments, tuple)
             assert isinstance(genclass, GeneratorTaskMeta)
             yield from genclass(*arguments).generator()
+
+
+class FrozenExercise(Exercise):
+    """Immutable, hashable exercise.
+    Instances are interned per ordered tuple of tasks: creating exercise with
+    same tasks returns same object, so all derived data (complexity, notes,
+    names, variants table, static description text) calculated only once.
+    Cached check cases are shared by all checks, so submissions get only
+    their copies (see copy_arguments()).
+    Least recently used instances are evicted after EXERCISE_CACHE_SIZE
+    """
+    __slots__ = (
+        '_names', '_notes', '_variants', '_text_tasks', '_text_notes'
+    )
+    _interned: 'OrderedDict[Tuple[GeneratorClass, ...], FrozenExercise]' = \
+        OrderedDict()
+
+    _lock = Lock()
+
+    def __new__(cls, tasks: Sequence[GeneratorClass]):
+        key = tuple(tasks)
+        interned = cls._interned
+        with cls._lock:
+            exercise = interned.get(key)
+            if exercise is not None:
+                interned.move_to_end(key)
+                return exercise
+
+        # Built outside of lock, first built instance wins
+        exercise = super().__new__(cls)
+        exercise._freeze(key)
+        with cls._lock:
+            exercise = interned.setdefault(key, exercise)
+            interned.move_to_end(key)
+            if len(interned) > EXERCISE_CACHE_SIZE:
+                interned.popitem(last=False)
+        return exercise
+
+    def __init__(self, tasks: Sequence[GeneratorClass]):
+        """Exercise already built in __new__"""
+
+    def _freeze(self, tasks: Tuple[GeneratorClass, ...]) -> None:
+        setattr_ = super().__setattr__
+        for task in tasks:
+            assert isinstance(task, GeneratorTaskMeta),\
+                "Can't create exercise with non-generator class"
+        setattr_('_subgenerators', tasks)
+        setattr_('complexity', sum(task.complexity for task in tasks))
+        setattr_('_names', tuple(super().names()))
+        setattr_('_notes', frozenset(super().notes()))
+        setattr_('_variants', tuple(
+            tuple(task) for task in super()._variants_table()
+        ))
+        setattr_('_text_tasks', super()._description_tasks())
+        setattr_('_text_notes', super()._description_notes())
+
+    def __setattr__(self, key, value) -> None:
+        raise AttributeError(f"{type(self).__qualname__} is immutable")
+
+    def __reduce__(self):
+        return type(self), (self._subgenerators,)
+
+    def __hash__(self) -> int:
+        return hash(self._subgenerators)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FrozenExercise):
+            return self._subgenerators == other._subgenerators
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"<FrozenExercise with {len(self._subgenerators)} tasks>"
+
+    def append(self, generator_class: GeneratorClass) -> None:
+        raise TypeError("Can't append task to frozen exercise")
+
+    def pop(self, index: int) -> GeneratorClass:
+        raise TypeError("Can't pop task from frozen exercise")
+
+    def notes(self) -> FrozenSet[str]:
+        return self._notes
+
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def tasks(self) -> Tuple[GeneratorClass]:
+        return self._subgenerators
+
+    def _variants_table(
+            self,
+            stress: bool = False
+    ) -> Sequence[Sequence[tuple]]:
+        # Stress values are huge, so they are never cached
+        if stress:
+            return super()._variants_table(stress)
+        return self._variants
+
+    def _description_tasks(self) -> str:
+        return self._text_tasks
+
+    def _description_notes(self) -> str:
+        return self._text_notes
@@ -0,0 +1,126 @@
+# Python Imports
+import json
+import os
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple
+
+__all__ = (
+    'FailureStatistics',
+)
+
+DEFAULT_SECONDS = 1e-4
+"""Expected check time of task case, that was never checked"""
+
+Variant = Tuple[Tuple[int, ...], List[tuple]]
+"""Check cases indexes and arguments of variant"""
+
+
+class FailureStatistics:
+    """Failure rates and check times of each task check case.
+    Used to check variants, that most likely to fail and cheapest,
+    first. If path passed, statistics loaded from JSON file and can
+    be saved back to it with save()
+    """
+    __slots__ = ('_cases', 'path', '_lock')
+
+    def __init__(self, path: Optional[str] = None):
+        self._cases: Dict[str, List[float]] = {}
+        """'Task:case' (or 'Task:stress:case') -> [runs, failures, seconds]"""
+        self.path: Optional[str] = path
+        self._lock = Lock()
+        if path is not None and os.path.exists(path):
+            with open(path, encoding='utf-8') as file:
+                self._cases = json.load(file)
+
+    @staticmethod
+    def _key(task: str, case: int, stress: bool = False) -> str:
+        # Stress cases share indexes with ordinary ones, but not timings
+        if stress:
+            return f"{task}:stress:{case}"
+        return f"{task}:{case}"
+
+    def record(
+            self,
+            task: str,
+            case: int,
+            failed: bool,
+            seconds: float,
+            stress: bool = False
+    ) -> None:
+        """Records result of task check case
+        :param task: Task name
+        :param case: Index of check case
+        :param failed: True, if check failed
+        :param seconds: Time spent on check
+        :param stress: Case is stress check case
+        """
+        key = self._key(task, case, stress)
+        with self._lock:
+            values = self._cases.setdefault(key, [0, 0, 0.0])
+            values[0] += 1
+            values[1] += failed
+            values[2] += seconds
+
+    def failure_rate(
+            self,
+            task: str,
+            case: int,
+            stress: bool = False
+    ) -> float:
+        """Returns smoothed failure probability of task check case"""
+        runs, failures, _ = self._cases.get(
+            self._key(task, case, stress), (0, 0, 0)
+        )
+        return (failures + 1) / (runs + 2)
+
+    def expected_seconds(
+            self,
+            task: str,
+            case: int,
+            default: float = DEFAULT_SECONDS,
+            stress: bool = False
+    ) -> float:
+        """Returns mean check time of task check case or default,
+        if case was never checked
+        """
+        runs, _, seconds = self._cases.get(
+            self._key(task, case, stress), (0, 0, 0)
+        )
+        return seconds / runs if runs else default
+
+    def order(
+            self,
+            tasks: Sequence[str],
+            variants: Sequence[Variant],
+            stress: bool = False
+    ) -> List[Variant]:
+        """Returns variants sorted by failure probability per second
+        :param tasks: Names of exercise tasks
+        :param variants: Check cases indexes and arguments of each variant
+        :param stress: Variants consist of stress check cases
+        :rtype: List[Tuple[Tuple[int, ...], List[tuple]]]
+        """
+        def score(variant: Variant) -> float:
+            passing = 1.0
+            seconds = 0.0
+            for task, case in zip(tasks, variant[0]):
+                passing *= 1 - self.failure_rate(task, case, stress)
+                seconds += self.expected_seconds(
+                    task, case, DEFAULT_SECONDS, stress
+                )
+            return (1 - passing) / seconds
+
+        return sorted(variants, key=score, reverse=True)
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Writes statistics to JSON file atomically"""
+        path = path or self.path
+        assert path is not None, "Path to statistics file not defined"
+        with NamedTemporaryFile(
+                'w', encoding='utf-8', suffix='.tmp', delete=False,
+                dir=os.path.dirname(os.path.abspath(path))
+        ) as file:
+            with self._lock:
+                json.dump(self._cases, file)
+        os.replace(file.name, path)
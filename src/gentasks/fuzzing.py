@@ -0,0 +1,303 @@
+# Python Imports
+import ast
+import collections.abc
+import dataclasses
+import json
+import os
+from random import Random
+from string import ascii_letters, digits
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from time import perf_counter
+from types import GeneratorType
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional
+from typing import Tuple, Type, TypeVar, get_args, get_origin
+
+# Module Imports
+from .exercise import Exercise, copy_arguments
+from .tasktypes import GeneratorDefaultTask
+
+__all__ = (
+    'Counterexample',
+    'CounterexampleCache',
+    'draw_arguments',
+    'fuzz'
+)
+
+GeneratorClass = Type[GeneratorDefaultTask]
+Arguments = List[tuple]
+"""Arguments of each exercise task"""
+
+SYMBOLS = ascii_letters + digits
+"""Symbols of drawn strings"""
+
+_ITERABLES = (
+    collections.abc.Iterable, collections.abc.Sequence,
+    collections.abc.Collection, list, tuple
+)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Counterexample:
+    """Minimal found arguments, on which submission fails"""
+    arguments: Arguments
+    error: str
+    message: str
+    cases: int
+    """Amount of random cases checked before failure"""
+    shrinks: int
+    """Amount of successful shrinking steps"""
+
+
+def _draw(annotation: Any, random: Random, size: int) -> Any:
+    """Returns random value of annotated type"""
+    origin = get_origin(annotation) or annotation
+    if isinstance(annotation, TypeVar) or annotation is Any:
+        origin = int
+    if origin is bool:
+        return random.random() < 0.5
+    if origin is int:
+        return random.randint(-size, size)
+    if origin is float:
+        return random.uniform(-size, size)
+    if origin is str:
+        return ''.join(
+            random.choice(SYMBOLS) for _ in range(random.randint(0, size))
+        )
+    if origin in _ITERABLES:
+        element = (get_args(annotation) or (int,))[0]
+        if origin in (collections.abc.Iterable, collections.abc.Sequence) \
+                and random.random() < 0.2:
+            return _draw(str, random, size)
+        values = [
+            _draw(element, random, size)
+            for _ in range(random.randint(0, size))
+        ]
+        if origin is list or origin is not tuple and random.random() < 0.5:
+            return values
+        return tuple(values)
+    raise TypeError(f"Can't draw value of type {annotation}")
+
+
+def draw_arguments(
+        task: GeneratorClass,
+        random: Random,
+        size: int = 10,
+        attempts: int = 100
+) -> tuple:
+    """Returns random arguments of task. Values are drawn by types from
+    needed_arguments() and rejected, if task refuses them
+    :param task: Task class
+    :param random: Random generator
+    :param size: Maximum absolute value of numbers and length of sequences
+    :param attempts: Maximum amount of rejected draws
+    :raises ValueError: if no valid arguments drawn
+    :rtype: tuple
+    """
+    annotations = list(task.needed_arguments().values())
+    for _ in range(attempts):
+        arguments = tuple(_draw(i, random, size) for i in annotations)
+        if _valid(task, arguments):
+            return arguments
+    raise ValueError(f"Can't draw valid arguments of {task.__qualname__}")
+
+
+def _valid(task: GeneratorClass, arguments: tuple) -> bool:
+    try:
+        task(*arguments)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _run(
+        tasks: Tuple[GeneratorClass, ...],
+        generator: Callable[[Any], Generator],
+        arguments: Arguments
+) -> Optional[Exception]:
+    """Checks submission on arguments, returns raised exception.
+    Submission gets copy, so arguments stay intact for reference tasks
+    and counterexample
+    """
+    try:
+        gen = generator(*copy_arguments(arguments))
+        if type(gen) != GeneratorType:
+            raise TypeError("Функция(/генератор) не "
+                            "вернула валидный генератор")
+        for argument, genclass in zip(arguments, tasks):
+            genclass(*argument).check_generator(gen)
+    except Exception as e:
+        return e
+    return None
+
+
+def _smaller(value: Any) -> Iterator[Any]:
+    """Yields simpler variants of value"""
+    if isinstance(value, bool):
+        if value:
+            yield False
+    elif isinstance(value, int):
+        if value:
+            yield 0
+            yield value // 2 if value > 0 else -(-value // 2)
+            yield value - 1 if value > 0 else value + 1
+        if value < 0:
+            yield -value
+    elif isinstance(value, float):
+        if value:
+            yield 0.0
+            yield float(int(value))
+    elif isinstance(value, (str, list, tuple)):
+        length = len(value)
+        if length:
+            yield value[:0]
+            yield value[:length // 2]
+            yield value[length // 2:]
+            for index in range(length):
+                yield value[:index] + value[index+1:]
+        if isinstance(value, (list, tuple)):
+            for index, element in enumerate(value):
+                for smaller in _smaller(element):
+                    changed = list(value)
+                    changed[index] = smaller
+                    yield type(value)(changed)
+
+
+def _shrink(
+        tasks: Tuple[GeneratorClass, ...],
+        generator: Callable[[Any], Generator],
+        arguments: Arguments,
+        error: Exception,
+        budget: int
+) -> Tuple[Arguments, Exception, int]:
+    """Greedily replaces values with simpler ones, while submission
+    still fails with same exception type
+    """
+    shrinks = 0
+    improved = True
+    while improved and budget > 0:
+        improved = False
+        for task_index, task in enumerate(tasks):
+            for value_index, value in enumerate(arguments[task_index]):
+                for smaller in _smaller(value):
+                    if budget <= 0:
+                        break
+                    argument = list(arguments[task_index])
+                    argument[value_index] = smaller
+                    argument = tuple(argument)
+                    if not _valid(task, argument):
+                        continue
+                    budget -= 1
+                    candidate = list(arguments)
+                    candidate[task_index] = argument
+                    new_error = _run(tasks, generator, candidate)
+                    if type(new_error) is type(error):
+                        arguments, error = candidate, new_error
+                        shrinks += 1
+                        improved = True
+                        break
+                if improved:
+                    break
+            if improved:
+                break
+    return arguments, error, shrinks
+
+
+class CounterexampleCache:
+    """Found counterexamples by exercise, stored in JSON file as Python
+    literals. Checked first on next fuzzing of same exercise
+    """
+    __slots__ = ('path', '_cases', '_lock')
+
+    def __init__(self, path: Optional[str] = None):
+        self.path: Optional[str] = path
+        self._cases: Dict[str, List[str]] = {}
+        self._lock = Lock()
+        if path is not None and os.path.exists(path):
+            with open(path, encoding='utf-8') as file:
+                self._cases = json.load(file)
+
+    @staticmethod
+    def key(exercise: Exercise) -> str:
+        return '+'.join(exercise.names())
+
+    def get(self, exercise: Exercise) -> List[Arguments]:
+        return [
+            ast.literal_eval(case)
+            for case in self._cases.get(self.key(exercise), ())
+        ]
+
+    def add(self, exercise: Exercise, arguments: Arguments) -> None:
+        """Stores counterexample and saves file, if path defined"""
+        case = repr(arguments)
+        with self._lock:
+            cases = self._cases.setdefault(self.key(exercise), [])
+            if case in cases:
+                return
+            cases.append(case)
+            if self.path is None:
+                return
+            with NamedTemporaryFile(
+                    'w', encoding='utf-8', suffix='.tmp', delete=False,
+                    dir=os.path.dirname(os.path.abspath(self.path))
+            ) as file:
+                json.dump(self._cases, file)
+            os.replace(file.name, self.path)
+
+
+def fuzz(
+        exercise: Exercise,
+        generator: Callable[[Any], Generator],
+        max_cases: int = 1000,
+        time_limit: Optional[float] = None,
+        size: int = 20,
+        seed: Optional[int] = None,
+        cache: Optional[CounterexampleCache] = None,
+        shrink_budget: int = 1000
+) -> Optional[Counterexample]:
+    """Checks submission on random valid arguments against reference
+    generators of tasks. Sizes of arguments grow from small to size.
+    Failing arguments are shrunk to minimal case
+    :param exercise: Exercise to check
+    :param generator: Function, that returns generator
+    :param max_cases: Maximum amount of random cases
+    :param time_limit: Maximum seconds of random cases
+    :param size: Maximum absolute value of numbers and length of sequences
+    :param seed: Seed of random generator
+    :param cache: Counterexamples, checked before random cases.
+        New counterexample is added to cache
+    :param shrink_budget: Maximum amount of checks while shrinking
+    :return: Counterexample or None, if none found
+    :rtype: Optional[Counterexample]
+    """
+    tasks = tuple(exercise.tasks())
+    if cache is not None:
+        for arguments in cache.get(exercise):
+            error = _run(tasks, generator, arguments)
+            if error is not None:
+                return Counterexample(
+                    arguments, type(error).__name__, str(error), 0, 0
+                )
+
+    random = Random(seed)
+    deadline = None if time_limit is None else perf_counter() + time_limit
+    for case in range(max_cases):
+        if deadline is not None and perf_counter() > deadline:
+            break
+        current_size = 1 + case * size // max(max_cases, 1)
+        arguments = [
+            draw_arguments(task, random, current_size) for task in tasks
+        ]
+        error = _run(tasks, generator, arguments)
+        if error is None:
+            continue
+
+        arguments, error, shrinks = _shrink(
+            tasks, generator, arguments, error, shrink_budget
+        )
+        if cache is not None:
+            cache.add(exercise, arguments)
+        return Counterexample(
+            arguments, type(error).__name__, str(error), case + 1, shrinks
+        )
+    return None
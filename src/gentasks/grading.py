@@ -0,0 +1,260 @@
+# Python Imports
+import json
+import os
+import signal
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor
+from concurrent.futures import wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+from typing import TextIO
+
+# Module Imports
+from .coverage import Coverage
+from .identifiers import decode, from_string
+from .loader import SubmissionLoader
+from .verdict_cache import Verdict
+
+__all__ = (
+    'read_submissions',
+    'completed',
+    'grade_submission',
+    'grade'
+)
+
+Record = Dict[str, Any]
+"""Submission: 'id', 'exercise' (identifier string) and 'source'"""
+
+_loader: Optional[SubmissionLoader] = None
+
+
+def read_submissions(
+        path: str,
+        exercise: Optional[str] = None
+) -> Iterator[Record]:
+    """Streams submissions from JSONL file or directory of .py files.
+    Directory files are identified by name without extension
+    :param path: JSONL file or directory
+    :param exercise: Exercise identifier for submissions without one
+    :rtype: Iterator[Dict[str, Any]]
+    """
+    if os.path.isdir(path):
+        for entry in sorted(os.scandir(path), key=lambda i: i.name):
+            if not entry.is_file() or not entry.name.endswith('.py'):
+                continue
+            with open(entry.path, encoding='utf-8') as file:
+                yield {
+                    'id': entry.name[:-len('.py')],
+                    'exercise': exercise,
+                    'source': file.read()
+                }
+        return
+
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            record.setdefault('exercise', exercise)
+            record['id'] = str(record['id'])
+            yield record
+
+
+def completed(path: str) -> Set[str]:
+    """Returns identifiers of submissions, already written to output.
+    Incomplete last line of interrupted run is removed from file
+    """
+    if not os.path.exists(path):
+        return set()
+    with open(path, 'rb+') as file:
+        data = file.read()
+        end = data.rfind(b'\n') + 1
+        if end != len(data):
+            file.truncate(end)
+    done: Set[str] = set()
+    for line in data[:end].splitlines():
+        if line.strip():
+            done.add(str(json.loads(line)['id']))
+    return done
+
+
+class _Timeout(Exception):
+    pass
+
+
+def _alarm(*args) -> None:
+    raise _Timeout()
+
+
+def grade_submission(
+        record: Record,
+        coverage: str = Coverage.ONE_FACTOR.value,
+        timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """Checks one submission. Runs in worker process
+    :param record: Submission
+    :param coverage: Value of Coverage
+    :param timeout: Maximum seconds of check (POSIX only)
+    :return: Submission id and verdict fields
+    :rtype: Dict[str, Any]
+    """
+    global _loader
+    if _loader is None:
+        _loader = SubmissionLoader()
+
+    use_alarm = timeout is not None and hasattr(signal, 'setitimer')
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        if not record.get('exercise'):
+            raise ValueError("Submission has no exercise identifier")
+        exercise = decode(from_string(record['exercise']))
+        function = _loader.load(record['source'], exercise=exercise)
+        exercise.check_generator(function, Coverage(coverage))
+    except _Timeout:
+        verdict = Verdict(False, 'TimeoutError',
+                          f"Проверка не завершилась за {timeout} с")
+    except KeyboardInterrupt:
+        raise
+    except BaseException as e:
+        # SystemExit and others raised by submission are verdicts too,
+        # otherwise they stop the whole run
+        verdict = Verdict(False, type(e).__qualname__, str(e))
+    else:
+        verdict = Verdict.from_exception(None)
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+    return {
+        'id': record['id'], 'passed': verdict.passed,
+        'error': verdict.error, 'message': verdict.message
+    }
+
+
+def _crashed(record: Record) -> Dict[str, Any]:
+    """Returns result of submission, that killed worker process"""
+    return {
+        'id': record['id'], 'passed': False, 'error': 'BrokenProcessPool',
+        'message': "Процесс проверки аварийно завершился"
+    }
+
+
+def _write(output: TextIO, result: Dict[str, Any]) -> None:
+    output.write(json.dumps(result, ensure_ascii=False) + '\n')
+    output.flush()
+
+
+def grade(
+        submissions: Iterable[Record],
+        output: str,
+        jobs: Optional[int] = None,
+        coverage: Coverage = Coverage.ONE_FACTOR,
+        timeout: Optional[float] = None
+) -> Dict[str, int]:
+    """Grades submissions in process pool and appends results to JSONL
+    output as soon as they complete. Submissions, that are already in
+    output, are skipped, so interrupted run continues where it stopped.
+    At most 2 * jobs submissions are held in memory. Submission, that
+    kills worker process, gets BrokenProcessPool verdict and pool is
+    restarted (in current process mode it kills the run)
+    :param submissions: Stream of submissions
+    :param output: Path to JSONL file with results
+    :param jobs: Amount of worker processes. 0 means check in current
+        process, None means amount of CPUs
+    :param coverage: Strategy of combining tasks check cases
+    :param timeout: Maximum seconds of one check (POSIX only)
+    :return: Amounts of graded, passed and skipped submissions
+    :rtype: Dict[str, int]
+    """
+    coverage = Coverage(coverage).value
+    done = completed(output)
+    counts = {'graded': 0, 'passed': 0, 'skipped': 0}
+
+    def account(result: Dict[str, Any]) -> None:
+        _write(file, result)
+        counts['graded'] += 1
+        counts['passed'] += result['passed']
+
+    with open(output, 'a', encoding='utf-8') as file:
+        if jobs == 0:
+            for record in submissions:
+                if record['id'] in done:
+                    counts['skipped'] += 1
+                    continue
+                account(grade_submission(record, coverage, timeout))
+            return counts
+
+        if jobs is None:
+            jobs = os.cpu_count() or 1
+        limit = 2 * jobs
+        executor = ProcessPoolExecutor(jobs)
+        pending: Dict[Future, Record] = {}
+
+        def restart() -> None:
+            nonlocal executor
+            executor.shutdown()
+            executor = ProcessPoolExecutor(jobs)
+
+        def collect(finished: Iterable[Future]) -> bool:
+            """Accounts finished futures. If submission killed worker,
+            all pending futures fail: they are waited, pool is restarted
+            and failed submissions are checked one by one, so only
+            submission, that kills worker again, gets crash verdict
+            :return: True, if pool was restarted
+            """
+            suspects: List[Record] = []
+            for future in list(finished):
+                record = pending.pop(future)
+                try:
+                    account(future.result())
+                except BrokenProcessPool:
+                    suspects.append(record)
+            if not suspects:
+                return False
+
+            for future in wait(pending).done:
+                record = pending.pop(future)
+                try:
+                    account(future.result())
+                except BrokenProcessPool:
+                    suspects.append(record)
+            restart()
+            for record in suspects:
+                future = executor.submit(
+                    grade_submission, record, coverage, timeout
+                )
+                try:
+                    account(future.result())
+                except BrokenProcessPool:
+                    account(_crashed(record))
+                    restart()
+            return True
+
+        def submit(record: Record) -> None:
+            try:
+                future = executor.submit(
+                    grade_submission, record, coverage, timeout
+                )
+            except BrokenProcessPool:
+                # Pool broke before it's futures were collected
+                if not collect(list(pending)):
+                    restart()
+                future = executor.submit(
+                    grade_submission, record, coverage, timeout
+                )
+            pending[future] = record
+
+        try:
+            for record in submissions:
+                if record['id'] in done:
+                    counts['skipped'] += 1
+                    continue
+                if len(pending) >= limit:
+                    collect(wait(pending, return_when=FIRST_COMPLETED).done)
+                submit(record)
+            while pending:
+                collect(wait(pending, return_when=FIRST_COMPLETED).done)
+        finally:
+            executor.shutdown()
+    return counts
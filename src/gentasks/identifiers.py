@@ -0,0 +1,198 @@
+# Python Imports
+from math import factorial
+from string import digits, ascii_letters
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Type
+from zlib import crc32
+
+# Module Imports
+from .exercise import Exercise, FrozenExercise
+from .plugins import LazyTask
+from .tasktypes import TASKS, GeneratorDefaultTask
+
+__all__ = (
+    'ExerciseCodec',
+    'encode',
+    'decode',
+    'encode_many',
+    'decode_many',
+    'to_string',
+    'from_string'
+)
+
+GeneratorClass = Type[GeneratorDefaultTask]
+
+VERSION_BITS = 16
+"""Amount of lower bits, that contains registry version"""
+
+ALPHABET = digits + ascii_letters
+"""Symbols used in string representation of identifiers"""
+
+
+class ExerciseCodec:
+    """Converts exercises to compact integers and back.
+    Identifier layout (from lower bits to higher):
+    1. Registry version (VERSION_BITS bits)
+    2. Bitmask of tasks, positions corresponding to registry order
+    3. Rank of tasks permutation inside exercise
+    """
+    __slots__ = ('_tasks', '_index', 'version')
+
+    def __init__(self, tasks: Sequence[GeneratorClass]):
+        self._tasks: Tuple[GeneratorClass, ...] = tuple(tasks)
+        self._index: Dict[GeneratorClass, int] = {
+            task: index for index, task in enumerate(self._tasks)
+        }
+        names = ','.join(task.__qualname__ for task in self._tasks)
+        self.version: int = crc32(names.encode()) & ((1 << VERSION_BITS) - 1)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def _positions(self, tasks: Iterable[GeneratorClass]) -> List[int]:
+        try:
+            return [self._index[task] for task in tasks]
+        except KeyError as e:
+            raise ValueError(f"Task {e.args[0]} not in registry") from None
+
+    def encode(self, exercise: Exercise) -> int:
+        """Returns identifier of exercise
+        :raises ValueError: if exercise contains task outside registry
+            or same task twice
+        """
+        positions = self._positions(exercise.tasks())
+        if len(set(positions)) != len(positions):
+            raise ValueError("Can't encode exercise with repeated tasks")
+
+        mask = 0
+        for position in positions:
+            mask |= 1 << position
+
+        # Lehmer code of permutation
+        rank = 0
+        length = len(positions)
+        for index, position in enumerate(positions):
+            smaller = sum(1 for i in positions[index+1:] if i < position)
+            rank += smaller * factorial(length - index - 1)
+
+        return (
+            (((rank << len(self._tasks)) | mask) << VERSION_BITS)
+            | self.version
+        )
+
+    def encode_set(self, tasks: Iterable[GeneratorClass]) -> int:
+        """Returns identifier of tasks set regardless of their order.
+        Same as identifier of exercise with tasks in registry order
+        :raises ValueError: if task outside registry
+        """
+        mask = 0
+        for position in self._positions(tasks):
+            mask |= 1 << position
+        return (mask << VERSION_BITS) | self.version
+
+    def decode(self, identifier: int) -> FrozenExercise:
+        """Returns exercise from identifier
+        :raises ValueError: if identifier created for another registry
+            or corrupted
+        """
+        assert isinstance(identifier, int)
+        if identifier & ((1 << VERSION_BITS) - 1) != self.version:
+            raise ValueError("Identifier was created for another registry")
+        identifier >>= VERSION_BITS
+
+        mask = identifier & ((1 << len(self._tasks)) - 1)
+        rank = identifier >> len(self._tasks)
+        positions = [i for i in range(len(self._tasks)) if mask >> i & 1]
+        if not positions or rank >= factorial(len(positions)):
+            raise ValueError("Invalid identifier")
+
+        tasks: List[GeneratorClass] = []
+        for index in range(len(positions)-1, -1, -1):
+            position, rank = divmod(rank, factorial(index))
+            tasks.append(self._tasks[positions.pop(position)])
+        return FrozenExercise(tasks)
+
+    def encode_many(self, exercises: Iterable[Exercise]) -> List[int]:
+        """Returns identifiers of exercises. Convenience loop over
+        encode(): identifiers are arbitrary precision integers, which
+        don't fit in fixed width arrays
+        :raises ValueError: same as encode()
+        """
+        encode = self.encode
+        return [encode(exercise) for exercise in exercises]
+
+    def decode_many(self, identifiers: Iterable[int]) -> List[FrozenExercise]:
+        """Returns exercises from identifiers. Convenience loop over
+        decode(), repeated identifiers are decoded once
+        :raises ValueError: same as decode()
+        """
+        decoded: Dict[int, FrozenExercise] = {}
+        exercises: List[FrozenExercise] = []
+        for identifier in identifiers:
+            exercise = decoded.get(identifier)
+            if exercise is None:
+                exercise = decoded[identifier] = self.decode(identifier)
+            exercises.append(exercise)
+        return exercises
+
+
+_codec: Optional[ExerciseCodec] = None
+
+_registry_size: int = 0
+"""Size of TASKS, when default codec was built"""
+
+
+def _default_codec() -> ExerciseCodec:
+    """Returns codec over global registry without plugin tasks, so
+    installing plugin doesn't change version of issued identifiers.
+    Exercises with plugin tasks are encoded by ExerciseCodec(TASKS).
+    Registry only grows, so codec rebuilt only when new task types
+    registered
+    """
+    global _codec, _registry_size
+    if _codec is None or _registry_size != len(TASKS):
+        _registry_size = len(TASKS)
+        _codec = ExerciseCodec(
+            [task for task in TASKS if not issubclass(task, LazyTask)]
+        )
+    return _codec
+
+
+def encode(exercise: Exercise) -> int:
+    return _default_codec().encode(exercise)
+
+
+def decode(identifier: int) -> FrozenExercise:
+    return _default_codec().decode(identifier)
+
+
+def encode_many(exercises: Iterable[Exercise]) -> List[int]:
+    return _default_codec().encode_many(exercises)
+
+
+def decode_many(identifiers: Iterable[int]) -> List[FrozenExercise]:
+    return _default_codec().decode_many(identifiers)
+
+
+def to_string(identifier: int) -> str:
+    """Returns short string representation of identifier"""
+    assert isinstance(identifier, int) and identifier >= 0
+    base = len(ALPHABET)
+    symbols = []
+    while True:
+        identifier, index = divmod(identifier, base)
+        symbols.append(ALPHABET[index])
+        if not identifier:
+            break
+    return ''.join(reversed(symbols))
+
+
+def from_string(string: str) -> int:
+    """Returns identifier from it's string representation"""
+    base = len(ALPHABET)
+    identifier = 0
+    for symbol in string:
+        index = ALPHABET.find(symbol)
+        if index == -1:
+            raise ValueError(f"Invalid symbol {symbol!r} in identifier")
+        identifier = identifier * base + index
+    return identifier
@@ -0,0 +1,191 @@
+# Python Imports
+import builtins
+import marshal
+import os
+from collections import OrderedDict
+from contextlib import suppress
+from hashlib import sha256
+from importlib.util import MAGIC_NUMBER
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from types import CodeType
+from typing import Any, Callable, Generator, Optional, TYPE_CHECKING
+
+# Module Imports
+from .constants import LOADER_CACHE_SIZE, LOADER_DISK_CACHE_SIZE
+from .metrics import CACHE_REQUESTS
+from .validation import prevalidate_code
+
+if TYPE_CHECKING:
+    from .exercise import Exercise
+
+__all__ = (
+    'SubmissionLoader',
+)
+
+SUBMISSION_FILENAME = '<submission>'
+
+
+class SubmissionLoader:
+    """Turns submission source into function, that returns generator.
+    Compiled code objects cached in memory (least recently used evicted
+    after maxsize) and, if directory passed, marshalled on disk
+    (when there are more than max_files, least recently used files
+    removed, until a quarter of max_files is free)
+    """
+    __slots__ = (
+        '_codes', 'maxsize', 'directory', 'max_files', 'hits', 'misses',
+        '_lock', '_files'
+    )
+
+    def __init__(
+            self,
+            directory: Optional[str] = None,
+            maxsize: int = LOADER_CACHE_SIZE,
+            max_files: int = LOADER_DISK_CACHE_SIZE
+    ):
+        self._codes: OrderedDict[str, CodeType] = OrderedDict()
+        self.maxsize: int = maxsize
+        self.directory: Optional[str] = directory
+        self.max_files: int = max_files
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock = Lock()
+        self._files: int = 0
+        """Amount of files on disk, counted on start and by writes,
+        so directory is scanned only for trimming"""
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._files = sum(
+                entry.name.endswith('.marshal')
+                for entry in os.scandir(directory)
+            )
+
+    @staticmethod
+    def key(source: str) -> str:
+        """Returns hash of source. Interpreter magic number included,
+        because marshalled code is not compatible between versions
+        """
+        return sha256(MAGIC_NUMBER + source.encode()).hexdigest()
+
+    def code(self, source: str) -> CodeType:
+        """Returns compiled module code of submission
+        :raises SyntaxError: if source can't be compiled
+        """
+        key = self.key(source)
+        with self._lock:
+            code = self._codes.get(key)
+            if code is not None:
+                self._codes.move_to_end(key)
+                self.hits += 1
+                CACHE_REQUESTS.inc(cache='loader', result='memory')
+                return code
+
+        # Disk access and compilation run outside of lock
+        code = self._read(key)
+        hit = code is not None
+        if not hit:
+            code = compile(source, SUBMISSION_FILENAME, 'exec')
+            try:
+                self._write(key, code)
+            except OSError:
+                # Read-only or full disk, code is used without storing
+                pass
+
+        CACHE_REQUESTS.inc(cache='loader', result='disk' if hit else 'miss')
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self._codes[key] = code
+            self._codes.move_to_end(key)
+            if len(self._codes) > self.maxsize:
+                self._codes.popitem(last=False)
+        return code
+
+    def load(
+            self,
+            source: str,
+            name: str = 'main',
+            exercise: Optional['Exercise'] = None
+    ) -> Callable[[Any], Generator]:
+        """Executes submission and returns function from it
+        :param source: Submission source code
+        :type source: str
+        :param name: Name of function, that should be returned
+        :type name: str
+        :param exercise: If passed, submission statically checked against
+            exercise before execution
+        :type exercise: Optional[Exercise]
+        :return: Function, that returns generator
+        :raises SyntaxError: if source can't be compiled
+        :raises SubmissionRejected: if submission failed static checks
+        :raises ValueError: if submission doesn't define function
+        """
+        code = self.code(source)
+        if exercise is not None:
+            prevalidate_code(code, exercise, name)
+
+        namespace = {'__name__': '__submission__', '__builtins__': builtins}
+        exec(code, namespace)
+        function = namespace.get(name)
+        if not callable(function):
+            raise ValueError(f"Submission doesn't define function {name}")
+        return function
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.marshal')
+
+    def _read(self, key: str) -> Optional[CodeType]:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                code = marshal.load(file)
+            os.utime(path)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return code if isinstance(code, CodeType) else None
+
+    def _write(self, key: str, code: CodeType) -> None:
+        """Stores code on disk
+        :raises OSError: if file can't be written
+        """
+        if self.directory is None:
+            return
+        file = NamedTemporaryFile(
+            'wb', dir=self.directory, suffix='.tmp', delete=False
+        )
+        try:
+            with file:
+                marshal.dump(code, file)
+            os.replace(file.name, self._path(key))
+        except BaseException:
+            with suppress(OSError):
+                os.remove(file.name)
+            raise
+
+        with self._lock:
+            self._files += 1
+            if self._files > self.max_files:
+                self._trim()
+
+    def _trim(self) -> None:
+        """Removes least recently used files, until a quarter of
+        max_files is free. Called under lock
+        """
+        entries = [
+            entry for entry in os.scandir(self.directory)
+            if entry.name.endswith('.marshal')
+        ]
+        keep = self.max_files - self.max_files // 4
+        entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+        self._files = len(entries)
+        for entry in entries[:max(len(entries) - keep, 0)]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                continue
+            self._files -= 1
@@ -0,0 +1,333 @@
+# Python Imports
+import os
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from tempfile import NamedTemporaryFile
+from threading import Lock, Thread
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Module Imports
+from . import exceptions
+
+__all__ = (
+    'Counter',
+    'Gauge',
+    'Histogram',
+    'Registry',
+    'REGISTRY',
+    'CHECKS',
+    'CHECK_SECONDS',
+    'TASK_CHECKS',
+    'TASK_CHECK_SECONDS',
+    'QUERIES',
+    'CACHE_REQUESTS',
+    'QUEUE_DEPTH',
+    'verdict_label',
+    'record_check'
+)
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0
+)
+"""Upper bounds of latency histogram buckets in seconds"""
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    )
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    pairs = ','.join(
+        f'{name}="{_escape(str(value))}"'
+        for name, value in zip(names, values)
+    )
+    return '{' + pairs + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """Metric with fixed label names. Values are kept per label values"""
+    __slots__ = ('name', 'documentation', 'labels', '_values', '_lock')
+    kind: str = ''
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            labels: Sequence[str] = (),
+            registry: Optional['Registry'] = None
+    ):
+        self.name: str = name
+        self.documentation: str = documentation
+        self.labels: Tuple[str, ...] = tuple(labels)
+        self._values: Dict[Labels, object] = {}
+        self._lock = Lock()
+        if registry is not None:
+            registry.register(self)
+
+    def _key(self, labels: Dict[str, str]) -> Labels:
+        try:
+            if len(labels) == len(self.labels):
+                return tuple([labels[name] for name in self.labels])
+        except KeyError:
+            pass
+        raise ValueError(f"Metric {self.name} requires labels "
+                         f"{', '.join(self.labels)}")
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        """Yields name suffix, formatted labels and value of samples"""
+        raise NotImplementedError()
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.kind}"
+        ]
+        for suffix, labels, value in self.samples():
+            lines.append(
+                f"{self.name}{suffix}{labels} {_format_value(value)}"
+            )
+        return '\n'.join(lines)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    """Monotonic counter. Exported with _total suffix"""
+    __slots__ = ()
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in sorted(values):
+            yield '_total', _format_labels(self.labels, key), value
+
+
+class Gauge(_Metric):
+    __slots__ = ()
+    kind = 'gauge'
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in sorted(values):
+            yield '', _format_labels(self.labels, key), value
+
+
+class Histogram(_Metric):
+    """Histogram with cumulative buckets. For each label values keeps
+    counts of buckets, sum and count of observations
+    """
+    __slots__ = ('buckets',)
+    kind = 'histogram'
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            labels: Sequence[str] = (),
+            registry: Optional['Registry'] = None,
+            buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        super().__init__(name, documentation, labels, registry)
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            values = self._values.get(key)
+            if values is None:
+                values = self._values[key] = [0] * (len(self.buckets) + 3)
+            values[index] += 1
+            values[-2] += value
+            values[-1] += 1
+
+    def count(self, **labels: str) -> int:
+        values = self._values.get(self._key(labels))
+        return values[-1] if values else 0
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        with self._lock:
+            values = [(key, list(i)) for key, i in self._values.items()]
+        names = self.labels + ('le',)
+        for key, counts in sorted(values):
+            cumulative = 0
+            for bound, count in zip(
+                    self.buckets + (float('inf'),), counts
+            ):
+                cumulative += count
+                yield '_bucket', _format_labels(
+                    names, key + (_format_value(bound),)
+                ), cumulative
+            labels = _format_labels(self.labels, key)
+            yield '_sum', labels, counts[-2]
+            yield '_count', labels, counts[-1]
+
+
+class Registry:
+    """Collection of metrics, rendered in Prometheus text format"""
+    __slots__ = ('_metrics', '_lock')
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._lock = Lock()
+
+    def register(self, metric: _Metric) -> None:
+        with self._lock:
+            if any(i.name == metric.name for i in self._metrics):
+                raise ValueError(f"Metric {metric.name} already registered")
+            self._metrics.append(metric)
+
+    def clear(self) -> None:
+        """Resets values of all metrics"""
+        for metric in self._metrics:
+            metric.clear()
+
+    def render(self) -> str:
+        return '\n'.join(metric.render() for metric in self._metrics) + '\n'
+
+    def write(self, path: str) -> None:
+        """Writes metrics to file atomically (for node_exporter
+        textfile collector)
+        """
+        with NamedTemporaryFile(
+                'w', encoding='utf-8', suffix='.tmp', delete=False,
+                dir=os.path.dirname(os.path.abspath(path))
+        ) as file:
+            file.write(self.render())
+        os.replace(file.name, path)
+
+    def serve(
+            self,
+            port: int = 0,
+            host: str = '127.0.0.1'
+    ) -> ThreadingHTTPServer:
+        """Starts HTTP endpoint with metrics in daemon thread.
+        Server stops with .shutdown()
+        :param port: Port to listen. 0 means any free port
+        :param host: Address to listen
+        :rtype: ThreadingHTTPServer
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header(
+                    'Content-Type', 'text/plain; version=0.0.4; charset=utf-8'
+                )
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        Thread(
+            target=server.serve_forever, name='gentasks-metrics', daemon=True
+        ).start()
+        return server
+
+
+REGISTRY = Registry()
+"""Registry, that gentasks metrics are registered in"""
+
+CHECKS = Counter(
+    'gentasks_checks', 'Exercise checks by verdict',
+    ('verdict',), REGISTRY
+)
+CHECK_SECONDS = Histogram(
+    'gentasks_check_seconds',
+    'Duration of exercise checks by mode (sync, async, report, cached) '
+    'and amount of tasks in exercise',
+    ('mode', 'tasks'), REGISTRY
+)
+TASK_CHECKS = Counter(
+    'gentasks_task_checks', 'Task checks by task type and verdict',
+    ('task', 'verdict'), REGISTRY
+)
+TASK_CHECK_SECONDS = Histogram(
+    'gentasks_task_check_seconds', 'Duration of task checks',
+    ('task',), REGISTRY
+)
+QUERIES = Counter(
+    'gentasks_queries', 'Exercise generator queries',
+    ('query',), REGISTRY
+)
+CACHE_REQUESTS = Counter(
+    'gentasks_cache_requests', 'Cache lookups by cache and result',
+    ('cache', 'result'), REGISTRY
+)
+QUEUE_DEPTH = Gauge(
+    'gentasks_queue_depth', 'Submissions waiting for grading worker',
+    (), REGISTRY
+)
+
+
+KNOWN_ERRORS = frozenset((
+    exceptions.GeneratorUnexpectedShutdown, exceptions.GeneratorWrongValue,
+    exceptions.GeneratorWrongType, exceptions.SubmissionRejected,
+    TypeError, ValueError, AttributeError, IndexError, KeyError,
+    NameError, ZeroDivisionError, StopIteration, RuntimeError,
+    RecursionError, MemoryError, TimeoutError, SyntaxError
+))
+"""Exception types, that have own verdict label"""
+
+
+def verdict_label(error: Optional[BaseException]) -> str:
+    """Returns verdict label of check result. Exception types are
+    chosen by submissions, so types outside KNOWN_ERRORS are labelled
+    'other' to keep amount of label values bounded
+    """
+    if error is None:
+        return 'passed'
+    if type(error) in KNOWN_ERRORS:
+        return type(error).__name__
+    return 'other'
+
+
+def record_check(
+        mode: str,
+        tasks: int,
+        error: Optional[BaseException],
+        seconds: float
+) -> None:
+    """Records verdict and duration of exercise check. Exercise is
+    labelled by amount of tasks, that is bounded by registry size
+    unlike set of tasks
+    """
+    CHECKS.inc(verdict=verdict_label(error))
+    CHECK_SECONDS.observe(seconds, mode=mode, tasks=str(tasks))
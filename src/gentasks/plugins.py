@@ -0,0 +1,184 @@
+# Python Imports
+from importlib import import_module
+from importlib.metadata import EntryPoint, entry_points
+from threading import Lock
+from typing import Any, Dict, Generator, Iterable, List, Mapping, Optional
+from typing import Set, Type
+import warnings
+
+# Module Imports
+from .constants import NOTES, PLUGINS_ENTRY_POINT, STRESS_LENGTH
+from .tasktypes import GeneratorDefaultTask, GeneratorTaskMeta
+
+__all__ = (
+    'PLUGINS',
+    'LazyTask',
+    'lazy_task',
+    'load_plugins'
+)
+
+PLUGINS: Dict[str, Type['LazyTask']] = {}
+"""Registered lazy tasks by name. Tasks are module attributes, so
+exercises with them can be pickled"""
+
+_points: Set[str] = set()
+"""Names of loaded entry points"""
+
+_lock = Lock()
+
+
+def __getattr__(name: str) -> Type['LazyTask']:
+    try:
+        return PLUGINS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+
+class LazyTask(GeneratorDefaultTask, register=False):
+    """Placeholder of third-party task type. Name, complexity, notes
+    and description are known from metadata, implementation module
+    is imported only on first use. Creating placeholder object creates
+    object of implementation class
+    """
+    __slots__ = ()
+
+    """Path to implementation class as 'module:Class'"""
+    implementation: str
+
+    """Text for students. None means taken from implementation"""
+    text: Optional[str] = None
+
+    _class: Optional[Type[GeneratorDefaultTask]] = None
+
+    def __new__(cls, *args, **kwargs) -> GeneratorDefaultTask:
+        return cls.load()(*args, **kwargs)
+
+    @classmethod
+    def loaded(cls) -> bool:
+        return cls._class is not None
+
+    @classmethod
+    def load(cls) -> Type[GeneratorDefaultTask]:
+        """Imports implementation class
+        :rtype: Type[GeneratorDefaultTask]
+        """
+        if cls._class is None:
+            module, _, name = cls.implementation.partition(':')
+            implementation = import_module(module)
+            for attribute in name.split('.'):
+                implementation = getattr(implementation, attribute)
+            assert isinstance(implementation, GeneratorTaskMeta), \
+                f"{cls.implementation} is not generator task class"
+            cls._class = implementation
+        return cls._class
+
+    @classmethod
+    def check_cases_generator(
+            cls
+    ) -> Generator[GeneratorDefaultTask, None, None]:
+        return cls.load().check_cases_generator()
+
+    @classmethod
+    def stress_cases_generator(
+            cls,
+            length: int = STRESS_LENGTH
+    ) -> Generator[GeneratorDefaultTask, None, None]:
+        return cls.load().stress_cases_generator(length)
+
+    @classmethod
+    def efficiency_case(
+            cls,
+            length: int = STRESS_LENGTH
+    ) -> Optional[GeneratorDefaultTask]:
+        return cls.load().efficiency_case(length)
+
+    @classmethod
+    def needed_arguments(cls) -> Dict[str, type]:
+        return cls.load().needed_arguments()
+
+    @classmethod
+    def description(cls) -> str:
+        if cls.text is not None:
+            return cls.text
+        return cls.load().description()
+
+
+def lazy_task(
+        metadata: Mapping[str, Any],
+        register: bool = True
+) -> Type[LazyTask]:
+    """Creates lazy task class from metadata
+    :param metadata: Keys 'name', 'complexity', 'implementation'
+        ('module:Class') and optional 'notes' (keys of NOTES)
+        and 'description'
+    :param register: Add task to TASKS and PLUGINS
+    :raises ValueError: if metadata is incomplete or contains unknown
+        notes
+    :rtype: Type[LazyTask]
+    """
+    if register and metadata.get('name') in PLUGINS:
+        raise ValueError(f"Task {metadata['name']} already registered")
+    for key in ('name', 'complexity', 'implementation'):
+        if key not in metadata:
+            raise ValueError(f"Task metadata has no '{key}' key")
+    if not isinstance(metadata['complexity'], int):
+        raise TypeError("Task complexity should be integer")
+    notes = set(metadata.get('notes', ()))
+    if not notes <= NOTES.keys():
+        raise ValueError(
+            f"Unknown notes: {', '.join(sorted(notes - NOTES.keys()))}"
+        )
+    task = GeneratorTaskMeta(
+        metadata['name'], (LazyTask,), {
+            '__slots__': (),
+            '__module__': __name__,
+            'complexity': metadata['complexity'],
+            'notes': notes,
+            'text': metadata.get('description'),
+            'implementation': metadata['implementation'],
+        },
+        register=register
+    )
+    if register:
+        PLUGINS[task.__qualname__] = task
+    return task
+
+
+def load_plugins(
+        points: Optional[Iterable[EntryPoint]] = None,
+        register: bool = True
+) -> List[Type[LazyTask]]:
+    """Creates lazy tasks from entry points of 'gentasks.tasks' group.
+    Entry point should refer to metadata dictionary, placed in module
+    without heavy imports. Entry point name is default task name.
+    Broken plugins are skipped with warning, already loaded entry
+    points are not loaded again
+    :param points: Entry points. By default all installed in group
+    :param register: Add tasks to TASKS and PLUGINS
+    :return: Created tasks
+    :rtype: List[Type[LazyTask]]
+    """
+    if points is None:
+        points = entry_points(group=PLUGINS_ENTRY_POINT)
+
+    tasks: List[Type[LazyTask]] = []
+    with _lock:
+        for point in points:
+            if register and point.name in _points:
+                continue
+            try:
+                metadata = dict(point.load())
+                metadata.setdefault('name', point.name)
+                task = lazy_task(metadata, register)
+            except Exception as e:
+                warnings.warn(
+                    f"Can't load task plugin {point.name}: {e!r}",
+                    RuntimeWarning
+                )
+                continue
+            if register:
+                _points.add(point.name)
+            tasks.append(task)
+    return tasks
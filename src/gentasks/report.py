@@ -0,0 +1,80 @@
+# Python Imports
+import dataclasses
+from typing import Any, Dict, List, Optional
+
+# Module Imports
+from .efficiency import EfficiencyResult
+
+__all__ = (
+    'Failure',
+    'Report'
+)
+
+
+@dataclasses.dataclass(slots=True)
+class Failure:
+    """Single failed check of exercise variant"""
+    variant: int
+    """Index of variant"""
+    arguments: list
+    """Arguments of variant, passed to checked function"""
+    error: str
+    """Name of raised exception type"""
+    message: str
+    task: Optional[str] = None
+    """Name of failed task. None, if failed before tasks check"""
+    task_index: Optional[int] = None
+    expected: Any = None
+    actual: Any = None
+    call: Optional[int] = None
+    """Index of generator call, that failed"""
+
+    @classmethod
+    def from_exception(
+            cls,
+            exception: Exception,
+            variant: int,
+            arguments: list,
+            task: Optional[str] = None,
+            task_index: Optional[int] = None
+    ) -> 'Failure':
+        return cls(
+            variant=variant,
+            arguments=arguments,
+            error=type(exception).__qualname__,
+            message=str(exception),
+            task=task,
+            task_index=task_index,
+            expected=getattr(exception, 'expected', None),
+            actual=getattr(exception, 'actual', None),
+            call=getattr(exception, 'call', None)
+        )
+
+
+@dataclasses.dataclass(slots=True)
+class Report:
+    """Result of checking all exercise variants"""
+    variants: int = 0
+    """Amount of checked variants"""
+    failures: List[Failure] = dataclasses.field(default_factory=list)
+    complete: bool = True
+    """False, if check stopped before all variants checked"""
+    efficiency: List[EfficiencyResult] = dataclasses.field(
+        default_factory=list
+    )
+    """Results of efficiency checks, if they were requested"""
+
+    @property
+    def passed(self) -> bool:
+        return self.complete and not self.failures
+
+    @property
+    def efficient(self) -> bool:
+        return all(result.passed for result in self.efficiency)
+
+    def by_task(self) -> Dict[Optional[str], List[Failure]]:
+        """Returns failures grouped by task name"""
+        tasks: Dict[Optional[str], List[Failure]] = {}
+        for failure in self.failures:
+            tasks.setdefault(failure.task, []).append(failure)
+        return tasks
@@ -0,0 +1,93 @@
+# Python Imports
+from random import Random
+from typing import Callable, List, Optional
+
+# Module Imports
+from .composition_classes import local_random
+from .exercise import Exercise
+from .task_generator import ExerciseSequence
+
+__all__ = (
+    'WeightedSampler',
+    'inverse_complexity'
+)
+
+WeightFunction = Callable[[int, int], float]
+"""Weight of exercise by its complexity and amount of tasks"""
+
+
+def inverse_complexity(complexity: int, amount: int) -> float:
+    """Default weight: exercises with higher complexity appear less often"""
+    return 1 / complexity if complexity > 0 else 1.0
+
+
+class WeightedSampler:
+    """Draws random exercises from sequence (for example, result of
+    generator query) with probability proportional to weight function.
+    Alias table built once in O(n), each draw takes O(1)
+    """
+    __slots__ = ('exercises', 'weights', '_probability', '_alias')
+
+    def __init__(
+            self,
+            exercises: ExerciseSequence,
+            weight: WeightFunction = inverse_complexity
+    ):
+        """
+        :param exercises: ExerciseSequence to draw from
+        :param weight: Function of complexity and amount of tasks
+        """
+        self.exercises = exercises
+        self.weights: List[float] = [
+            float(weight(
+                sum(task.complexity for task in combination),
+                len(combination)
+            ))
+            for combination in exercises.combinations()
+        ]
+        if any(value < 0 for value in self.weights):
+            raise ValueError("Weights should be non-negative")
+        total = sum(self.weights)
+        if not total:
+            raise ValueError("There's no exercises with positive weight")
+
+        # Vose's alias method
+        length = len(self.weights)
+        scaled = [value * length / total for value in self.weights]
+        self._probability: List[float] = [1.0] * length
+        self._alias: List[int] = list(range(length))
+        small = [i for i, value in enumerate(scaled) if value < 1]
+        large = [i for i, value in enumerate(scaled) if value >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._probability[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+
+    def __len__(self) -> int:
+        return len(self._alias)
+
+    def index(self, random: Optional[Random] = None) -> int:
+        """Returns index of random exercise in sequence"""
+        random = random or local_random()
+        column = random.randrange(len(self._alias))
+        if random.random() < self._probability[column]:
+            return column
+        return self._alias[column]
+
+    def sample(self, random: Optional[Random] = None) -> Exercise:
+        """Returns random exercise
+        :param random: Random generator. By default generator of thread
+        :rtype: Exercise
+        """
+        return self.exercises[self.index(random)]
+
+    def sample_many(
+            self,
+            amount: int,
+            random: Optional[Random] = None
+    ) -> List[Exercise]:
+        """Returns amount of random exercises (with repetitions)"""
+        random = random or local_random()
+        return [self.sample(random) for _ in range(amount)]
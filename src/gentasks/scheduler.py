@@ -0,0 +1,209 @@
+# Python Imports
+import dataclasses
+import heapq
+import os
+from concurrent.futures import Future
+from threading import Condition, Thread
+from time import monotonic
+from typing import Any, Callable, Dict, Generator, Hashable, List, Optional
+from typing import Tuple
+
+# Module Imports
+from .coverage import Coverage
+from .exercise import Exercise
+from .failure_statistics import DEFAULT_SECONDS, FailureStatistics
+from .metrics import QUEUE_DEPTH
+from .verdict_cache import Verdict, VerdictCache
+
+__all__ = (
+    'Scheduler',
+    'expected_cost'
+)
+
+
+def expected_cost(
+        exercise: Exercise,
+        statistics: Optional[FailureStatistics] = None,
+        coverage: Coverage = Coverage.ONE_FACTOR
+) -> float:
+    """Returns expected seconds to check exercise: sum of mean check
+    times of task cases over all variants. Cases without history
+    are estimated by task complexity
+    :param exercise: Exercise to check
+    :param statistics: Historical check times of task cases
+    :param coverage: Strategy of combining tasks check cases
+    :rtype: float
+    """
+    names = exercise.names()
+    defaults = [DEFAULT_SECONDS * task.complexity for task in exercise.tasks()]
+    cost = 0.0
+    for cases, _ in exercise._indexed_variants(coverage):
+        for name, default, case in zip(names, defaults, cases):
+            if statistics is None:
+                cost += default
+            else:
+                cost += statistics.expected_seconds(name, case, default)
+    return cost
+
+
+@dataclasses.dataclass(slots=True)
+class _Job:
+    student: Hashable
+    exercise: Exercise
+    generator: Callable[[Any], Generator]
+    future: Future
+    cost: float
+
+
+class Scheduler:
+    """Checks submissions on worker threads, shortest expected job first.
+    Waiting job gains priority: priority of job is expected cost minus
+    aging multiplied by seconds in queue. Since all queued jobs age
+    equally, heap key (cost + aging * submit time) stays constant.
+    No more than per_student jobs of one student run at once
+    """
+    __slots__ = (
+        'statistics', 'cache', 'coverage', 'aging', 'per_student',
+        '_heap', '_blocked', '_running', '_condition', '_workers',
+        '_sequence', '_closed', '_origin', '_queued'
+    )
+
+    def __init__(
+            self,
+            max_workers: Optional[int] = None,
+            statistics: Optional[FailureStatistics] = None,
+            cache: Optional[VerdictCache] = None,
+            coverage: Coverage = Coverage.ONE_FACTOR,
+            aging: float = 0.1,
+            per_student: int = 1
+    ):
+        """
+        :param max_workers: Amount of worker threads
+        :param statistics: Historical check times. Updated by checks,
+            if cache isn't used
+        :param cache: Cache of verdicts
+        :param coverage: Strategy of combining tasks check cases
+        :param aging: Seconds of expected cost forgiven for each second
+            in queue
+        :param per_student: Maximum jobs of one student running at once
+        """
+        assert per_student > 0 and aging >= 0
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        self.statistics: Optional[FailureStatistics] = statistics
+        self.cache: Optional[VerdictCache] = cache
+        self.coverage: Coverage = Coverage(coverage)
+        self.aging: float = aging
+        self.per_student: int = per_student
+        self._heap: List[Tuple[float, int, _Job]] = []
+        self._blocked: Dict[Hashable, List[Tuple[float, int, _Job]]] = {}
+        """Queued jobs of students, that reached per_student limit"""
+        self._running: Dict[Hashable, int] = {}
+        self._condition = Condition()
+        self._sequence: int = 0
+        self._queued: int = 0
+        self._closed: bool = False
+        self._origin: float = monotonic()
+        self._workers: List[Thread] = [
+            Thread(target=self._work, name=f'gentasks-scheduler-{i}',
+                   daemon=True)
+            for i in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self) -> 'Scheduler':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def queued(self) -> int:
+        """Returns amount of jobs waiting for worker"""
+        return self._queued
+
+    def submit(
+            self,
+            student: Hashable,
+            exercise: Exercise,
+            generator: Callable[[Any], Generator]
+    ) -> 'Future[Verdict]':
+        """Queues submission check
+        :param student: Identifier of student
+        :param exercise: Exercise to check
+        :param generator: Function of student
+        :rtype: Future[Verdict]
+        """
+        cost = expected_cost(exercise, self.statistics, self.coverage)
+        job = _Job(student, exercise, generator, Future(), cost)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Scheduler is closed")
+            key = cost + self.aging * (monotonic() - self._origin)
+            self._sequence += 1
+            heapq.heappush(self._heap, (key, self._sequence, job))
+            self._queued += 1
+            QUEUE_DEPTH.set(self._queued)
+            self._condition.notify()
+        return job.future
+
+    def close(self, wait: bool = True) -> None:
+        """Stops workers after queued jobs are checked"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _next(self) -> Optional[_Job]:
+        """Pops cheapest job of student under limit. Condition is held"""
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            student = entry[2].student
+            if self._running.get(student, 0) < self.per_student:
+                self._running[student] = self._running.get(student, 0) + 1
+                self._queued -= 1
+                QUEUE_DEPTH.set(self._queued)
+                return entry[2]
+            self._blocked.setdefault(student, []).append(entry)
+        return None
+
+    def _release(self, student: Hashable) -> None:
+        """Marks job of student finished. Condition is held"""
+        running = self._running.pop(student) - 1
+        if running:
+            self._running[student] = running
+        for entry in self._blocked.pop(student, ()):
+            heapq.heappush(self._heap, entry)
+        self._condition.notify_all()
+
+    def _check(self, job: _Job) -> Verdict:
+        if self.cache is not None:
+            return self.cache.check(job.exercise, job.generator, self.coverage)
+        try:
+            job.exercise.check_generator(
+                job.generator, self.coverage, statistics=self.statistics
+            )
+        except Exception as e:
+            return Verdict.from_exception(e)
+        return Verdict.from_exception(None)
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                job = self._next()
+                while job is None:
+                    if self._closed and not self._blocked:
+                        return
+                    self._condition.wait()
+                    job = self._next()
+
+            if job.future.set_running_or_notify_cancel():
+                try:
+                    job.future.set_result(self._check(job))
+                except BaseException as e:
+                    job.future.set_exception(e)
+
+            with self._condition:
+                self._release(job.student)
@@ -1,40 +1,272 @@
 # Python Imports
-from itertools import combinations
-from random import shuffle
-from typing import List, Tuple, Generator, Type
+import dataclasses
+import gc
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from heapq import merge
+from itertools import combinations, islice, repeat
+from math import comb
+from operator import add, itemgetter
+from threading import RLock
+from time import perf_counter
+from types import FunctionType, MethodType, ModuleType
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from typing import Type, Union, TYPE_CHECKING
 
 # Module Imports
-from .exercise import Exercise
-from .tasktypes import TASKS, GeneratorDefaultTask
-from .composition_classes import Singleton
+from .constants import PARALLEL_BUILD_MIN_TASKS
+from .exercise import Exercise, FrozenExercise
+from .tasktypes import TASKS, GeneratorDefaultTask, GeneratorTaskMeta
+from .composition_classes import local_random
+from .metrics import QUERIES
+
+if TYPE_CHECKING:
+    import numpy
+    from .batch import BatchTable, Query
 
 __all__ = (
     'AbstractExerciseGenerator',
-    'PrecheckExerciseGenerator'
+    'PrecheckExerciseGenerator',
+    'ExerciseSequence',
+    'GeneratorStats'
 )
 
 
-class AbstractExerciseGenerator(Singleton):
-    __slots__ = ()
+TasksKey = Optional[Tuple[Type[GeneratorDefaultTask], ...]]
+"""Key of task registry. None stands for global TASKS list"""
+
+Indices = Union[range, Tuple[int, ...]]
+"""Indexes of generator table rows"""
+
+_NOT_OWNED = (type, ModuleType, FunctionType, MethodType)
+"""Objects, that are shared and not counted in generator memory"""
+
+
+def _deep_sizeof(*objects: object) -> int:
+    """Returns summary size of objects and everything they reference.
+    Each object counted once. Classes, modules and functions skipped
+    """
+    seen = set()
+    stack = list(objects)
+    size = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _NOT_OWNED):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, '__dict__'):
+            stack.append(vars(obj))
+        else:
+            for cls in type(obj).__mro__:
+                for name in getattr(cls, '__slots__', ()):
+                    if hasattr(obj, name):
+                        stack.append(getattr(obj, name))
+    return size
+
+
+Run = Tuple['numpy.ndarray', 'numpy.ndarray']
+"""Table rows as summary complexities and bitmasks of task indexes,
+stably sorted by complexity"""
+
+
+def _build_shard(complexity: Tuple[int, ...], start: int, stop: int) -> Run:
+    """Returns rows [start, stop) of serial enumeration (by size, then
+    lexicographically) as sorted run. Runs in worker process
+    """
+    import numpy as np
+
+    bits = tuple(1 << i for i in range(len(complexity)))
+    values = np.empty(stop - start, dtype=np.int64)
+    masks = np.empty(stop - start, dtype=np.uint64)
+    offset = 0
+    """Position of first row of current size"""
+    filled = 0
+    for size in range(1, len(complexity) + 1):
+        amount = comb(len(complexity), size)
+        low, high = max(start - offset, 0), min(stop - offset, amount)
+        if low < high:
+            rows = slice(filled, filled + high - low)
+            values[rows] = np.fromiter(
+                map(sum, islice(combinations(complexity, size), low, high)),
+                np.int64, high - low
+            )
+            masks[rows] = np.fromiter(
+                map(sum, islice(combinations(bits, size), low, high)),
+                np.uint64, high - low
+            )
+            filled += high - low
+        offset += amount
+        if offset >= stop:
+            break
+    order = values.argsort(kind='stable')
+    return values[order], masks[order]
+
+
+def _merge_runs(runs: List[Run]) -> Run:
+    """Merges sorted runs pairwise. Rows of earlier run go before
+    rows of later run with same complexity
+    """
+    import numpy as np
+
+    while len(runs) > 1:
+        merged = []
+        for (values, masks), (other_values, other_masks) in zip(
+                runs[::2], runs[1::2]
+        ):
+            positions = np.searchsorted(values, other_values, 'right')
+            positions += np.arange(len(other_values))
+            other = np.zeros(len(values) + len(other_values), dtype=bool)
+            other[positions] = True
+            run = (
+                np.empty(len(other), dtype=np.int64),
+                np.empty(len(other), dtype=np.uint64)
+            )
+            run[0][other], run[0][~other] = other_values, values
+            run[1][other], run[1][~other] = other_masks, masks
+            merged.append(run)
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+    return runs[0]
+
+
+def _subsets(
+        tasks: Tuple[Type[GeneratorDefaultTask], ...]
+) -> List[Tuple[Type[GeneratorDefaultTask], ...]]:
+    """Returns subsets of tasks indexed by their bitmasks"""
+    subsets = [()]
+    for task in tasks:
+        subsets += [subset + (task,) for subset in subsets]
+    return subsets
+
+
+def _rows(
+        tasks: Tuple[Type[GeneratorDefaultTask], ...],
+        masks: 'numpy.ndarray'
+) -> Tuple[Tuple[Type[GeneratorDefaultTask], ...], ...]:
+    """Returns combinations of tasks from bitmasks. Each combination
+    is joined from subsets of lower and higher half of tasks
+    """
+    half = len(tasks) // 2
+    lower, higher = _subsets(tasks[:half]), _subsets(tasks[half:])
+    return tuple(map(
+        add,
+        map(lower.__getitem__, (masks & ((1 << half) - 1)).tolist()),
+        map(higher.__getitem__, (masks >> half).tolist())
+    ))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GeneratorStats:
+    """Size and build cost of generator"""
+    tasks: int
+    """Amount of task types in registry"""
+    entries: int
+    """Amount of combinations stored"""
+    bytes: int
+    """Memory used by stored combinations and indexes"""
+    build_seconds: float
+    """Time spent building table, including merges of registered tasks"""
+    indexes: Dict[str, int] = dataclasses.field(default_factory=dict)
+    """Amount of rows in each built index"""
+    cache_hits: Dict[str, int] = dataclasses.field(default_factory=dict)
+    cache_misses: Dict[str, int] = dataclasses.field(default_factory=dict)
+
+    def hit_rate(self, cache: str) -> Optional[float]:
+        """Returns share of requests to cache, that hit it.
+        None, if cache wasn't requested
+        """
+        hits = self.cache_hits.get(cache, 0)
+        total = hits + self.cache_misses.get(cache, 0)
+        return hits / total if total else None
+
+
+class AbstractExerciseGenerator:
+    """Generator of exercises over task registry.
+    Instances are cached per registry: calling class without arguments
+    returns instance over global TASKS, calling with tasks returns
+    instance over exactly these tasks. Instance is built once, even
+    if first calls are concurrent
+    """
+    __slots__ = ('_tasks', '_build_seconds', '__weakref__')
+    _instances: Dict[TasksKey, 'AbstractExerciseGenerator'] = {}
+    _lock = RLock()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._instances = {}
+
+    def __new__(
+            cls,
+            tasks: Optional[Iterable[Type[GeneratorDefaultTask]]] = None
+    ):
+        key: TasksKey = None
+        if tasks is not None:
+            key = tuple(dict.fromkeys(tasks))
+            for task in key:
+                assert isinstance(task, GeneratorTaskMeta), \
+                    "Can't create generator with non-generator class"
+
+        # Double-checked locking: instance published only after new()
+        instance = cls._instances.get(key)
+        if instance is None:
+            with cls._lock:
+                instance = cls._instances.get(key)
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance._tasks = key
+                    instance._build_seconds = 0.0
+                    start = perf_counter()
+                    instance.new()
+                    instance._build_seconds += perf_counter() - start
+                    cls._instances[key] = instance
+        return instance
+
+    def new(self) -> None:
+        """Called once, when instance for registry created"""
+
+    def tasks(self) -> Tuple[Type[GeneratorDefaultTask], ...]:
+        """Returns tasks, exercises are generated from"""
+        return self._tasks
+
+    def task_registered(self, task: Type[GeneratorDefaultTask]) -> None:
+        """Adds new task to generator. Instance over global TASKS
+        is called on each registration of task type
+        """
+        self._tasks = self._tasks + (task,)
+
+    def stats(self) -> GeneratorStats:
+        """Returns size and build cost of generator"""
+        return GeneratorStats(len(self._tasks), 0, 0, self._build_seconds)
 
     @staticmethod
     def _create_exercise(tasks: Tuple[Type[GeneratorDefaultTask]]) -> Exercise:
-        return Exercise(tasks=tasks)
+        return FrozenExercise(tasks)
 
     @staticmethod
     def _create_exercise_shuffle(
             tasks: Tuple[Type[GeneratorDefaultTask]]
     ) -> Exercise:
         tasks = list(tasks)
-        shuffle(tasks)
-        return Exercise(tasks=tasks)
+        local_random().shuffle(tasks)
+        return FrozenExercise(tasks)
 
     def get_tasks_under_complexity(
             self,
             _complexity: int,
             shuffle_tasks: bool = True
-    ) -> Generator[Exercise, None, None]:
-        """Returns all _combinations of tasks under given _complexity"""
+    ) -> 'Sequence[Exercise]':
+        """Returns all _combinations of tasks under given _complexity
+            as lazy ExerciseSequence"""
         raise NotImplementedError()
 
     def get_tasks_in_complexity_range(
@@ -42,7 +274,7 @@ class AbstractExerciseGenerator(Singleton):
             _end: int,
             /,
             shuffle_tasks: bool = True
-    ) -> Generator[Exercise, None, None]:
+    ) -> 'Sequence[Exercise]':
         """Returns all _combinations of tasks in given range of _complexity
             (_end not included)
         Note: if _start or _end out of bounds,
@@ -53,7 +285,7 @@ class AbstractExerciseGenerator(Singleton):
     def get_tasks_amount(
             self, _amount: int,
             shuffle_tasks: bool = True
-    ) -> Generator[Exercise, None, None]:
+    ) -> 'Sequence[Exercise]':
         """Returns all combinations with defined amount of tasks"""
         raise NotImplementedError()
 
@@ -61,12 +293,44 @@ class AbstractExerciseGenerator(Singleton):
 class PrecheckExerciseGenerator(AbstractExerciseGenerator):
     """On creating new instace, calculating all possible _combinations.
     + Fast response to method calls
-    - With big amount of task types memory usage is immense
+    - With big amount of task types memory usage is immense (see stats())
     """
-    __slots__ = ('_complexity', '_combinations',)
+    __slots__ = (
+        '_complexity', '_combinations', '_amounts', '_batch', '_requests',
+        '_full_set'
+    )
+    build_workers: int = 1
+    """Amount of processes building table of registries with at least
+    PARALLEL_BUILD_MIN_TASKS tasks. 1 builds in current process,
+    0 uses all CPUs. Without numpy table is built serially"""
 
     def new(self) -> None:
-        """Creates all possible combinations"""
+        """Creates all possible combinations. Instance over global
+        registry is built under registration lock and then follows new
+        task types through task_registered(). Table of global registry
+        doesn't contain exercise with all tasks, table of explicit task
+        set does
+        """
+        self._full_set: bool = self._tasks is not None
+        if self._tasks is None:
+            with GeneratorTaskMeta._lock:
+                self._tasks = tuple(TASKS)
+                self._build()
+                GeneratorTaskMeta.subscribe(self)
+        else:
+            self._build()
+
+    def _build(self) -> None:
+        self._amounts: Optional[Tuple[tuple, Dict[int, tuple]]] = None
+        """Table and indexes of its rows by amount of tasks"""
+
+        self._batch: Optional['BatchTable'] = None
+        """NumPy arrays of table, created on first batch query"""
+
+        self._requests: Dict[str, List[int]] = {
+            'amounts': [0, 0], 'batch': [0, 0]
+        }
+        """Hits and misses of lazily built indexes"""
 
         self._combinations: List[Tuple[Type['GeneratorDefaultTask']]] = []
         """List of all possible _combinations"""
@@ -76,9 +340,16 @@ class PrecheckExerciseGenerator(AbstractExerciseGenerator):
             on same index in self._combinations"""
 
         # Creating all possible _combinations
-        tasks: List[Type[GeneratorDefaultTask]] = TASKS.copy()
+        tasks: List[Type[GeneratorDefaultTask]] = list(self._tasks)
+
+        workers = self.build_workers or os.cpu_count() or 1
+        if (
+                workers > 1 and len(tasks) >= PARALLEL_BUILD_MIN_TASKS
+                and self._build_parallel(workers)
+        ):
+            return
 
-        for combinations_amount in range(1, len(tasks)):
+        for combinations_amount in range(1, len(tasks) + self._full_set):
             for combination in combinations(tasks, combinations_amount):
                 self._combinations.append(combination)
                 self._complexity.append(
@@ -86,6 +357,9 @@ class PrecheckExerciseGenerator(AbstractExerciseGenerator):
                 )
 
         # Sorting by _complexity
+        if not self._combinations:
+            self._combinations, self._complexity = (), ()
+            return
         self._combinations, self._complexity = zip(*sorted(
             zip(self._combinations, self._complexity),
             key=lambda x: x[1])
@@ -93,22 +367,94 @@ class PrecheckExerciseGenerator(AbstractExerciseGenerator):
         self._combinations: Tuple[Tuple[Type[GeneratorDefaultTask]]]
         self._complexity: Tuple[int]
 
-    def get_tasks_under_complexity(
-            self, _complexity: int,
-            shuffle_tasks: bool = True
-    ) -> Generator[Exercise, None, None]:
-        assert isinstance(_complexity, int), \
-            f"Complexity should be integer, got {type(_complexity)}"
+    def _build_parallel(self, workers: int) -> bool:
+        """Builds table in process pool. Serial enumeration is split
+        into one contiguous shard per worker, each worker builds and
+        sorts its rows, and sorted runs are merged in shard order,
+        so table is same as serial one. Requires numpy
+        :return: Whether table was built
+        :rtype: bool
+        """
+        # Imported here, so numpy isn't loaded for small registries
+        from .batch import np
+        if np is None:
+            return False
 
+        tasks = self._tasks
+        complexity = tuple(cl.complexity for cl in tasks)
+        # Full set is last row of serial enumeration
+        total = 2 ** len(tasks) - 1 - (not self._full_set)
+        shards = min(workers, total)
+        bounds = [total * i // shards for i in range(shards + 1)]
+        with ProcessPoolExecutor(shards) as executor:
+            runs = list(executor.map(
+                _build_shard, repeat(complexity), bounds[:-1], bounds[1:]
+            ))
+
+        values, masks = _merge_runs(runs)
+        # Rows can't form reference cycles, and collections triggered by
+        # millions of new tuples take most of build time
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._combinations = _rows(tasks, masks)
+            self._complexity = tuple(values.tolist())
+        finally:
+            if enabled:
+                gc.enable()
+        return True
+
+    def task_registered(self, task: Type[GeneratorDefaultTask]) -> None:
+        """Merges combinations with new task into sorted table
+        instead of recalculating it. New entries are: task alone,
+        each old combination with task and, if table doesn't contain
+        full set, full set of old tasks
+        """
+        if task in self._tasks:
+            return
+        old_tasks = self._tasks
+        super().task_registered(task)
+
+        start = perf_counter()
+        complexity = task.complexity
+        table = tuple(zip(self._combinations, self._complexity))
+        with_task = (
+            (combination + (task,), compl + complexity)
+            for combination, compl in table
+        )
+        single = [((task,), complexity)]
+        if not self._full_set and old_tasks:
+            single.append(
+                (old_tasks, sum(cl.complexity for cl in old_tasks))
+            )
+            single.sort(key=itemgetter(1))
+        self._combinations, self._complexity = zip(*merge(
+            table, single, with_task, key=itemgetter(1)
+        ))
+        self._build_seconds += perf_counter() - start
+
+    def _view(
+            self,
+            combinations_: Tuple[Tuple[Type[GeneratorDefaultTask], ...]],
+            indices: Indices,
+            shuffle_tasks: bool
+    ) -> 'ExerciseSequence':
         if shuffle_tasks:
             create_exercise = self._create_exercise_shuffle
         else:
             create_exercise = self._create_exercise
+        return ExerciseSequence(combinations_, indices, create_exercise)
 
-        for combination, compl in zip(self._combinations, self._complexity):
-            if compl > _complexity:
-                break
-            yield create_exercise(combination)
+    def get_tasks_under_complexity(
+            self, _complexity: int,
+            shuffle_tasks: bool = True
+    ) -> 'ExerciseSequence':
+        assert isinstance(_complexity, int), \
+            f"Complexity should be integer, got {type(_complexity)}"
+
+        QUERIES.inc(query='under_complexity')
+        end = bisect_right(self._complexity, _complexity)
+        return self._view(self._combinations, range(end), shuffle_tasks)
 
     def get_tasks_in_complexity_range(
             self,
@@ -116,56 +462,158 @@ class PrecheckExerciseGenerator(AbstractExerciseGenerator):
             _end: int,
             /,
             shuffle_tasks: bool = True
-    ) -> Generator[Exercise, None, None]:
+    ) -> 'ExerciseSequence':
         assert isinstance(_start, int), \
             f"Complexity should be integer, got {type(_start)}"
         assert isinstance(_end, int), \
             f"Complexity should be integer, got {type(_end)}"
 
-        if shuffle_tasks:
-            create_exercise = self._create_exercise_shuffle
-        else:
-            create_exercise = self._create_exercise
+        QUERIES.inc(query='complexity_range')
 
         # Out of bounds check
+        if not self._complexity:
+            raise ValueError("There's no tasks in that range")
         if _end > self._complexity[-1]:
             _end = self._complexity[-1]
         if _start < self._complexity[0]:
             _start = self._complexity[0]
 
-        start: int = -1
-        while start == -1:
-            try:
-                start = self._complexity.index(_start)
-            except ValueError:
-                _start += 1
-                if _start == _end:
-                    raise ValueError("There's no tasks in that range")
-            else:
-                break
-
-        for combination, complexity in zip(
-                self._combinations[start:], self._complexity[start:]
-        ):
-            if complexity >= _end:
-                break
-            yield create_exercise(combination)
+        start = bisect_left(self._complexity, _start)
+        end = bisect_left(self._complexity, _end)
+        if start >= end and _start < _end:
+            raise ValueError("There's no tasks in that range")
+        return self._view(
+            self._combinations, range(start, max(start, end)), shuffle_tasks
+        )
 
     def get_tasks_amount(
             self,
             _amount: int,
             shuffle_tasks: bool = True
-    ) -> Generator[Exercise, None, None]:
+    ) -> 'ExerciseSequence':
         """Returns all combinations with defined amount of tasks"""
         assert isinstance(_amount, int)
         assert isinstance(shuffle_tasks, bool)
+        QUERIES.inc(query='amount')
 
-        if shuffle_tasks:
-            create_exercise = self._create_exercise_shuffle
+        amounts = self._amounts
+        if amounts is None or amounts[0] is not self._combinations:
+            self._requests['amounts'][1] += 1
+            indices: Dict[int, List[int]] = {}
+            for index, combination in enumerate(self._combinations):
+                indices.setdefault(len(combination), []).append(index)
+            amounts = (self._combinations, {
+                amount: tuple(values) for amount, values in indices.items()
+            })
+            self._amounts = amounts
         else:
-            create_exercise = self._create_exercise
+            self._requests['amounts'][0] += 1
+        return self._view(
+            amounts[0], amounts[1].get(_amount, ()), shuffle_tasks
+        )
+
+    def batch_table(self) -> 'BatchTable':
+        """Returns table as NumPy arrays. Requires numpy"""
+        # Imported here, so numpy isn't loaded without batch queries
+        from .batch import BatchTable
+
+        batch = self._batch
+        if batch is None or batch.combinations is not self._combinations:
+            self._requests['batch'][1] += 1
+            batch = BatchTable(
+                self._tasks, self._combinations, self._complexity
+            )
+            self._batch = batch
+        else:
+            self._requests['batch'][0] += 1
+        return batch
+
+    def stats(self) -> GeneratorStats:
+        """Returns size of table with built indexes, build time
+        and hit counts of lazily built indexes
+        """
+        indexes = {'complexity': len(self._complexity)}
+        stored = [self._combinations, self._complexity]
+        amounts = self._amounts
+        if amounts is not None and amounts[0] is self._combinations:
+            indexes['amounts'] = sum(map(len, amounts[1].values()))
+            stored.append(amounts)
+        batch = self._batch
+        if batch is not None and batch.combinations is self._combinations:
+            indexes['batch'] = len(batch.complexity)
+            stored.append(batch)
+        return GeneratorStats(
+            tasks=len(self._tasks),
+            entries=len(self._combinations),
+            bytes=_deep_sizeof(*stored),
+            build_seconds=self._build_seconds,
+            indexes=indexes,
+            cache_hits={
+                name: hits for name, (hits, _) in self._requests.items()
+            },
+            cache_misses={
+                name: misses for name, (_, misses) in self._requests.items()
+            }
+        )
+
+    def batch_query(self, queries: Sequence['Query']) -> list:
+        """Answers many queries at once. Requires numpy
+        :param queries: Complexity ranges, amounts and required notes
+        :return: Arrays of table indexes, one for each query
+        :rtype: List[numpy.ndarray]
+        """
+        QUERIES.inc(len(queries), query='batch')
+        return self.batch_table().batch_query(queries)
+
+    def exercises_at(
+            self,
+            indices: Iterable[int],
+            shuffle_tasks: bool = True
+    ) -> 'ExerciseSequence':
+        """Returns exercises on table indexes from batch_query()"""
+        return self._view(
+            self.batch_table().combinations,
+            tuple(int(index) for index in indices),
+            shuffle_tasks
+        )
+
+
+class ExerciseSequence(Sequence):
+    """Lazy read-only view over exercises of generator table.
+    Supports len(), indexing, slicing and re-iteration.
+    Exercise objects are created only on access
+    """
+    __slots__ = ('_combinations', '_indices', '_create')
+
+    def __init__(
+            self,
+            combinations_: Sequence[Tuple[Type[GeneratorDefaultTask], ...]],
+            indices: Indices,
+            create: Callable[[Tuple[Type[GeneratorDefaultTask]]], Exercise]
+    ):
+        self._combinations = combinations_
+        self._indices: Indices = indices
+        self._create = create
+
+    def __repr__(self) -> str:
+        return f"<ExerciseSequence with {len(self)} exercises>"
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ExerciseSequence(
+                self._combinations, self._indices[index], self._create
+            )
+        return self._create(self._combinations[self._indices[index]])
+
+    def __iter__(self) -> Iterator[Exercise]:
+        combinations_ = self._combinations
+        create = self._create
+        for index in self._indices:
+            yield create(combinations_[index])
 
-        for combination in self._combinations:
-            if len(combination) != _amount:
-                continue
-            yield create_exercise(combination)
+    def combinations(self) -> List[Tuple[Type[GeneratorDefaultTask], ...]]:
+        """Returns task tuples without creating exercises"""
+        return [self._combinations[index] for index in self._indices]
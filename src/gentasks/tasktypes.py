@@ -1,19 +1,25 @@
 # Python Imports
-import random
 from typing import Generator, Iterable, Generic, TypeVar, Optional
-from typing import Dict, Set, List, Type
+from typing import Dict, Set, List, Type, Callable
+from array import array
+from mmap import mmap
+from threading import RLock
+from weakref import WeakSet
 from string import ascii_letters
 from types import GeneratorType
 import dataclasses
 
 # Module Imports
+from .composition_classes import local_random
 from .exceptions import GeneratorUnexpectedShutdown
-from .constants import GENERATORS_DESCRIPTION, MAX_LOOP_TESTS
+from .exceptions import GeneratorWrongValue, GeneratorWrongType
+from .constants import GENERATORS_DESCRIPTION, MAX_LOOP_TESTS, STRESS_LENGTH
 
 __all__ = (
     'TASKS',
     'GeneratorTaskMeta',
-    'GeneratorDefaultTask'
+    'GeneratorDefaultTask',
+    'Stream'
 )
 
 T = TypeVar('T')
@@ -22,6 +28,36 @@ T = TypeVar('T')
 TASKS: List[Type['GeneratorDefaultTask']] = []
 
 
+class Stream(Generic[T]):
+    """Iterable, that creates new one-shot iterator from factory on each
+    iter() call. Values are produced lazily and never stored, so stream
+    supports neither len() nor indexing
+    """
+    __slots__ = ('_factory', '_args')
+
+    def __init__(self, factory: Callable[..., Iterable[T]], *args):
+        self._factory = factory
+        self._args = args
+
+    def __iter__(self) -> Generator[T, None, None]:
+        yield from self._factory(*self._args)
+
+    def __repr__(self) -> str:
+        return f"<Stream of {self._factory.__qualname__}{self._args}>"
+
+
+def _mapped_array(length: int, chunk: int = 65536) -> memoryview:
+    """Returns integers [0, length) in anonymous memory-mapped buffer.
+    Buffer filled by chunks, so no full-size temporary objects created.
+    Returned view is read-only: it's shared by submission and reference
+    """
+    view = memoryview(mmap(-1, max(length, 1) * 8)).cast('q')[:length]
+    for start in range(0, length, chunk):
+        end = min(start + chunk, length)
+        view[start:end] = array('q', range(start, end))
+    return view.toreadonly()
+
+
 class AbstractInputDataclass:
     def as_list(self) -> List:
         fields = self.__dataclass_fields__.keys()
@@ -36,23 +72,47 @@ class GeneratorTaskMeta(type):
     all_tasks: List[Type['GeneratorDefaultTask']] = TASKS
     _avoided = False
     _complexity_set: Set[int] = set()
-
-    def __new__(mcs: Type['GeneratorDefaultTask'], name, bases, dct):
+    _lock = RLock()
+    _listeners: WeakSet = WeakSet()
+    """Objects with task_registered(cl) method, notified on registration"""
+
+    def __new__(
+            mcs: Type['GeneratorDefaultTask'],
+            name, bases, dct,
+            register: bool = True
+    ):
+        """Creates task class and adds it to TASKS.
+        Classes created with register=False are not added (base classes
+        and implementations behind lazy plugin tasks)
+        """
         cl: Type['GeneratorDefaultTask'] = super().__new__(
             mcs, name, bases, dct
         )
 
         # This if cause ONLY to avoid GeneratorDefaultTask class
-        if mcs._avoided:
-            TASKS.append(cl)
-            if cl.complexity in mcs._complexity_set:
-                raise ValueError("Repeated _complexity in " + str(cl))
-            mcs._complexity_set.add(cl.complexity)
-        else:
-            mcs._avoided = True
+        with mcs._lock:
+            if not mcs._avoided:
+                mcs._avoided = True
+            elif register:
+                if cl.complexity in mcs._complexity_set:
+                    raise ValueError("Repeated _complexity in " + str(cl))
+                TASKS.append(cl)
+                mcs._complexity_set.add(cl.complexity)
+                for listener in list(mcs._listeners):
+                    listener.task_registered(cl)
 
         return cl
 
+    @classmethod
+    def subscribe(mcs, listener) -> None:
+        """Calls listener.task_registered(cl) on every new task registration.
+        Listener is held by weak reference. Should be called with
+        GeneratorTaskMeta._lock held together with TASKS read, so that
+        no registration is missed between them
+        """
+        with mcs._lock:
+            mcs._listeners.add(listener)
+
     def __int__(self: Type['GeneratorDefaultTask']) -> int:
         assert hasattr(self, '_complexity'),\
                 "All tasks should include _complexity"
@@ -68,7 +128,7 @@ class GeneratorDefaultTask(metaclass=GeneratorTaskMeta):
 
     """Complexity variable represents severity to complete this task
     Higher _complexity means:
-    1. Less chance to appear in tasks
+    1. Less chance to appear in tasks (see sampling.WeightedSampler)
     2. Chance to not appear in tasks at all, if _complexity limit in manager
         is higher than _complexity in current task
     """
@@ -117,6 +177,34 @@ class GeneratorDefaultTask(metaclass=GeneratorTaskMeta):
         """
         raise NotImplementedError()
 
+    @classmethod
+    def stress_cases_generator(
+            cls,
+            length: int = STRESS_LENGTH
+    ) -> Generator['GeneratorDefaultTask', None, None]:
+        """ Generates tasks with huge or streaming values, that should be
+        checked in single pass with bounded memory.
+        By default same as check_cases_generator()
+        :param length: Amount of values in generated sequences
+        :type length: int
+        :return: Generator-class generator
+        :rtype: GeneratorDefaultTask
+        """
+        return cls.check_cases_generator()
+
+    @classmethod
+    def efficiency_case(
+            cls,
+            length: int = STRESS_LENGTH
+    ) -> Optional['GeneratorDefaultTask']:
+        """ Returns task to check laziness of generator (memory usage and
+        time to first yield). None means task doesn't support such checks
+        :param length: Amount of values in generated sequences
+        :type length: int
+        :rtype: Optional[GeneratorDefaultTask]
+        """
+        return None
+
     def variables_check(self, *args, **kwargs):
         """Checks object variables for correct type, conditions, e.t.c."""
         raise NotImplementedError('All generator task classes should '
@@ -179,6 +267,17 @@ class Range(GeneratorDefaultTask):
         yield cls(0, 1)
         yield cls(-100, 100)
 
+    @classmethod
+    def stress_cases_generator(
+            cls,
+            length: int = STRESS_LENGTH
+    ) -> Generator['Range', None, None]:
+        yield cls(-length, length)
+
+    @classmethod
+    def efficiency_case(cls, length: int = STRESS_LENGTH) -> 'Range':
+        return cls(0, length)
+
     def variables_check(self, start: int, end: int):
         if not isinstance(start, int):
             raise TypeError('Start index should be integer')
@@ -203,11 +302,16 @@ class Range(GeneratorDefaultTask):
         for valid, current in zip(valid_generator, generator):
             calls += 1
             if not type(current) == type(valid):
-                raise TypeError(f"Ожидался тип {type(valid).__qualname__}, "
-                                f"получен {type(current).__qualname__}")
+                raise GeneratorWrongType(
+                    f"Ожидался тип {type(valid).__qualname__}, "
+                    f"получен {type(current).__qualname__}",
+                    valid, current, calls
+                )
             elif current != valid:
-                raise ValueError(f"Ожидалось {valid}, "
-                                 f"получено {current}")
+                raise GeneratorWrongValue(
+                    f"Ожидалось {valid}, получено {current}",
+                    valid, current, calls
+                )
         if valid is _empty:
             raise GeneratorUnexpectedShutdown("Генератор закончил "
                                               "работу при старте")
@@ -240,6 +344,17 @@ class NegativeRange(Range):
         yield cls(0, -1)
         yield cls(100, -100)
 
+    @classmethod
+    def stress_cases_generator(
+            cls,
+            length: int = STRESS_LENGTH
+    ) -> Generator['NegativeRange', None, None]:
+        yield cls(length, -length)
+
+    @classmethod
+    def efficiency_case(cls, length: int = STRESS_LENGTH) -> 'NegativeRange':
+        return cls(length, 0)
+
 
 class AwaitKeyword(GeneratorDefaultTask):
     """Generator, which runs forever until got keyword through .send()
@@ -267,8 +382,9 @@ class AwaitKeyword(GeneratorDefaultTask):
 
     def _random_keywords(self) -> Generator[str, None, None]:
         while True:
-            length = range(random.randint(0, 30))
-            string = ''.join(random.choice(ascii_letters) for _ in length)
+            rng = local_random()
+            length = range(rng.randint(0, 30))
+            string = ''.join(rng.choice(ascii_letters) for _ in length)
             if string == self.keyword:
                 continue
             yield string
@@ -377,27 +493,45 @@ class Iterator(GeneratorDefaultTask, Generic[T]):
         yield cls([1, 2])
         yield cls(set())
 
+    @classmethod
+    def stress_cases_generator(
+            cls,
+            length: int = STRESS_LENGTH
+    ) -> Generator['Iterator', None, None]:
+        yield cls(range(length))
+        yield cls(Stream(range, length))
+        yield cls(_mapped_array(length))
+
+    @classmethod
+    def efficiency_case(cls, length: int = STRESS_LENGTH) -> 'Iterator':
+        return cls(Stream(range, length))
+
     def check_generator(self, generator: Generator[T, None, None]) -> int:
         if not isinstance(generator, GeneratorType):
             raise TypeError("Полученный объект не является генератором")
 
+        # Single pass: iterable can be one-shot or too big to iterate twice
         calls = 0
-        valid_generator = self.generator()
-        valid = _empty = object()
-
-        for valid, current in zip(valid_generator, generator):
+        for valid in self.generator():
+            try:
+                current = next(generator)
+            except StopIteration:
+                raise GeneratorUnexpectedShutdown(
+                    "Генератор закончил работу при старте" if not calls else
+                    "Генератор закончил работу до конца последовательности"
+                )
             calls += 1
             if not type(current) == type(valid):
-                raise TypeError(
+                raise GeneratorWrongType(
                     f"Ожидался тип {type(valid).__qualname__} ({valid}),"
-                    f" получен {type(current).__qualname__} ({current})"
+                    f" получен {type(current).__qualname__} ({current})",
+                    valid, current, calls
                 )
             elif current != valid:
-                raise ValueError(f"Ожидалось {valid}, получено {current}")
-        if valid is _empty and sum(1 for _ in self.iterable):
-            raise GeneratorUnexpectedShutdown(
-                "Генератор закончил работу при старте"
-            )
+                raise GeneratorWrongValue(
+                    f"Ожидалось {valid}, получено {current}",
+                    valid, current, calls
+                )
         return calls
 
 
@@ -457,14 +591,24 @@ class Fibonacci(GeneratorDefaultTask):
     def check_cases_generator(cls) -> Generator['Fibonacci', None, None]:
         yield cls()
 
+    @classmethod
+    def efficiency_case(cls, length: int = STRESS_LENGTH) -> 'Fibonacci':
+        return cls()
+
     @staticmethod
-    def _check_call(valid_gen: Generator, current_gen: Generator) -> None:
+    def _check_call(
+            valid_gen: Generator,
+            current_gen: Generator,
+            call: Optional[int] = None
+    ) -> None:
         """Checks fibonacci generators equality and raises different exceptions
         It is assumed that the generators are in the same state
         :param valid_gen: Correct fibonacci generator
         :type valid_gen: Generator
         :param current_gen: Fibonacci generator that under tests
         :type current_gen: Generator
+        :param call: Index of call, attached to raised exceptions
+        :type call: Optional[int]
         :raise TypeError: Returned type different from correct
         :raise ValueError: Returned value different from correct
         :raise GeneratorUnexpectedShutdown: Generator unexpectedly
@@ -478,11 +622,16 @@ class Fibonacci(GeneratorDefaultTask):
                 "Генератор закончил работу до исключения StopIteration"
             )
         if not type(answer_current) == type(answer_valid):
-            raise TypeError(f"Ожидался тип {type(answer_valid).__qualname__},"
-                            f" получен {type(answer_current).__qualname__}")
+            raise GeneratorWrongType(
+                f"Ожидался тип {type(answer_valid).__qualname__},"
+                f" получен {type(answer_current).__qualname__}",
+                answer_valid, answer_current, call
+            )
         elif answer_current != answer_valid:
-            raise ValueError(f"Ожидалось {answer_valid}, "
-                             f"получено {answer_current}")
+            raise GeneratorWrongValue(
+                f"Ожидалось {answer_valid}, получено {answer_current}",
+                answer_valid, answer_current, call
+            )
 
     def check_generator(self, generator: Generator[T, None, None]) -> int:
         if not isinstance(generator, GeneratorType):
@@ -491,8 +640,9 @@ class Fibonacci(GeneratorDefaultTask):
         valid_generator = self.generator()
 
         calls: int = 0
-        for calls in range(0, random.randint(400, 400+MAX_LOOP_TESTS)):
-            self._check_call(valid_generator, generator)
+        loops = local_random().randint(400, 400+MAX_LOOP_TESTS)
+        for calls in range(0, loops):
+            self._check_call(valid_generator, generator, calls)
 
         generator.throw(StopIteration, StopIteration())
         return calls
@@ -0,0 +1,94 @@
+# Python Imports
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Generator, Iterable, List, Optional, Tuple
+
+# Module Imports
+from .coverage import Coverage
+from .exercise import Exercise
+from .verdict_cache import Verdict, VerdictCache
+
+__all__ = (
+    'ThreadedGrader',
+    'is_free_threaded'
+)
+
+Submission = Tuple[Exercise, Callable[[Any], Generator]]
+
+
+def is_free_threaded() -> bool:
+    """Returns True, if interpreter runs without GIL"""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _check(
+        exercise: Exercise,
+        generator: Callable[[Any], Generator],
+        coverage: Coverage
+) -> Verdict:
+    try:
+        exercise.check_generator(generator, coverage)
+    except Exception as e:
+        return Verdict.from_exception(e)
+    return Verdict.from_exception(None)
+
+
+class ThreadedGrader:
+    """Checks submissions in thread pool. On free-threaded interpreter
+    checks run on all cores without processes spawn and pickling,
+    on regular builds checks are still correct, but share one core.
+    Every check uses own task objects and thread-local random generator
+    """
+    __slots__ = ('_executor', 'cache', 'coverage')
+
+    def __init__(
+            self,
+            max_workers: Optional[int] = None,
+            cache: Optional[VerdictCache] = None,
+            coverage: Coverage = Coverage.ONE_FACTOR
+    ):
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix='gentasks'
+        )
+        self.cache: Optional[VerdictCache] = cache
+        self.coverage: Coverage = Coverage(coverage)
+
+    def __enter__(self) -> 'ThreadedGrader':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def check(
+            self,
+            exercise: Exercise,
+            generator: Callable[[Any], Generator]
+    ) -> Verdict:
+        """Checks submission in current thread"""
+        if self.cache is not None:
+            return self.cache.check(exercise, generator, self.coverage)
+        return _check(exercise, generator, self.coverage)
+
+    def submit(
+            self,
+            exercise: Exercise,
+            generator: Callable[[Any], Generator]
+    ) -> 'Future[Verdict]':
+        """Schedules submission check in thread pool"""
+        return self._executor.submit(self.check, exercise, generator)
+
+    def check_many(self, submissions: Iterable[Submission]) -> List[Verdict]:
+        """Checks submissions in thread pool
+        :param submissions: Pairs of exercise and function to check
+        :return: Verdicts in order of submissions
+        :rtype: List[Verdict]
+        """
+        futures = [
+            self.submit(exercise, generator)
+            for exercise, generator in submissions
+        ]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        self._executor.shutdown()
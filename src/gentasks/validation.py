@@ -0,0 +1,140 @@
+# Python Imports
+import dis
+from inspect import CO_GENERATOR
+from types import CodeType
+from typing import Any, Callable, Generator, Iterator, TYPE_CHECKING
+
+# Module Imports
+from .exceptions import SubmissionRejected
+
+if TYPE_CHECKING:
+    from .exercise import Exercise
+
+__all__ = (
+    'FORBIDDEN_NAMES',
+    'prevalidate',
+    'prevalidate_source',
+    'prevalidate_code'
+)
+
+FORBIDDEN_NAMES = frozenset({
+    'open', 'eval', 'exec', 'compile', '__import__', 'input', 'breakpoint'
+})
+"""Built-in functions, that submissions can't use"""
+
+_IMPORT_OPCODES = frozenset({'IMPORT_NAME', 'IMPORT_FROM', 'IMPORT_STAR'})
+_NAME_OPCODES = frozenset({
+    'LOAD_GLOBAL', 'LOAD_NAME', 'LOAD_DEREF', 'LOAD_FROM_DICT_OR_GLOBALS'
+})
+_DELEGATE_OPCODES = frozenset({'SEND', 'YIELD_FROM'})
+_SKIPPED_OPCODES = frozenset({'RESUME', 'CACHE', 'NOP', 'EXTENDED_ARG'})
+
+
+def _walk(code: CodeType) -> Iterator[CodeType]:
+    """Yields code object and all nested code objects"""
+    yield code
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            yield from _walk(constant)
+
+
+def _check_forbidden(code: CodeType) -> None:
+    for nested in _walk(code):
+        for instruction in dis.get_instructions(nested):
+            if instruction.opname in _IMPORT_OPCODES:
+                raise SubmissionRejected("Импорт модулей запрещён")
+            if (
+                    instruction.opname in _NAME_OPCODES
+                    and instruction.argval in FORBIDDEN_NAMES
+            ):
+                raise SubmissionRejected(
+                    f"Использование {instruction.argval} запрещено"
+                )
+
+
+def _receives_values(code: CodeType) -> bool:
+    """Returns True, if generator uses value of any yield expression
+    (or delegates to another generator with yield from)
+    """
+    for nested in _walk(code):
+        instructions = [
+            instruction for instruction in dis.get_instructions(nested)
+            if instruction.opname not in _SKIPPED_OPCODES
+        ]
+        for instruction, following in zip(instructions, instructions[1:]):
+            if instruction.opname in _DELEGATE_OPCODES:
+                return True
+            if (
+                    instruction.opname == 'YIELD_VALUE'
+                    and following.opname != 'POP_TOP'
+            ):
+                return True
+    return False
+
+
+def _check_function(code: CodeType, exercise: 'Exercise') -> None:
+    if not code.co_flags & CO_GENERATOR:
+        raise SubmissionRejected("Функция не является генератором")
+    if '.send()' in exercise.notes() and not _receives_values(code):
+        raise SubmissionRejected(
+            "Генератор не использует значения, переданные через .send()"
+        )
+
+
+def prevalidate(
+        function: Callable[[Any], Generator],
+        exercise: 'Exercise'
+) -> None:
+    """Checks function code without executing it
+    :param function: Function, that should return generator
+    :param exercise: Exercise, that function solves
+    :raises SubmissionRejected: if function is not generator function,
+        doesn't receive values when exercise requires .send(),
+        or uses imports and forbidden built-in functions
+    """
+    function = getattr(function, '__func__', function)
+    code = getattr(function, '__code__', None)
+    if not isinstance(code, CodeType):
+        raise SubmissionRejected("Функция не является генератором")
+    _check_forbidden(code)
+    _check_function(code, exercise)
+
+
+def prevalidate_source(
+        source: str,
+        exercise: 'Exercise',
+        name: str = 'main'
+) -> None:
+    """Checks submission source without executing it
+    :param source: Submission source code
+    :param exercise: Exercise, that submission solves
+    :param name: Name of function, that should return generator
+    :raises SubmissionRejected: if source can't be compiled,
+        doesn't define function, or function doesn't pass prevalidate()
+    """
+    try:
+        module = compile(source, '<submission>', 'exec')
+    except SyntaxError as e:
+        raise SubmissionRejected(f"Синтаксическая ошибка: {e}") from e
+    prevalidate_code(module, exercise, name)
+
+
+def prevalidate_code(
+        module: CodeType,
+        exercise: 'Exercise',
+        name: str = 'main'
+) -> None:
+    """Checks compiled submission module without executing it
+    :param module: Compiled submission source
+    :param exercise: Exercise, that submission solves
+    :param name: Name of function, that should return generator
+    :raises SubmissionRejected: if module doesn't define function,
+        or function doesn't pass prevalidate()
+    """
+    _check_forbidden(module)
+
+    for constant in module.co_consts:
+        if isinstance(constant, CodeType) and constant.co_name == name:
+            _check_function(constant, exercise)
+            return
+    raise SubmissionRejected(f"Функция {name} не найдена")
@@ -0,0 +1,365 @@
+# Python Imports
+import builtins
+import dataclasses
+import sqlite3
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+from time import perf_counter
+from types import BuiltinFunctionType, CodeType, FunctionType
+from types import GetSetDescriptorType, MemberDescriptorType, ModuleType
+from typing import Any, Callable, Generator, Iterable, Optional, Set, Tuple
+
+# Module Imports
+from . import exceptions
+from .coverage import Coverage
+from .constants import VERDICT_CACHE_SIZE
+from .exercise import Exercise
+from .identifiers import encode, to_string
+from .metrics import CACHE_REQUESTS, CHECK_SECONDS
+
+__all__ = (
+    'Verdict',
+    'VerdictCache',
+    'fingerprint'
+)
+
+_SIMPLE_TYPES = (int, float, complex, str, bytes, bool, type(None))
+
+
+def _hash_code(code: CodeType, hasher) -> None:
+    """Feeds hasher with code object parts, that define behaviour.
+    File name, local variables names and line numbers are skipped
+    """
+    hasher.update(code.co_code)
+    hasher.update(repr((
+        code.co_argcount, code.co_posonlyargcount, code.co_kwonlyargcount,
+        code.co_flags,
+        code.co_names, code.co_nlocals,
+        code.co_freevars, code.co_cellvars
+    )).encode())
+    for constant in code.co_consts:
+        _hash_constant(constant, hasher)
+
+
+def _hash_constant(constant: Any, hasher) -> None:
+    """Feeds hasher with code constant. Frozensets are hashed
+    by sorted element digests, because their repr order depends
+    on hash seed
+    """
+    if isinstance(constant, CodeType):
+        _hash_code(constant, hasher)
+    elif isinstance(constant, tuple):
+        hasher.update(f"tuple {len(constant)}".encode())
+        for element in constant:
+            _hash_constant(element, hasher)
+    elif isinstance(constant, frozenset):
+        digests = []
+        for element in constant:
+            element_hasher = sha256()
+            _hash_constant(element, element_hasher)
+            digests.append(element_hasher.digest())
+        hasher.update(f"frozenset {len(constant)}".encode())
+        for digest in sorted(digests):
+            hasher.update(digest)
+    else:
+        hasher.update(repr(constant).encode())
+
+
+def _hash_function(
+        function: FunctionType,
+        hasher,
+        seen: Set[int],
+        module: str
+) -> None:
+    if id(function) in seen:
+        return
+    seen.add(id(function))
+
+    code: CodeType = function.__code__
+    _hash_code(code, hasher)
+    _hash_value(function.__defaults__, hasher, seen, module)
+    _hash_value(function.__kwdefaults__, hasher, seen, module)
+
+    # Closures and globals can change behaviour of function
+    for cell in function.__closure__ or ():
+        _hash_value(cell.cell_contents, hasher, seen, module)
+    for name in code.co_names:
+        if name in function.__globals__:
+            hasher.update(name.encode())
+            _hash_value(function.__globals__[name], hasher, seen, module)
+
+
+def _hash_class(cls: type, hasher, seen: Set[int], module: str) -> None:
+    """Feeds hasher with name, bases and attributes of class"""
+    hasher.update(f"class {cls.__qualname__}".encode())
+    for base in cls.__bases__:
+        _hash_value(base, hasher, seen, module)
+    for name, value in sorted(vars(cls).items()):
+        if name in ('__dict__', '__weakref__', '__module__'):
+            continue
+        hasher.update(name.encode())
+        _hash_value(value, hasher, seen, module)
+
+
+def _hash_unordered(
+        values: Iterable[Any],
+        hasher,
+        seen: Set[int],
+        module: str
+) -> None:
+    digests = []
+    for value in values:
+        value_hasher = sha256()
+        _hash_value(value, value_hasher, seen, module)
+        digests.append(value_hasher.digest())
+    for digest in sorted(digests):
+        hasher.update(digest)
+
+
+def _hash_value(value: Any, hasher, seen: Set[int], module: str) -> None:
+    """Feeds hasher with structure of value, referenced by submission.
+    Functions, classes and containers are hashed recursively, classes,
+    functions and modules from other modules are hashed by name
+    :raises ValueError: if value can't be hashed structurally
+    """
+    if isinstance(value, _SIMPLE_TYPES):
+        hasher.update(repr(value).encode())
+        return
+    if id(value) in seen:
+        hasher.update(b'<seen>')
+        return
+
+    if isinstance(value, FunctionType):
+        _hash_function(value, hasher, seen, module)
+        return
+    if isinstance(value, ModuleType):
+        hasher.update(f"module {value.__name__}".encode())
+        return
+    if isinstance(value, (MemberDescriptorType, GetSetDescriptorType)):
+        # Created from __slots__, that is hashed itself
+        hasher.update(type(value).__qualname__.encode())
+        return
+    if isinstance(value, (type, BuiltinFunctionType)):
+        if value.__module__ != module:
+            hasher.update(
+                f"{value.__module__}.{value.__qualname__}".encode()
+            )
+            return
+    seen.add(id(value))
+
+    hasher.update(type(value).__qualname__.encode())
+    if isinstance(value, type):
+        _hash_class(value, hasher, seen, module)
+    elif isinstance(value, (staticmethod, classmethod)):
+        _hash_value(value.__func__, hasher, seen, module)
+    elif isinstance(value, property):
+        for accessor in (value.fget, value.fset, value.fdel):
+            _hash_value(accessor, hasher, seen, module)
+    elif isinstance(value, (tuple, list)):
+        hasher.update(str(len(value)).encode())
+        for element in value:
+            _hash_value(element, hasher, seen, module)
+    elif isinstance(value, (set, frozenset)):
+        _hash_unordered(value, hasher, seen, module)
+    elif isinstance(value, dict):
+        _hash_unordered(value.items(), hasher, seen, module)
+    else:
+        raise ValueError(
+            f"Can't fingerprint value of type {type(value).__qualname__}"
+        )
+
+
+def fingerprint(function: Callable[[Any], Generator]) -> str:
+    """Returns hash of normalized function code and everything it
+    references. Functions with same code, but different names, files
+    or formatting have same fingerprint
+    :param function: Function, that returns generator
+    :return: Hex digest of function code
+    :rtype: str
+    :raises ValueError: if function references value, that can't be
+        hashed structurally (for example, object of third-party class)
+    """
+    hasher = sha256()
+    function = getattr(function, '__func__', function)
+    if isinstance(function, FunctionType):
+        _hash_function(
+            function, hasher, set(), function.__globals__.get('__name__')
+        )
+    else:
+        hasher.update(repr(function).encode())
+    return hasher.hexdigest()
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Verdict:
+    """Result of exercise check"""
+    passed: bool
+    error: Optional[str] = None
+    """Name of raised exception type"""
+    message: str = ''
+
+    @classmethod
+    def from_exception(cls, exception: Optional[Exception]) -> 'Verdict':
+        if exception is None:
+            return cls(True)
+        return cls(False, type(exception).__qualname__, str(exception))
+
+    def raise_error(self) -> None:
+        """Raises exception, same as one that was raised during check
+        :raises Exception: if verdict is not passed
+        """
+        if self.passed:
+            return
+        exception_type = getattr(exceptions, self.error, None) or \
+            getattr(builtins, self.error, None)
+        if not (
+                isinstance(exception_type, type)
+                and issubclass(exception_type, Exception)
+        ):
+            exception_type = Exception
+        raise exception_type(self.message)
+
+
+class VerdictCache:
+    """Verdicts of exercise checks, keyed by exercise identifier,
+    coverage strategy and fingerprint of checked function.
+    Least recently used verdicts evicted from memory after maxsize.
+    If path passed, verdicts also stored in SQLite database on disk
+    """
+    __slots__ = (
+        '_verdicts', 'maxsize', '_connection', 'hits', 'misses', '_lock'
+    )
+
+    def __init__(
+            self,
+            maxsize: int = VERDICT_CACHE_SIZE,
+            path: Optional[str] = None
+    ):
+        self._verdicts: OrderedDict[Tuple, Verdict] = OrderedDict()
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock = Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._connection = sqlite3.connect(
+                path, check_same_thread=False
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS verdicts (key TEXT PRIMARY KEY,"
+                " passed INTEGER, error TEXT, message TEXT)"
+            )
+            self._connection.commit()
+
+    def __len__(self) -> int:
+        return len(self._verdicts)
+
+    @staticmethod
+    def key(
+            exercise: Exercise,
+            generator: Callable[[Any], Generator],
+            coverage: Coverage = Coverage.ONE_FACTOR
+    ) -> Tuple[str, str, str]:
+        """:raises ValueError: if function can't be fingerprinted"""
+        return (
+            to_string(encode(exercise)),
+            Coverage(coverage).value,
+            fingerprint(generator)
+        )
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[Verdict]:
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key: Tuple[str, str, str]) -> Optional[Verdict]:
+        verdict = self._verdicts.get(key)
+        if verdict is not None:
+            self._verdicts.move_to_end(key)
+            return verdict
+        if self._connection is None:
+            return None
+
+        row = self._connection.execute(
+            "SELECT passed, error, message FROM verdicts WHERE key = ?",
+            (':'.join(key),)
+        ).fetchone()
+        if row is None:
+            return None
+        verdict = Verdict(bool(row[0]), row[1], row[2])
+        self._remember(key, verdict)
+        return verdict
+
+    def set(self, key: Tuple[str, str, str], verdict: Verdict) -> None:
+        with self._lock:
+            self._remember(key, verdict)
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?)",
+                    (':'.join(key), int(verdict.passed),
+                     verdict.error, verdict.message)
+                )
+                self._connection.commit()
+
+    def _remember(self, key: Tuple[str, str, str], verdict: Verdict) -> None:
+        self._verdicts[key] = verdict
+        self._verdicts.move_to_end(key)
+        if len(self._verdicts) > self.maxsize:
+            self._verdicts.popitem(last=False)
+
+    def check(
+            self,
+            exercise: Exercise,
+            generator: Callable[[Any], Generator],
+            coverage: Coverage = Coverage.ONE_FACTOR
+    ) -> Verdict:
+        """Returns verdict of exercise.check_generator(). Check runs only
+        if same function wasn't checked before. Verdicts of functions,
+        that can't be fingerprinted, are never cached
+        :param exercise: Exercise to check
+        :param generator: Function, that returns generator
+        :param coverage: Strategy of combining tasks check cases
+        :rtype: Verdict
+        """
+        start = perf_counter()
+        try:
+            key = self.key(exercise, generator, coverage)
+        except ValueError:
+            # Function can't be fingerprinted, verdict isn't cached
+            return self._check(exercise, generator, coverage)
+        with self._lock:
+            verdict = self._get(key)
+            if verdict is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if verdict is not None:
+            CACHE_REQUESTS.inc(cache='verdict', result='hit')
+            CHECK_SECONDS.observe(
+                perf_counter() - start,
+                mode='cached', tasks=str(len(exercise.tasks()))
+            )
+            return verdict
+        CACHE_REQUESTS.inc(cache='verdict', result='miss')
+
+        verdict = self._check(exercise, generator, coverage)
+        self.set(key, verdict)
+        return verdict
+
+    @staticmethod
+    def _check(
+            exercise: Exercise,
+            generator: Callable[[Any], Generator],
+            coverage: Coverage
+    ) -> Verdict:
+        try:
+            exercise.check_generator(generator, coverage)
+        except Exception as e:
+            return Verdict.from_exception(e)
+        return Verdict.from_exception(None)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,80 @@
+import asyncio
+import unittest
+
+from gentasks import async_tasktypes
+from gentasks.async_exercise import AsyncExercise, check_many, grade_many
+from gentasks.coverage import Coverage
+
+
+async def range_iterator(range_arguments, iterator_arguments):
+    for value in range(*range_arguments):
+        yield value
+    for value in iterator_arguments[0]:
+        yield value
+
+
+async def fibonacci(fibonacci_arguments):
+    first, second = 0, 1
+    try:
+        while True:
+            yield first
+            first, second = second, first + second
+    except StopIteration:
+        yield second
+
+
+async def sleeping(*arguments):
+    await asyncio.sleep(10)
+    yield
+
+
+class TestAsyncTasks(unittest.TestCase):
+    def test_registry(self) -> None:
+        self.assertEqual(len(async_tasktypes.ASYNC_TASKS), 5)
+        self.assertEqual(
+            async_tasktypes.AsyncFibonacci.complexity,
+            async_tasktypes.Fibonacci.complexity
+        )
+
+    def test_reference(self) -> None:
+        tasks = async_tasktypes.ASYNC_TASKS
+        for length in (1, 2, 3):
+            exercise = AsyncExercise(tasks[:length])
+            asyncio.run(exercise.check_generator(exercise.generator))
+            asyncio.run(exercise.check_generator(
+                exercise.generator, Coverage.PAIRWISE
+            ))
+
+    def test_submissions(self) -> None:
+        exercise = AsyncExercise((
+            async_tasktypes.AsyncRange, async_tasktypes.AsyncIterator
+        ))
+        fibonacci_exercise = AsyncExercise((async_tasktypes.AsyncFibonacci,))
+        asyncio.run(exercise.check_generator(range_iterator))
+        asyncio.run(fibonacci_exercise.check_generator(fibonacci))
+
+    def test_many(self) -> None:
+        exercise = AsyncExercise((
+            async_tasktypes.AsyncRange, async_tasktypes.AsyncIterator
+        ))
+        verdicts = grade_many(
+            [(exercise, range_iterator)] * 50
+            + [(exercise, sleeping), (exercise, exercise.generator)],
+            deadline=0.5
+        )
+        self.assertTrue(all(verdict.passed for verdict in verdicts[:50]))
+        self.assertEqual(verdicts[50].error, 'TimeoutError')
+        self.assertTrue(verdicts[51].passed)
+
+    def test_not_async(self) -> None:
+        exercise = AsyncExercise((async_tasktypes.AsyncRange,))
+
+        def main(range_arguments):
+            yield from range(*range_arguments)
+
+        verdicts = asyncio.run(check_many([(exercise, main)]))
+        self.assertEqual(verdicts[0].error, 'TypeError')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from gentasks.task_generator import PrecheckExerciseGenerator
+
+try:
+    import numpy
+    from gentasks.batch import Query
+except ImportError:
+    numpy = None
+
+
+@unittest.skipUnless(numpy, "numpy is not installed")
+class TestBatchQuery(unittest.TestCase):
+    generator: PrecheckExerciseGenerator = PrecheckExerciseGenerator()
+
+    def expected(self, query: 'Query') -> list:
+        indices = []
+        for index, combination in enumerate(self.generator._combinations):
+            notes = set()
+            for task in combination:
+                notes.update(task.notes)
+            if not query.start <= self.generator._complexity[index] \
+                    < query.end:
+                continue
+            if query.amount is not None and len(combination) != query.amount:
+                continue
+            if not query.notes <= notes:
+                continue
+            indices.append(index)
+        return indices
+
+    def test_batch_query(self) -> None:
+        notes = sorted({
+            note for task in self.generator.tasks() for note in task.notes
+        })
+        queries = [
+            Query(start, start + width, amount, frozenset(notes[:note]))
+            for start in range(0, 20, 3)
+            for width in (1, 5, 30)
+            for amount in (None, 1, 2, 3)
+            for note in (0, 1, 2)
+        ]
+        queries.append(Query(0, 100, None, frozenset({'unknown'})))
+        queries.append(Query(10, 5))
+        results = self.generator.batch_query(queries)
+        self.assertEqual(len(results), len(queries))
+        for query, result in zip(queries, results):
+            self.assertEqual(result.tolist(), self.expected(query))
+
+    def test_exercises_at(self) -> None:
+        result, = self.generator.batch_query([Query(0, 10, 2)])
+        exercises = self.generator.exercises_at(result, False)
+        self.assertEqual(len(exercises), len(result))
+        for exercise in exercises:
+            self.assertEqual(len(exercise.tasks()), 2)
+            self.assertLess(exercise.complexity, 10)
+
+    def test_masks(self) -> None:
+        table = self.generator.batch_table()
+        self.assertIs(table, self.generator.batch_table())
+        tasks = table.tasks
+        for combination, mask in zip(table.combinations, table.masks):
+            self.assertEqual(int(mask), sum(
+                1 << tasks.index(task) for task in combination
+            ))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import io
+import os
+import tempfile
+import unittest
+
+from gentasks.cohort import IssuedSet, assign, _read_varints, _write_varint
+from gentasks.identifiers import ExerciseCodec
+from gentasks.task_generator import PrecheckExerciseGenerator
+
+
+class TestCohort(unittest.TestCase):
+    generator = PrecheckExerciseGenerator()
+
+    def test_distinct(self) -> None:
+        assignments = list(assign(self.generator, 20, 8))
+        self.assertEqual([i.seat for i in assignments], list(range(20)))
+        self.assertEqual(len({i.identifier for i in assignments}), 20)
+        self.assertEqual(
+            len({frozenset(i.exercise.tasks()) for i in assignments}), 20
+        )
+        codec = ExerciseCodec(self.generator.tasks())
+        for assignment in assignments:
+            self.assertEqual(
+                codec.encode_set(assignment.exercise.tasks()),
+                assignment.identifier
+            )
+            self.assertEqual(
+                assignment.exercise.complexity, assignment.complexity
+            )
+
+    def test_closest(self) -> None:
+        assignments = list(assign(self.generator, 5, 8, window=1))
+        distances = sorted(
+            abs(complexity - 8) for complexity in self.generator._complexity
+        )
+        self.assertEqual(
+            sorted(abs(i.complexity - 8) for i in assignments),
+            distances[:5]
+        )
+
+    def test_neighbours(self) -> None:
+        assignments = list(assign(self.generator, 10, 8, window=8))
+        for previous, current in zip(assignments, assignments[1:]):
+            self.assertNotEqual(
+                set(previous.exercise.tasks()), set(current.exercise.tasks())
+            )
+        shared = sum(
+            len(set(a.exercise.tasks()) & set(b.exercise.tasks()))
+            for a, b in zip(assignments, assignments[1:])
+        )
+        closest = list(assign(self.generator, 10, 8, window=1))
+        shared_closest = sum(
+            len(set(a.exercise.tasks()) & set(b.exercise.tasks()))
+            for a, b in zip(closest, closest[1:])
+        )
+        self.assertLessEqual(shared, shared_closest)
+
+    def test_exhausted(self) -> None:
+        total = len(self.generator._combinations)
+        with self.assertRaises(ValueError):
+            list(assign(self.generator, total + 1, 8))
+
+    def test_sessions(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'issued.bin')
+            with IssuedSet(path) as issued:
+                first = [
+                    i.identifier
+                    for i in assign(self.generator, 10, 8, issued)
+                ]
+            with IssuedSet(path) as issued:
+                self.assertEqual(set(issued), set(first))
+                second = [
+                    i.identifier
+                    for i in assign(self.generator, 10, 8, issued)
+                ]
+            self.assertFalse(set(first) & set(second))
+            with IssuedSet(path) as issued:
+                self.assertEqual(len(issued), 20)
+
+    def test_varints(self) -> None:
+        values = [0, 1, 127, 128, 300, 2 ** 64 + 5]
+        file = io.BytesIO()
+        for value in values:
+            _write_varint(value, file)
+        self.assertEqual(list(_read_varints(file.getvalue())), values)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from itertools import combinations, product
+
+import gentasks.tasktypes as tasktypes
+from gentasks.coverage import Coverage
+from gentasks.exercise import Exercise
+
+
+class TestCoverage(unittest.TestCase):
+    sizes = (3, 4, 1, 5)
+
+    def test_quick(self) -> None:
+        self.assertEqual([*Coverage.QUICK.variants(self.sizes)], [(0,) * 4])
+
+    def test_one_factor(self) -> None:
+        variants = [*Coverage.ONE_FACTOR.variants(self.sizes)]
+        self.assertEqual(len(variants), sum(self.sizes) - len(self.sizes) + 1)
+        for variant, following in zip(variants, variants[1:]):
+            changed = sum(1 for i, j in zip(variant, following) if i != j)
+            self.assertEqual(changed, 1)
+
+    def test_pairwise(self) -> None:
+        variants = [*Coverage.PAIRWISE.variants(self.sizes)]
+        for first, second in combinations(range(len(self.sizes)), 2):
+            pairs = {(i[first], i[second]) for i in variants}
+            self.assertEqual(len(pairs), self.sizes[first]*self.sizes[second])
+        self.assertLess(len(variants), 3 * 4 * 5)
+
+    def test_product(self) -> None:
+        variants = [*Coverage.PRODUCT.variants(self.sizes)]
+        self.assertEqual(
+            variants, [*product(*(range(i) for i in self.sizes))]
+        )
+
+    def test_exercise(self) -> None:
+        exercise = Exercise((tasktypes.Range, tasktypes.Iterator))
+        for coverage in Coverage:
+            exercise.check_generator(exercise.generator, coverage)
+        self.assertEqual(
+            len([*exercise.all_variants(Coverage.PRODUCT)]), 3 * 5
+        )
+        self.assertEqual(
+            len([*exercise.all_variants('quick')]), 1
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
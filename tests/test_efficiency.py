@@ -0,0 +1,62 @@
+import tracemalloc
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import gentasks.tasktypes as tasktypes
+from gentasks.efficiency import EfficiencyLimits, check_efficiency
+from gentasks.exercise import FrozenExercise
+
+
+def lazy(range_arguments, iterator_arguments):
+    yield from range(*range_arguments)
+    yield from iterator_arguments[0]
+
+
+def eager(range_arguments, iterator_arguments):
+    yield from list(range(*range_arguments))
+    yield from [*iterator_arguments[0]]
+
+
+class TestEfficiency(unittest.TestCase):
+    exercise = FrozenExercise((tasktypes.Range, tasktypes.Iterator))
+    limits = EfficiencyLimits(items=1000, length=100_000)
+
+    def test_lazy(self) -> None:
+        results = check_efficiency(self.exercise, lazy, self.limits)
+        self.assertEqual([i.task for i in results], ['Range', 'Iterator'])
+        for result in results:
+            self.assertTrue(result.passed, result)
+            self.assertEqual(result.items, 1000)
+
+    def test_eager(self) -> None:
+        results = check_efficiency(self.exercise, eager, self.limits)
+        for result in results:
+            self.assertFalse(result.passed)
+            self.assertGreater(result.peak_bytes, self.limits.max_peak_bytes)
+
+    def test_concurrent(self) -> None:
+        with ThreadPoolExecutor(4) as executor:
+            reports = list(executor.map(
+                lambda generator: check_efficiency(
+                    self.exercise, generator, self.limits
+                ),
+                [lazy, eager] * 4
+            ))
+        for generator, results in zip([lazy, eager] * 4, reports):
+            for result in results:
+                self.assertEqual(result.passed, generator is lazy, result)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_unsupported_task(self) -> None:
+        exercise = FrozenExercise((tasktypes.AwaitKeyword,))
+        self.assertEqual(check_efficiency(exercise, lazy, self.limits), [])
+
+    def test_report(self) -> None:
+        report = self.exercise.check_report(lazy, efficiency=self.limits)
+        self.assertTrue(report.passed)
+        self.assertTrue(report.efficient)
+        self.assertEqual(len(report.efficiency), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import pickle
+import unittest
+
+import gentasks.tasktypes as tasktypes
+from gentasks.exceptions import GeneratorWrongType, GeneratorWrongValue
+from gentasks.exercise import Exercise, FrozenExercise
+
+
+class TestFrozenExercise(unittest.TestCase):
+    tasks = (tasktypes.Range, tasktypes.AwaitKeyword, tasktypes.Fibonacci)
+
+    def test_interned(self) -> None:
+        self.assertIs(FrozenExercise(self.tasks), FrozenExercise(self.tasks))
+        self.assertIsNot(
+            FrozenExercise(self.tasks), FrozenExercise(self.tasks[::-1])
+        )
+
+    def test_hashable(self) -> None:
+        exercises = {FrozenExercise(self.tasks), FrozenExercise(self.tasks)}
+        self.assertEqual(len(exercises), 1)
+
+    def test_immutable(self) -> None:
+        exercise = FrozenExercise(self.tasks)
+        self.assertRaises(TypeError, lambda: exercise.append(tasktypes.Range))
+        self.assertRaises(TypeError, lambda: exercise.pop(0))
+        with self.assertRaises(AttributeError):
+            exercise.complexity = 0
+
+    def test_same_as_exercise(self) -> None:
+        frozen = FrozenExercise(self.tasks)
+        exercise = Exercise(self.tasks)
+        self.assertEqual(frozen.complexity, exercise.complexity)
+        self.assertEqual(frozen.notes(), exercise.notes())
+        self.assertEqual(frozen.names(), exercise.names())
+        self.assertEqual(frozen.tasks(), exercise.tasks())
+        self.assertEqual([*frozen.all_variants()], [*exercise.all_variants()])
+        self.assertTrue(
+            frozen.description().startswith(exercise._description_tasks())
+        )
+
+    def test_check(self) -> None:
+        exercise = FrozenExercise(self.tasks)
+        exercise.check_generator(exercise.generator)
+
+    def test_mutating_submission(self) -> None:
+        exercise = FrozenExercise((tasktypes.Iterator,))
+        variants = [*exercise.all_variants()]
+
+        def main(arguments):
+            if isinstance(arguments[0], list):
+                arguments[0].clear()
+            yield from arguments[0]
+
+        with self.assertRaises(Exception):
+            exercise.check_generator(main)
+        self.assertFalse(exercise.check_report(main).passed)
+        self.assertEqual([*exercise.all_variants()], variants)
+        exercise.check_generator(exercise.generator)
+
+
+class TestReport(unittest.TestCase):
+    exercise = FrozenExercise((tasktypes.Range, tasktypes.Iterator))
+
+    def test_passed(self) -> None:
+        report = self.exercise.check_report(self.exercise.generator)
+        self.assertTrue(report.passed)
+        self.assertEqual(report.variants, 7)
+
+    def test_all_failures(self) -> None:
+        def main(range_arguments, iterator_arguments):
+            start, end = range_arguments
+            yield from range(start, end)
+            for value in iterator_arguments[0]:
+                yield str(value)
+
+        report = self.exercise.check_report(main)
+        self.assertFalse(report.passed)
+        self.assertEqual(len(report.failures), 2)
+        self.assertEqual([*report.by_task()], ['Iterator'])
+        failure = report.failures[0]
+        self.assertEqual(failure.error, 'GeneratorWrongType')
+        self.assertEqual((failure.expected, failure.actual), (1, '1'))
+        self.assertEqual(failure.call, 1)
+        self.assertEqual(failure.task_index, 1)
+
+    def test_limits(self) -> None:
+        def main(*arguments):
+            yield 'wrong'
+
+        report = self.exercise.check_report(main, max_failures=3)
+        self.assertEqual(len(report.failures), 3)
+        self.assertFalse(report.complete)
+
+    def test_stress(self) -> None:
+        def main(range_arguments, iterator_arguments):
+            yield from range(*range_arguments)
+            yield from iterator_arguments[0]
+
+        exercise = FrozenExercise((tasktypes.Iterator,))
+        variants = [*exercise.all_variants(stress=True)]
+        self.assertIsInstance(variants[-1][0][0], memoryview)
+        report = self.exercise.check_report(main, 'quick', stress=True)
+        self.assertTrue(report.passed)
+
+    def test_not_generator(self) -> None:
+        report = self.exercise.check_report(lambda *arguments: None)
+        self.assertEqual(len(report.failures), 1)
+        self.assertEqual(report.failures[0].task, None)
+
+    def test_pickle_errors(self) -> None:
+        for error in (GeneratorWrongValue, GeneratorWrongType):
+            copy = pickle.loads(pickle.dumps(error('Ошибка', 1, '1', 2)))
+            self.assertIs(type(copy), error)
+            self.assertEqual(copy.args, ('Ошибка',))
+            self.assertEqual(
+                (copy.expected, copy.actual, copy.call), (1, '1', 2)
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
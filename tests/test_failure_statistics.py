@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+
+import gentasks.tasktypes as tasktypes
+from gentasks.exercise import FrozenExercise
+from gentasks.failure_statistics import FailureStatistics
+
+
+def fails_on_tuple(iterator_arguments):
+    iterable = iterator_arguments[0]
+    if isinstance(iterable, tuple):
+        yield from (-i for i in iterable)
+    yield from iterable
+
+
+class TestFailureStatistics(unittest.TestCase):
+    exercise = FrozenExercise((tasktypes.Iterator,))
+
+    def test_order(self) -> None:
+        statistics = FailureStatistics()
+        for _ in range(10):
+            statistics.record('Iterator', 3, False, 1e-5)
+            statistics.record('Iterator', 4, True, 1e-5)
+        variants = [((case,), [case]) for case in range(5)]
+        ordered = statistics.order(['Iterator'], variants)
+        self.assertEqual(ordered[0], ((4,), [4]))
+        self.assertEqual(ordered[1:], [variants[3], *variants[:3]])
+
+    def test_check_records(self) -> None:
+        statistics = FailureStatistics()
+        self.exercise.check_generator(
+            self.exercise.generator, statistics=statistics
+        )
+        self.assertLess(statistics.failure_rate('Iterator', 1), 0.5)
+        self.assertRaises(ValueError, lambda: self.exercise.check_generator(
+            fails_on_tuple, statistics=statistics
+        ))
+        self.assertEqual(statistics.failure_rate('Iterator', 1), 0.5)
+
+    def test_stress_separate(self) -> None:
+        statistics = FailureStatistics()
+        statistics.record('Iterator', 0, False, 1e-5)
+        statistics.record('Iterator', 0, True, 2.0, stress=True)
+        self.assertEqual(statistics.expected_seconds('Iterator', 0), 1e-5)
+        self.assertLess(statistics.failure_rate('Iterator', 0), 0.5)
+        self.assertEqual(
+            statistics.expected_seconds('Iterator', 0, stress=True), 2.0
+        )
+        self.assertGreater(
+            statistics.failure_rate('Iterator', 0, stress=True), 0.5
+        )
+
+    def test_persisted(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'statistics.json')
+            statistics = FailureStatistics(path)
+            statistics.record('Range', 1, True, 0.5)
+            statistics.save()
+            statistics = FailureStatistics(path)
+            self.assertEqual(statistics.failure_rate('Range', 1), 2 / 3)
+            self.assertEqual(statistics.expected_seconds('Range', 1), 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
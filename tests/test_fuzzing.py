@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from random import Random
+
+from gentasks.exercise import FrozenExercise
+from gentasks.fuzzing import CounterexampleCache, draw_arguments, fuzz
+from gentasks.tasktypes import TASKS, Range, Iterator, Fibonacci
+
+
+def range_bug(range_arguments):
+    start, end = range_arguments
+    if end - start >= 5:
+        start += 1
+    yield from range(start, end)
+
+
+def clearing(iterator_arguments):
+    iterable, = iterator_arguments
+    if isinstance(iterable, list):
+        iterable.clear()
+    yield from iterable
+
+
+class TestFuzzing(unittest.TestCase):
+    exercise = FrozenExercise((Range,))
+
+    def test_draw(self) -> None:
+        random = Random(0)
+        for task in TASKS:
+            for _ in range(20):
+                task(*draw_arguments(task, random))
+
+    def test_valid(self) -> None:
+        exercise = FrozenExercise((Iterator, Range, Fibonacci))
+        self.assertIsNone(
+            fuzz(exercise, exercise.generator, max_cases=200, seed=0)
+        )
+
+    def test_shrink(self) -> None:
+        counterexample = fuzz(self.exercise, range_bug, seed=0)
+        self.assertIsNotNone(counterexample)
+        (start, end), = counterexample.arguments
+        self.assertEqual(end - start, 5)
+        self.assertLessEqual(abs(start) + abs(end), 5)
+        self.assertGreater(counterexample.cases, 0)
+
+    def test_mutating_submission(self) -> None:
+        counterexample = fuzz(FrozenExercise((Iterator,)), clearing, seed=0)
+        self.assertIsNotNone(counterexample)
+        (iterable,), = counterexample.arguments
+        self.assertIsInstance(iterable, list)
+        self.assertEqual(len(iterable), 1)
+
+    def test_time_limit(self) -> None:
+        self.assertIsNone(fuzz(
+            self.exercise, self.exercise.generator,
+            max_cases=10 ** 9, time_limit=0.05
+        ))
+
+    def test_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'counterexamples.json')
+            found = fuzz(
+                self.exercise, range_bug, seed=0,
+                cache=CounterexampleCache(path)
+            )
+            replayed = fuzz(
+                self.exercise, range_bug, max_cases=0,
+                cache=CounterexampleCache(path)
+            )
+        self.assertEqual(replayed.arguments, found.arguments)
+        self.assertEqual(replayed.cases, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
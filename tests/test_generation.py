@@ -1,7 +1,15 @@
+import threading
 import unittest
+from unittest import mock
 
+from collections.abc import Sequence
+
+from gentasks.constants import PARALLEL_BUILD_MIN_TASKS
+from gentasks import task_generator
 from gentasks.task_generator import PrecheckExerciseGenerator
 from gentasks.exercise import Exercise
+from gentasks.tasktypes import TASKS, GeneratorDefaultTask, GeneratorTaskMeta
+from gentasks.tasktypes import Range, NegativeRange, Iterator, Fibonacci
 
 
 class TestGeneration(unittest.TestCase):
@@ -24,5 +32,243 @@ class TestGeneration(unittest.TestCase):
             for exercise in self._class.get_tasks_amount(i):
                 self.assertEqual(len(exercise.tasks()), i)
 
+    def test_sequence(self) -> None:
+        exercises = self._class.get_tasks_under_complexity(10, False)
+        self.assertIsInstance(exercises, Sequence)
+        expected = [
+            combination for combination in self._class._combinations
+            if sum(task.complexity for task in combination) <= 10
+        ]
+        self.assertEqual(len(exercises), len(expected))
+        self.assertEqual(exercises.combinations(), expected)
+        self.assertEqual(list(exercises), list(exercises))
+        self.assertEqual(exercises[-1].tasks(), expected[-1])
+        self.assertEqual(
+            [exercise.tasks() for exercise in exercises[2:6]], expected[2:6]
+        )
+        self.assertEqual(len(exercises[::2]), len(expected[::2]))
+        with self.assertRaises(IndexError):
+            exercises[len(expected)]
+
+    def test_sequence_range(self) -> None:
+        exercises = self._class.get_tasks_in_complexity_range(5, 12, False)
+        self.assertEqual(exercises.combinations(), [
+            combination for combination in self._class._combinations
+            if 5 <= sum(task.complexity for task in combination) < 12
+        ])
+        self.assertEqual(
+            len(self._class.get_tasks_in_complexity_range(6, 6)), 0
+        )
+
+    def test_sequence_amount(self) -> None:
+        for amount in range(0, 6):
+            exercises = self._class.get_tasks_amount(amount, False)
+            self.assertEqual(exercises.combinations(), [
+                combination for combination in self._class._combinations
+                if len(combination) == amount
+            ])
+
+
+class TestRegistryInstances(unittest.TestCase):
+    subset = (Range, NegativeRange, Iterator)
+
+    def tearDown(self) -> None:
+        PrecheckExerciseGenerator._instances.pop(self.subset, None)
+
+    def test_global_instance(self) -> None:
+        self.assertIs(PrecheckExerciseGenerator(), PrecheckExerciseGenerator())
+        self.assertEqual(PrecheckExerciseGenerator().tasks(), tuple(TASKS))
+
+    def test_subset(self) -> None:
+        generator = PrecheckExerciseGenerator(self.subset)
+        self.assertIsNot(generator, PrecheckExerciseGenerator())
+        self.assertIs(generator, PrecheckExerciseGenerator(list(self.subset)))
+        self.assertEqual(generator.tasks(), self.subset)
+        exercises = list(generator.get_tasks_under_complexity(1000, False))
+        self.assertEqual(len(exercises), 7)
+        for exercise in exercises:
+            self.assertTrue(set(exercise.tasks()) <= set(self.subset))
+        self.assertEqual(
+            generator.get_tasks_amount(3, False).combinations(),
+            [self.subset]
+        )
+
+    def test_created_once(self) -> None:
+        generators = []
+        threads = [
+            threading.Thread(target=lambda: generators.append(
+                PrecheckExerciseGenerator(self.subset)
+            ))
+            for _ in range(16)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(i) for i in generators}), 1)
+
+    def test_single_task(self) -> None:
+        generator = PrecheckExerciseGenerator((Range,))
+        try:
+            self.assertEqual(
+                [i.tasks() for i in generator.get_tasks_under_complexity(
+                    1000
+                )],
+                [(Range,)]
+            )
+            self.assertEqual(len(generator.get_tasks_amount(1)), 1)
+        finally:
+            PrecheckExerciseGenerator._instances.pop((Range,))
+
+
+class TestStats(unittest.TestCase):
+    subset = (Range, NegativeRange, Iterator)
+
+    def tearDown(self) -> None:
+        PrecheckExerciseGenerator._instances.pop(self.subset, None)
+
+    def test_stats(self) -> None:
+        generator = PrecheckExerciseGenerator(self.subset)
+        stats = generator.stats()
+        self.assertEqual(stats.tasks, 3)
+        self.assertEqual(stats.entries, 7)
+        self.assertEqual(stats.indexes, {'complexity': 7})
+        self.assertGreater(stats.bytes, 0)
+        self.assertGreaterEqual(stats.build_seconds, 0)
+        self.assertIsNone(stats.hit_rate('amounts'))
+
+    def test_indexes(self) -> None:
+        generator = PrecheckExerciseGenerator(self.subset)
+        table_bytes = generator.stats().bytes
+        generator.get_tasks_amount(1)
+        generator.get_tasks_amount(2)
+        stats = generator.stats()
+        self.assertEqual(stats.indexes['amounts'], 7)
+        self.assertGreater(stats.bytes, table_bytes)
+        self.assertEqual(stats.cache_hits['amounts'], 1)
+        self.assertEqual(stats.cache_misses['amounts'], 1)
+        self.assertEqual(stats.hit_rate('amounts'), 0.5)
+
+
+class TestParallelBuild(unittest.TestCase):
+    # Repeated complexities check, that merge keeps serial order of ties
+    tasks = tuple(
+        GeneratorTaskMeta(
+            f'Synthetic{i}', (GeneratorDefaultTask,),
+            {'__slots__': (), 'complexity': i % 5 + 1}, register=False
+        )
+        for i in range(PARALLEL_BUILD_MIN_TASKS)
+    )
+
+    def tearDown(self) -> None:
+        PrecheckExerciseGenerator.build_workers = 1
+        PrecheckExerciseGenerator._instances.pop(self.tasks, None)
+
+    def test_same_table(self) -> None:
+        serial = PrecheckExerciseGenerator(self.tasks)
+        PrecheckExerciseGenerator._instances.pop(self.tasks)
+        PrecheckExerciseGenerator.build_workers = 2
+        parallel = PrecheckExerciseGenerator(self.tasks)
+        self.assertIsNot(serial, parallel)
+        self.assertEqual(parallel._combinations, serial._combinations)
+        self.assertEqual(parallel._complexity, serial._complexity)
+        self.assertEqual(
+            len(parallel._combinations), 2 ** len(self.tasks) - 1
+        )
+
+    def test_uneven_shards(self) -> None:
+        serial = PrecheckExerciseGenerator(self.tasks)
+        PrecheckExerciseGenerator._instances.pop(self.tasks)
+        PrecheckExerciseGenerator.build_workers = 7
+        parallel = PrecheckExerciseGenerator(self.tasks)
+        self.assertEqual(parallel._combinations, serial._combinations)
+        self.assertEqual(parallel._complexity, serial._complexity)
+
+    def test_single_row_shards(self) -> None:
+        tasks = self.tasks[:4]
+        serial = PrecheckExerciseGenerator(tasks)
+        PrecheckExerciseGenerator._instances.pop(tasks)
+        complexity = tuple(task.complexity for task in tasks)
+        runs = [
+            task_generator._build_shard(complexity, i, i + 1)
+            for i in range(2 ** len(tasks) - 1)
+        ]
+        values, masks = task_generator._merge_runs(runs)
+        self.assertEqual(
+            task_generator._rows(tasks, masks), serial._combinations
+        )
+        self.assertEqual(tuple(values.tolist()), serial._complexity)
+
+    def test_without_numpy(self) -> None:
+        PrecheckExerciseGenerator.build_workers = 2
+        with mock.patch('gentasks.batch.np', None), mock.patch(
+                'gentasks.task_generator.ProcessPoolExecutor'
+        ) as executor:
+            generator = PrecheckExerciseGenerator(self.tasks)
+        executor.assert_not_called()
+        self.assertEqual(
+            len(generator._combinations), 2 ** len(self.tasks) - 1
+        )
+
+
+class TestTaskRegistered(unittest.TestCase):
+    @staticmethod
+    def table(generator: PrecheckExerciseGenerator) -> list:
+        return sorted(
+            (complexity, [task.__qualname__ for task in combination])
+            for combination, complexity in zip(
+                generator._combinations, generator._complexity
+            )
+        )
+
+    def test_global_without_full_set(self) -> None:
+        generator = PrecheckExerciseGenerator()
+        self.assertEqual(
+            len(generator._combinations), 2 ** len(generator.tasks()) - 2
+        )
+        self.assertEqual(
+            len(generator.get_tasks_amount(len(generator.tasks()))), 0
+        )
+
+        # Table without full set gets old full set on registration
+        generator = PrecheckExerciseGenerator((Range,))
+        try:
+            generator._full_set = False
+            generator._build()
+            generator.task_registered(NegativeRange)
+            self.assertEqual(
+                [i for _, i in self.table(generator)],
+                [['Range'], ['NegativeRange']]
+            )
+        finally:
+            PrecheckExerciseGenerator._instances.pop((Range,))
+
+    def test_global_subscribed(self) -> None:
+        self.assertIn(
+            PrecheckExerciseGenerator(), GeneratorTaskMeta._listeners
+        )
+
+    def test_merge(self) -> None:
+        tasks = [Range, NegativeRange]
+        generator = PrecheckExerciseGenerator(tasks)
+        try:
+            for task in (Iterator, Fibonacci):
+                generator.task_registered(task)
+                tasks.append(task)
+                rebuilt = PrecheckExerciseGenerator(tasks)
+                self.assertEqual(generator.tasks(), tuple(tasks))
+                self.assertEqual(self.table(generator), self.table(rebuilt))
+                self.assertEqual(
+                    list(generator._complexity),
+                    sorted(generator._complexity)
+                )
+            generator.task_registered(Fibonacci)
+            self.assertEqual(self.table(generator), self.table(rebuilt))
+        finally:
+            for key in ((Range, NegativeRange), (Range, NegativeRange,
+                        Iterator), tuple(tasks)):
+                PrecheckExerciseGenerator._instances.pop(key, None)
+
+
 if __name__ == '__main__':
     unittest.main()
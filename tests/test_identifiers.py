@@ -0,0 +1,53 @@
+import unittest
+from itertools import permutations
+
+import gentasks.tasktypes as tasktypes
+from gentasks import identifiers
+from gentasks.exercise import Exercise, FrozenExercise
+
+
+class TestIdentifiers(unittest.TestCase):
+    tasks = (tasktypes.Iterator, tasktypes.Range, tasktypes.Fibonacci)
+
+    def test_round_trip(self) -> None:
+        for tasks in permutations(self.tasks):
+            identifier = identifiers.encode(Exercise(tasks))
+            self.assertIs(
+                identifiers.decode(identifier), FrozenExercise(tasks)
+            )
+
+    def test_unique(self) -> None:
+        values = {
+            identifiers.encode(Exercise(tasks))
+            for tasks in permutations(self.tasks)
+        }
+        self.assertEqual(len(values), 6)
+
+    def test_many(self) -> None:
+        exercises = [FrozenExercise(i) for i in permutations(self.tasks, 2)]
+        encoded = identifiers.encode_many(exercises)
+        self.assertEqual(identifiers.decode_many(encoded), exercises)
+
+    def test_string(self) -> None:
+        identifier = identifiers.encode(Exercise(self.tasks))
+        string = identifiers.to_string(identifier)
+        self.assertEqual(identifiers.from_string(string), identifier)
+
+    def test_other_registry(self) -> None:
+        codec = identifiers.ExerciseCodec(self.tasks)
+        identifier = codec.encode(Exercise(self.tasks))
+        self.assertEqual(codec.decode(identifier), FrozenExercise(self.tasks))
+        self.assertRaises(ValueError, lambda: identifiers.decode(identifier))
+
+    def test_repeated_tasks(self) -> None:
+        exercise = Exercise(
+            (tasktypes.Range, tasktypes.Range, tasktypes.Fibonacci)
+        )
+        self.assertRaises(ValueError, lambda: identifiers.encode(exercise))
+        self.assertRaises(
+            ValueError, lambda: identifiers.encode_many([exercise])
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
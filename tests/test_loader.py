@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import gentasks.tasktypes as tasktypes
+from gentasks.exercise import FrozenExercise
+from gentasks.loader import SubmissionLoader
+
+SOURCE = """
+def main(range_arguments):
+    yield from range(*range_arguments)
+"""
+
+
+class TestSubmissionLoader(unittest.TestCase):
+    def test_load(self) -> None:
+        function = SubmissionLoader().load(SOURCE)
+        FrozenExercise((tasktypes.Range,)).check_generator(function)
+
+    def test_memory_cache(self) -> None:
+        loader = SubmissionLoader()
+        self.assertIs(loader.code(SOURCE), loader.code(SOURCE))
+        self.assertEqual((loader.hits, loader.misses), (1, 1))
+
+    def test_errors(self) -> None:
+        loader = SubmissionLoader()
+        self.assertRaises(SyntaxError, lambda: loader.load('def main('))
+        self.assertRaises(ValueError, lambda: loader.load('main = 1'))
+
+    def test_disk_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            SubmissionLoader(directory).load(SOURCE)
+            loader = SubmissionLoader(directory)
+            loader.load(SOURCE)
+            self.assertEqual((loader.hits, loader.misses), (1, 0))
+
+    def test_disk_bounded(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            loader = SubmissionLoader(directory, max_files=2)
+            for i in range(4):
+                loader.code(f"value = {i}")
+            self.assertLessEqual(len(os.listdir(directory)), 2)
+
+    def test_disk_scanned_on_trim(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            loader = SubmissionLoader(directory, max_files=8)
+            with mock.patch('os.scandir', wraps=os.scandir) as scandir:
+                for i in range(8):
+                    loader.code(f"value = {i}")
+                scandir.assert_not_called()
+                loader.code("value = 8")
+                scandir.assert_called_once()
+            self.assertEqual(len(os.listdir(directory)), 6)
+
+            # Count of existing files is restored on start
+            loader = SubmissionLoader(directory, max_files=7)
+            loader.code("value = 9")
+            self.assertEqual(len(os.listdir(directory)), 7)
+            loader.code("value = 10")
+            self.assertEqual(len(os.listdir(directory)), 6)
+
+    def test_disk_unwritable(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            loader = SubmissionLoader(directory)
+            with mock.patch(
+                    'gentasks.loader.marshal.dump',
+                    side_effect=OSError(28, 'No space left on device')
+            ):
+                function = loader.load(SOURCE)
+            FrozenExercise((tasktypes.Range,)).check_generator(function)
+            self.assertEqual(os.listdir(directory), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
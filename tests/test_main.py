@@ -0,0 +1,152 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import gentasks.tasktypes as tasktypes
+from gentasks import grading, identifiers
+from gentasks.__main__ import main
+from gentasks.exercise import FrozenExercise
+from gentasks.grading import completed, grade, read_submissions
+
+PASSING = """
+def main(range_arguments):
+    yield from range(*range_arguments)
+"""
+FAILING = """
+def main(range_arguments):
+    yield 'wrong'
+"""
+EXITING = """
+def main(range_arguments):
+    raise SystemExit(3)
+    yield
+"""
+EXERCISE = identifiers.to_string(
+    identifiers.encode(FrozenExercise((tasktypes.Range,)))
+)
+
+
+grade_submission = grading.grade_submission
+
+
+def crash_on_exit(record, *args):
+    """Kills worker process instead of grading exiting submission"""
+    if 'SystemExit' in record['source']:
+        os._exit(1)
+    return grade_submission(record, *args)
+
+
+class TestGrading(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.input = os.path.join(self.directory, 'submissions.jsonl')
+        self.output = os.path.join(self.directory, 'verdicts.jsonl')
+        with open(self.input, 'w', encoding='utf-8') as file:
+            for index in range(6):
+                file.write(json.dumps({
+                    'id': index, 'exercise': EXERCISE,
+                    'source': PASSING if index % 2 else FAILING
+                }) + '\n')
+
+    def results(self):
+        with open(self.output, encoding='utf-8') as file:
+            return {i['id']: i for i in map(json.loads, file)}
+
+    def test_grade(self) -> None:
+        counts = grade(read_submissions(self.input), self.output, jobs=0)
+        self.assertEqual(
+            counts, {'graded': 6, 'passed': 3, 'skipped': 0}
+        )
+        results = self.results()
+        self.assertEqual(set(results), {str(i) for i in range(6)})
+        self.assertTrue(results['1']['passed'])
+        self.assertFalse(results['0']['passed'])
+        self.assertIsNotNone(results['0']['error'])
+
+    def test_processes(self) -> None:
+        counts = grade(read_submissions(self.input), self.output, jobs=2)
+        self.assertEqual(counts['graded'], 6)
+        self.assertEqual(len(self.results()), 6)
+
+    def test_resume(self) -> None:
+        grade(read_submissions(self.input), self.output, jobs=0)
+        with open(self.output, encoding='utf-8') as file:
+            lines = file.readlines()
+        with open(self.output, 'w', encoding='utf-8') as file:
+            file.writelines(lines[:2])
+            file.write(lines[2][:5])
+        self.assertEqual(completed(self.output), {'0', '1'})
+        counts = grade(read_submissions(self.input), self.output, jobs=0)
+        self.assertEqual(counts['skipped'], 2)
+        self.assertEqual(counts['graded'], 4)
+        self.assertEqual(len(self.results()), 6)
+
+    def test_directory(self) -> None:
+        source = os.path.join(self.directory, 'sources')
+        os.mkdir(source)
+        with open(os.path.join(source, 'alice.py'), 'w') as file:
+            file.write(PASSING)
+        with open(os.path.join(source, 'notes.txt'), 'w') as file:
+            file.write('')
+        records = list(read_submissions(source, EXERCISE))
+        self.assertEqual([i['id'] for i in records], ['alice'])
+        self.assertEqual(records[0]['exercise'], EXERCISE)
+
+    def test_missing_exercise(self) -> None:
+        with open(self.input, 'w', encoding='utf-8') as file:
+            file.write(json.dumps({'id': 'x', 'source': PASSING}) + '\n')
+        grade(read_submissions(self.input), self.output, jobs=0)
+        self.assertEqual(self.results()['x']['error'], 'ValueError')
+
+    def write_exiting(self) -> None:
+        with open(self.input, 'a', encoding='utf-8') as file:
+            file.write(json.dumps({
+                'id': 'exit', 'exercise': EXERCISE, 'source': EXITING
+            }) + '\n')
+            file.write(json.dumps({
+                'id': 'after', 'exercise': EXERCISE, 'source': PASSING
+            }) + '\n')
+
+    def test_system_exit(self) -> None:
+        self.write_exiting()
+        for jobs in (0, 2):
+            with self.subTest(jobs=jobs):
+                if os.path.exists(self.output):
+                    os.remove(self.output)
+                counts = grade(
+                    read_submissions(self.input), self.output, jobs=jobs
+                )
+                self.assertEqual(counts['graded'], 8)
+                results = self.results()
+                self.assertEqual(results['exit']['error'], 'SystemExit')
+                self.assertTrue(results['after']['passed'])
+
+    def test_worker_crash(self) -> None:
+        self.write_exiting()
+        with mock.patch.object(
+                grading, 'grade_submission', crash_on_exit
+        ):
+            counts = grade(read_submissions(self.input), self.output, jobs=2)
+        self.assertEqual(counts['graded'], 8)
+        results = self.results()
+        self.assertEqual(results['exit']['error'], 'BrokenProcessPool')
+        self.assertEqual(
+            sorted(i for i in results if not results[i]['passed']),
+            ['0', '2', '4', 'exit']
+        )
+
+    def test_main(self) -> None:
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            code = main([
+                'grade', self.input, '-o', self.output, '-j', '0',
+                '-c', 'quick'
+            ])
+        self.assertEqual(code, 0)
+        self.assertIn('passed 3', stderr.getvalue())
+        self.assertEqual(len(self.results()), 6)
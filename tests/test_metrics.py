@@ -0,0 +1,145 @@
+import os
+import tempfile
+import unittest
+from urllib.request import urlopen
+
+from gentasks import metrics
+from gentasks.async_exercise import AsyncExercise, grade_many
+from gentasks.async_tasktypes import AsyncRange
+from gentasks.exceptions import GeneratorWrongValue
+from gentasks.exercise import FrozenExercise
+from gentasks.task_generator import PrecheckExerciseGenerator
+from gentasks.tasktypes import Range, NegativeRange
+from gentasks.verdict_cache import VerdictCache
+
+
+class TestMetrics(unittest.TestCase):
+    def test_render(self) -> None:
+        registry = metrics.Registry()
+        counter = metrics.Counter(
+            'test_events', 'Events', ('kind',), registry
+        )
+        histogram = metrics.Histogram(
+            'test_seconds', 'Durations', (), registry, buckets=(0.1, 1)
+        )
+        counter.inc(kind='a"b')
+        counter.inc(2, kind='a"b')
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value)
+        self.assertEqual(registry.render(), '\n'.join((
+            '# HELP test_events Events',
+            '# TYPE test_events counter',
+            'test_events_total{kind="a\\"b"} 3',
+            '# HELP test_seconds Durations',
+            '# TYPE test_seconds histogram',
+            'test_seconds_bucket{le="0.1"} 2',
+            'test_seconds_bucket{le="1"} 3',
+            'test_seconds_bucket{le="+Inf"} 4',
+            'test_seconds_sum 3.65',
+            'test_seconds_count 4',
+        )) + '\n')
+        with self.assertRaises(ValueError):
+            counter.inc(other='a')
+        with self.assertRaises(ValueError):
+            metrics.Counter('test_events', 'Events', (), registry)
+
+    def test_checks(self) -> None:
+        exercise = FrozenExercise((Range, NegativeRange))
+        passed = metrics.CHECKS.value(verdict='passed')
+        failed = metrics.CHECKS.value(verdict='TypeError')
+        observed = metrics.CHECK_SECONDS.count(mode='sync', tasks='2')
+        tasks = metrics.TASK_CHECK_SECONDS.count(task='Range')
+
+        exercise.check_generator(exercise.generator)
+        with self.assertRaises(TypeError):
+            exercise.check_generator(lambda *args: [])
+
+        self.assertEqual(metrics.CHECKS.value(verdict='passed'), passed + 1)
+        self.assertEqual(
+            metrics.CHECKS.value(verdict='TypeError'), failed + 1
+        )
+        self.assertEqual(
+            metrics.CHECK_SECONDS.count(mode='sync', tasks='2'), observed + 2
+        )
+        self.assertGreater(
+            metrics.TASK_CHECK_SECONDS.count(task='Range'), tasks
+        )
+
+    def test_verdict_label(self) -> None:
+        class TypeError(Exception):
+            pass
+
+        self.assertEqual(metrics.verdict_label(None), 'passed')
+        self.assertEqual(metrics.verdict_label(ValueError()), 'ValueError')
+        self.assertEqual(
+            metrics.verdict_label(GeneratorWrongValue('', 1, 2, 1)),
+            'GeneratorWrongValue'
+        )
+        self.assertEqual(metrics.verdict_label(TypeError()), 'other')
+        self.assertEqual(metrics.verdict_label(SystemExit(3)), 'other')
+
+    def test_other_checks(self) -> None:
+        cached = metrics.CHECK_SECONDS.count(mode='cached', tasks='1')
+        cache = VerdictCache()
+        exercise = FrozenExercise((Range,))
+        cache.check(exercise, exercise.generator)
+        cache.check(exercise, exercise.generator)
+        self.assertEqual(
+            metrics.CHECK_SECONDS.count(mode='cached', tasks='1'), cached + 1
+        )
+
+        checked = metrics.CHECK_SECONDS.count(mode='async', tasks='1')
+        asynchronous = AsyncExercise((AsyncRange,))
+        verdict, = grade_many([(asynchronous, asynchronous.generator)])
+        self.assertTrue(verdict.passed)
+        self.assertEqual(
+            metrics.CHECK_SECONDS.count(mode='async', tasks='1'), checked + 1
+        )
+
+    def test_report(self) -> None:
+        exercise = FrozenExercise((Range, NegativeRange))
+        observed = metrics.CHECK_SECONDS.count(mode='report', tasks='2')
+        failed = metrics.CHECKS.value(verdict='GeneratorWrongType')
+        tasks = metrics.TASK_CHECK_SECONDS.count(task='NegativeRange')
+
+        def wrong(range_arguments, negative_arguments):
+            yield from range(*range_arguments)
+            yield 'wrong'
+
+        self.assertFalse(exercise.check_report(wrong).passed)
+        self.assertEqual(
+            metrics.CHECK_SECONDS.count(mode='report', tasks='2'),
+            observed + 1
+        )
+        self.assertEqual(
+            metrics.CHECKS.value(verdict='GeneratorWrongType'), failed + 1
+        )
+        self.assertGreater(
+            metrics.TASK_CHECK_SECONDS.count(task='NegativeRange'), tasks
+        )
+
+    def test_queries(self) -> None:
+        before = metrics.QUERIES.value(query='amount')
+        PrecheckExerciseGenerator().get_tasks_amount(2)
+        self.assertEqual(metrics.QUERIES.value(query='amount'), before + 1)
+
+    def test_export(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'gentasks.prom')
+            metrics.REGISTRY.write(path)
+            with open(path, encoding='utf-8') as file:
+                self.assertIn('# TYPE gentasks_checks counter', file.read())
+
+        server = metrics.REGISTRY.serve()
+        try:
+            port = server.server_address[1]
+            with urlopen(f'http://127.0.0.1:{port}/metrics') as response:
+                body = response.read().decode()
+            self.assertIn('# TYPE gentasks_check_seconds histogram', body)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == '__main__':
+    unittest.main()
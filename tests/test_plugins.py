@@ -0,0 +1,136 @@
+import os
+import sys
+import tempfile
+import unittest
+from importlib.metadata import EntryPoint
+
+import gentasks.tasktypes as tasktypes
+from gentasks import identifiers, plugins
+from gentasks.constants import NOTES, PLUGINS_ENTRY_POINT
+from gentasks.exercise import Exercise, FrozenExercise
+from gentasks.plugins import LazyTask, lazy_task, load_plugins
+from gentasks.tasktypes import TASKS
+
+METADATA = """
+REVERSED_RANGE = {
+    'complexity': 1001,
+    'notes': {'.send()'},
+    'description': 'Числа от end-1 до start',
+    'implementation': 'gentasks_test_impl:ReversedRange',
+}
+BROKEN = {'complexity': 1002}
+UNKNOWN_NOTE = {
+    'complexity': 1003,
+    'notes': {'range'},
+    'implementation': 'gentasks_test_impl:ReversedRange',
+}
+"""
+
+IMPLEMENTATION = """
+from gentasks.tasktypes import Range
+
+
+class ReversedRange(Range, register=False):
+    __slots__ = ()
+
+    def generator(self):
+        yield from reversed(range(self.start, self.end))
+"""
+
+
+def main(range_arguments):
+    yield from reversed(range(*range_arguments))
+
+
+class TestPlugins(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = tempfile.TemporaryDirectory()
+        for name, source in (
+                ('gentasks_test_meta', METADATA),
+                ('gentasks_test_impl', IMPLEMENTATION)
+        ):
+            path = os.path.join(cls.directory.name, name + '.py')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(source)
+        sys.path.insert(0, cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        sys.path.remove(cls.directory.name)
+        sys.modules.pop('gentasks_test_meta', None)
+        sys.modules.pop('gentasks_test_impl', None)
+        cls.directory.cleanup()
+
+    @staticmethod
+    def point(name: str, attribute: str) -> EntryPoint:
+        return EntryPoint(
+            name, f'gentasks_test_meta:{attribute}', PLUGINS_ENTRY_POINT
+        )
+
+    def test_lazy(self) -> None:
+        task, = load_plugins(
+            [self.point('ReversedRange', 'REVERSED_RANGE')], register=False
+        )
+        self.assertTrue(issubclass(task, LazyTask))
+        self.assertNotIn(task, TASKS)
+        self.assertEqual(task.__qualname__, 'ReversedRange')
+        self.assertEqual(task.complexity, 1001)
+        self.assertEqual(task.notes, {'.send()'})
+        self.assertEqual(task.description(), 'Числа от end-1 до start')
+        self.assertFalse(task.loaded())
+        self.assertNotIn('gentasks_test_impl', sys.modules)
+
+        exercise = Exercise([task])
+        exercise.check_generator(main)
+        self.assertTrue(task.loaded())
+        self.assertEqual(type(task(0, 3)).__qualname__, 'ReversedRange')
+        self.assertEqual(list(task(0, 3).generator()), [2, 1, 0])
+
+    def test_broken(self) -> None:
+        with self.assertWarns(RuntimeWarning):
+            tasks = load_plugins(
+                [self.point('Broken', 'BROKEN')], register=False
+            )
+        self.assertEqual(tasks, [])
+
+    def test_unknown_note(self) -> None:
+        with self.assertWarns(RuntimeWarning):
+            tasks = load_plugins(
+                [self.point('UnknownNote', 'UNKNOWN_NOTE')], register=False
+            )
+        self.assertEqual(tasks, [])
+
+    def test_registered(self) -> None:
+        exercise = FrozenExercise((tasktypes.Range, tasktypes.Iterator))
+        identifier = identifiers.encode(exercise)
+        # Implementation is importable, task stays registered safely
+        task = lazy_task({
+            'name': 'PluginRange',
+            'complexity': 1004,
+            'notes': {'.send()'},
+            'implementation': 'gentasks.tasktypes:Range',
+        })
+        self.assertIn(task, TASKS)
+        self.assertIs(plugins.PluginRange, task)
+        self.assertIn(NOTES['.send()'], Exercise([task]).description())
+        self.assertRaises(ValueError, lambda: lazy_task({
+            'name': 'PluginRange', 'complexity': 1005,
+            'implementation': 'gentasks.tasktypes:Range',
+        }))
+
+        # Plugins don't change identifiers of default codec
+        self.assertEqual(identifiers.encode(exercise), identifier)
+        self.assertIs(identifiers.decode(identifier), exercise)
+        self.assertRaises(
+            ValueError, lambda: identifiers.encode(Exercise([task]))
+        )
+        codec = identifiers.ExerciseCodec(TASKS)
+        self.assertIs(
+            codec.decode(codec.encode(Exercise([task]))),
+            FrozenExercise([task])
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
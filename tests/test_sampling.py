@@ -0,0 +1,52 @@
+import unittest
+from random import Random
+
+from gentasks.task_generator import PrecheckExerciseGenerator
+from gentasks.sampling import WeightedSampler, inverse_complexity
+
+
+class TestWeightedSampler(unittest.TestCase):
+    exercises = PrecheckExerciseGenerator().get_tasks_under_complexity(
+        1000, False
+    )
+
+    def expected(self, sampler: WeightedSampler) -> list:
+        total = sum(sampler.weights)
+        return [weight / total for weight in sampler.weights]
+
+    def test_alias_table(self) -> None:
+        sampler = WeightedSampler(self.exercises)
+        length = len(sampler)
+        probabilities = [value / length for value in sampler._probability]
+        for column, alias in enumerate(sampler._alias):
+            probabilities[alias] += (1 - sampler._probability[column]) / length
+        for actual, expected in zip(probabilities, self.expected(sampler)):
+            self.assertAlmostEqual(actual, expected)
+
+    def test_distribution(self) -> None:
+        sampler = WeightedSampler(self.exercises[:4])
+        random = Random(1)
+        counts = [0] * len(sampler)
+        draws = 100_000
+        for _ in range(draws):
+            counts[sampler.index(random)] += 1
+        for count, expected in zip(counts, self.expected(sampler)):
+            self.assertAlmostEqual(count / draws, expected, delta=0.01)
+
+    def test_weight_function(self) -> None:
+        sampler = WeightedSampler(
+            self.exercises, lambda complexity, amount: amount == 2
+        )
+        for exercise in sampler.sample_many(100):
+            self.assertEqual(len(exercise.tasks()), 2)
+        self.assertEqual(inverse_complexity(4, 1), 0.25)
+
+    def test_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            WeightedSampler(self.exercises, lambda complexity, amount: 0)
+        with self.assertRaises(ValueError):
+            WeightedSampler(self.exercises, lambda complexity, amount: -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import threading
+import unittest
+
+from gentasks.exercise import FrozenExercise
+from gentasks.failure_statistics import FailureStatistics
+from gentasks.scheduler import Scheduler, expected_cost
+from gentasks.tasktypes import Range, NegativeRange, Iterator, Fibonacci
+
+
+class TestScheduler(unittest.TestCase):
+    small = FrozenExercise((Range,))
+    big = FrozenExercise((Range, NegativeRange, Iterator, Fibonacci))
+
+    def blocked(self, scheduler: Scheduler, student: str = 'blocker'):
+        """Occupies worker, until returned event is set"""
+        event = threading.Event()
+        started = threading.Event()
+
+        def submission(*args):
+            started.set()
+            event.wait()
+            return self.small.generator(*args)
+
+        future = scheduler.submit(student, self.small, submission)
+        started.wait()
+        return event, future
+
+    def test_expected_cost(self) -> None:
+        self.assertLess(expected_cost(self.small), expected_cost(self.big))
+        statistics = FailureStatistics()
+        for case in range(10):
+            statistics.record('Range', case, False, 10.0)
+        self.assertGreater(
+            expected_cost(self.small, statistics), expected_cost(self.big)
+        )
+
+    def test_shortest_first(self) -> None:
+        order = []
+        with Scheduler(1, aging=0) as scheduler:
+            event, _ = self.blocked(scheduler)
+            futures = [
+                scheduler.submit(i, exercise, exercise.generator)
+                for i, exercise in enumerate((self.big, self.small))
+            ]
+            for future, name in zip(futures, ('big', 'small')):
+                future.add_done_callback(lambda _, name=name: order.append(name))
+            self.assertEqual(scheduler.queued(), 2)
+            event.set()
+        self.assertEqual(order, ['small', 'big'])
+        for future in futures:
+            self.assertTrue(future.result().passed)
+
+    def test_aging(self) -> None:
+        order = []
+        with Scheduler(1, aging=1e9) as scheduler:
+            event, _ = self.blocked(scheduler)
+            for name, exercise in (('big', self.big), ('small', self.small)):
+                scheduler.submit(name, exercise, exercise.generator)\
+                    .add_done_callback(lambda _, n=name: order.append(n))
+            event.set()
+        self.assertEqual(order, ['big', 'small'])
+
+    def test_per_student(self) -> None:
+        with Scheduler(2) as scheduler:
+            event, first = self.blocked(scheduler, 'student')
+            second = scheduler.submit(
+                'student', self.small, self.small.generator
+            )
+            other = scheduler.submit('other', self.big, self.big.generator)
+            self.assertTrue(other.result(5).passed)
+            self.assertFalse(second.done())
+            event.set()
+            self.assertTrue(second.result(5).passed)
+            self.assertTrue(first.result(5).passed)
+
+    def test_failed(self) -> None:
+        with Scheduler(2) as scheduler:
+            verdict = scheduler.submit(
+                'student', self.small, lambda *args: iter(())
+            ).result()
+        self.assertFalse(verdict.passed)
+        with self.assertRaises(RuntimeError):
+            scheduler.submit('student', self.small, self.small.generator)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -289,6 +289,23 @@ class TestIterator(TestCase):
         cl = self.cl(gen_example())
         self.assertEqual(5, cl.check_generator(gen_example()))
 
+    def test_check_one_shot(self) -> None:
+        values = (i for i in range(10))
+        cl = self.cl(tasktypes.Stream(range, 10))
+        self.assertEqual(10, cl.check_generator(values))
+
+    def test_check_early_shutdown(self) -> None:
+        cl = self.cl([1, 2, 3])
+        self.assertRaises(GeneratorUnexpectedShutdown, lambda: cl.check_generator((i for i in [1, 2])))
+        self.assertRaises(GeneratorUnexpectedShutdown, lambda: cl.check_generator((i for i in [])))
+
+    def test_stress_cases(self) -> None:
+        for cl in self.cl.stress_cases_generator(1000):
+            def generator(iterable):
+                yield from iterable
+            self.assertEqual(1000, cl.check_generator(generator(cl.iterable)))
+            self.assertEqual(1000, cl.check_generator(generator(cl.iterable)))
+
 
 class TestFibonacci(TestCase):
     cl = tasktypes.Fibonacci
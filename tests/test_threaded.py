@@ -0,0 +1,69 @@
+import threading
+import unittest
+
+import gentasks.tasktypes as tasktypes
+from gentasks.composition_classes import Singleton, local_random
+from gentasks.exercise import FrozenExercise
+from gentasks.threaded import ThreadedGrader
+from gentasks.verdict_cache import VerdictCache
+
+
+def wrong(range_arguments, *arguments):
+    yield 'wrong'
+
+
+class TestThreadedGrader(unittest.TestCase):
+    exercises = [
+        FrozenExercise(tasks) for tasks in (
+            (tasktypes.Range, tasktypes.AwaitKeyword),
+            (tasktypes.Fibonacci, tasktypes.Iterator),
+            (tasktypes.NegativeRange,),
+        )
+    ]
+
+    def test_check_many(self) -> None:
+        submissions = [
+            (exercise, exercise.generator) for exercise in self.exercises
+        ] * 20
+        submissions.append((self.exercises[0], wrong))
+        with ThreadedGrader(8) as grader:
+            verdicts = grader.check_many(submissions)
+        self.assertTrue(all(verdict.passed for verdict in verdicts[:-1]))
+        self.assertEqual(verdicts[-1].error, 'GeneratorWrongType')
+
+    def test_cache(self) -> None:
+        cache = VerdictCache()
+        with ThreadedGrader(4, cache) as grader:
+            grader.check_many([(self.exercises[2], wrong)] * 10)
+        self.assertEqual(cache.hits + cache.misses, 10)
+        self.assertEqual(len(cache), 1)
+
+    def test_singleton_created_once(self) -> None:
+        created = []
+
+        class Counted(Singleton):
+            __slots__ = ()
+
+            def new(self) -> None:
+                created.append(self)
+
+        threads = [threading.Thread(target=Counted) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(created), 1)
+
+    def test_local_random(self) -> None:
+        generators = []
+        thread = threading.Thread(
+            target=lambda: generators.append(local_random())
+        )
+        thread.start()
+        thread.join()
+        self.assertIs(local_random(), local_random())
+        self.assertIsNot(generators[0], local_random())
+
+
+if __name__ == '__main__':
+    unittest.main()
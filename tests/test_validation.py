@@ -0,0 +1,93 @@
+import pickle
+import unittest
+
+import gentasks.tasktypes as tasktypes
+from gentasks.exceptions import SubmissionRejected
+from gentasks.exercise import FrozenExercise
+from gentasks.loader import SubmissionLoader
+from gentasks.validation import prevalidate, prevalidate_source
+
+KEYWORD_SOURCE = """
+def main(keyword_arguments):
+    keyword = keyword_arguments[0]
+    while True:
+        string = yield
+        if string == keyword:
+            break
+    yield string
+"""
+
+IGNORING_SOURCE = """
+def main(keyword_arguments):
+    while True:
+        yield
+"""
+
+
+class TestValidation(unittest.TestCase):
+    keyword = FrozenExercise((tasktypes.AwaitKeyword,))
+    range = FrozenExercise((tasktypes.Range,))
+
+    def test_generator(self) -> None:
+        def main(range_arguments):
+            yield from range(*range_arguments)
+
+        prevalidate(main, self.range)
+        prevalidate(self.range.generator, self.range)
+        self.assertRaises(
+            SubmissionRejected,
+            lambda: prevalidate(lambda arguments: iter(()), self.range)
+        )
+
+    def test_send(self) -> None:
+        prevalidate_source(KEYWORD_SOURCE, self.keyword)
+        prevalidate_source(IGNORING_SOURCE, self.range)
+        self.assertRaises(
+            SubmissionRejected,
+            lambda: prevalidate_source(IGNORING_SOURCE, self.keyword)
+        )
+
+    def test_forbidden(self) -> None:
+        sources = (
+            "import os\ndef main(arguments):\n    yield",
+            "def main(arguments):\n    from os import path\n    yield",
+            "def main(arguments):\n    yield open('file')",
+            "def main(arguments):\n    yield (lambda: eval('1'))()",
+        )
+        for source in sources:
+            self.assertRaises(
+                SubmissionRejected,
+                lambda: prevalidate_source(source, self.range)
+            )
+
+    def test_source_errors(self) -> None:
+        self.assertRaises(
+            SubmissionRejected,
+            lambda: prevalidate_source("def main(", self.range)
+        )
+        self.assertRaises(
+            SubmissionRejected,
+            lambda: prevalidate_source("def other(): yield", self.range)
+        )
+
+    def test_loader(self) -> None:
+        loader = SubmissionLoader()
+        function = loader.load(KEYWORD_SOURCE, exercise=self.keyword)
+        self.keyword.check_generator(function)
+        self.assertRaises(
+            SubmissionRejected,
+            lambda: loader.load(IGNORING_SOURCE, exercise=self.keyword)
+        )
+
+    def test_pickle(self) -> None:
+        try:
+            prevalidate_source(IGNORING_SOURCE, self.keyword)
+        except SubmissionRejected as e:
+            error = e
+        copy = pickle.loads(pickle.dumps(error))
+        self.assertIs(type(copy), SubmissionRejected)
+        self.assertEqual(copy.args, error.args)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import gentasks.tasktypes as tasktypes
+from gentasks.coverage import Coverage
+from gentasks.exercise import FrozenExercise
+from gentasks.verdict_cache import VerdictCache, fingerprint
+
+
+def first(range_arguments: tuple):
+    yield from range(*range_arguments)
+
+
+def second(arguments):
+    yield from range(*arguments)
+
+
+def wrong(range_arguments: tuple):
+    start, end = range_arguments
+    yield from range(start, end + 1)
+
+
+class TestVerdictCache(unittest.TestCase):
+    exercise = FrozenExercise((tasktypes.Range,))
+
+    def test_fingerprint(self) -> None:
+        self.assertEqual(fingerprint(first), fingerprint(second))
+        self.assertNotEqual(fingerprint(first), fingerprint(wrong))
+
+    def test_fingerprint_class(self) -> None:
+        source = """
+class Helper:
+    def value(self, x):
+        return x
+
+def main(range_arguments):
+    for i in range(*range_arguments):
+        yield Helper().value(i)
+"""
+        functions = []
+        for code in (source, source, source.replace('return x', 'return -x')):
+            namespace = {'__name__': '__submission__'}
+            exec(code, namespace)
+            functions.append(namespace['main'])
+        self.assertEqual(fingerprint(functions[0]), fingerprint(functions[1]))
+        self.assertNotEqual(
+            fingerprint(functions[0]), fingerprint(functions[2])
+        )
+
+    def test_fingerprint_hash_seed(self) -> None:
+        script = (
+            "from gentasks.verdict_cache import fingerprint\n"
+            "def main(words):\n"
+            "    for word in words[0]:\n"
+            "        yield word in {'alpha', 'beta', 'gamma', 'delta'}\n"
+            "print(fingerprint(main))\n"
+        )
+        fingerprints = set()
+        for seed in ('1', '2', '3'):
+            environment = dict(os.environ, PYTHONHASHSEED=seed)
+            environment['PYTHONPATH'] = os.pathsep.join(sys.path)
+            fingerprints.add(subprocess.run(
+                [sys.executable, '-c', script], env=environment,
+                capture_output=True, text=True, check=True
+            ).stdout)
+        self.assertEqual(len(fingerprints), 1)
+
+    def test_fingerprint_containers(self) -> None:
+        values = [1, 2]
+
+        def first_value(range_arguments):
+            yield values[0]
+
+        fingerprints = {fingerprint(first_value)}
+        values[0] = 3
+        fingerprints.add(fingerprint(first_value))
+        self.assertEqual(len(fingerprints), 2)
+
+    def test_not_fingerprinted(self) -> None:
+        state = random.Random(0)
+
+        def randomized(range_arguments):
+            state.random()
+            yield from range(*range_arguments)
+
+        self.assertRaises(ValueError, lambda: fingerprint(randomized))
+        cache = VerdictCache()
+        self.assertTrue(cache.check(self.exercise, randomized).passed)
+        self.assertEqual(len(cache), 0)
+
+    def test_cached(self) -> None:
+        cache = VerdictCache()
+        self.assertTrue(cache.check(self.exercise, first).passed)
+        self.assertTrue(cache.check(self.exercise, second).passed)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        cache.check(self.exercise, first, Coverage.QUICK)
+        self.assertEqual(cache.misses, 2)
+
+    def test_failed(self) -> None:
+        cache = VerdictCache()
+
+        def not_generator(range_arguments):
+            return range_arguments
+
+        verdict = cache.check(self.exercise, not_generator)
+        self.assertFalse(verdict.passed)
+        self.assertEqual(verdict.error, 'TypeError')
+        self.assertRaises(TypeError, verdict.raise_error)
+
+    def test_eviction(self) -> None:
+        cache = VerdictCache(maxsize=1)
+        cache.check(self.exercise, first)
+        cache.check(self.exercise, wrong)
+        self.assertEqual(len(cache), 1)
+
+    def test_sqlite(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'verdicts.sqlite')
+            cache = VerdictCache(path=path)
+            cache.check(self.exercise, first)
+            cache.close()
+
+            cache = VerdictCache(path=path)
+            self.assertTrue(cache.check(self.exercise, second).passed)
+            self.assertEqual(cache.hits, 1)
+            cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()